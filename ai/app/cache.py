@@ -0,0 +1,286 @@
+"""
+Response Cache Module
+
+자주 반복되는 조회 응답(직렬화된 JSON bytes), 채팅별 최근 대화 히스토리,
+RAG 질의 임베딩/검색 결과를 프로세스 내에 캐싱합니다.
+"""
+
+import itertools
+import time
+from typing import Hashable, Optional
+from cachetools import LRUCache, TTLCache
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    사용자별 응답 캐시
+
+    캐시 키에 사용자별 세대(generation) 번호를 포함하여,
+    데이터 변경 시 세대만 올리면 해당 사용자의 기존 캐시가 모두 무효화됩니다.
+    (무효화된 항목은 TTL/LRU에 의해 자연스럽게 제거됨)
+
+    세대 번호는 전역 카운터에서 발급하므로, 세대 테이블(LRU)에서 밀려난 사용자도
+    새 번호를 받아 이전 캐시 항목과 다시 일치하지 않습니다.
+
+    조회 요청은 DB 조회 전에 generation()으로 세대를 받아 set()에 넘겨야 합니다.
+    그 사이에 무효화가 일어났다면 (조회 결과가 변경 전 데이터일 수 있으므로) 캐싱하지 않습니다.
+
+    프로세스 단위 캐시이므로 다른 워커 프로세스의 변경은 TTL 이후에 반영됩니다.
+    (여러 프로세스로 운영하면 오래된 응답이 보일 수 있어 RESPONSE_CACHE_TTL 기본값은 0(비활성화))
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.enabled = ttl > 0
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+        self._generations: LRUCache = LRUCache(maxsize=maxsize)
+        self._counter = itertools.count(1)
+
+    def generation(self, user_id: str) -> int:
+        """
+        사용자의 현재 캐시 세대 조회 (DB 조회 전에 호출)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            int: 세대 번호
+        """
+        generation = self._generations.get(user_id)
+        if generation is None:
+            generation = self._generations[user_id] = next(self._counter)
+        return generation
+
+    def get(self, user_id: str, key: Hashable) -> Optional[bytes]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            user_id: 사용자 ID
+            key: 응답 식별 키 (엔드포인트, 파라미터 등)
+
+        Returns:
+            Optional[bytes]: 캐시된 응답 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        return self._cache.get((user_id, self.generation(user_id), key))
+
+    def set(self, user_id: str, key: Hashable, value: bytes, generation: int) -> None:
+        """
+        응답 캐싱
+
+        Args:
+            user_id: 사용자 ID
+            key: 응답 식별 키
+            value: 직렬화된 응답
+            generation: 조회 시작 전에 generation()으로 받은 세대 번호
+        """
+        if not self.enabled:
+            return
+        # 조회 도중 무효화되었다면 변경 전 데이터일 수 있으므로 저장하지 않음
+        if generation != self.generation(user_id):
+            return
+        self._cache[(user_id, generation, key)] = value
+
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        사용자의 캐시 전체 무효화 (카테고리/채팅/메시지 변경 시 호출)
+
+        Args:
+            user_id: 사용자 ID
+        """
+        self._generations[user_id] = next(self._counter)
+
+
+class ConversationCache:
+    """
+    채팅별 최근 대화 히스토리 캐시 (롤링 윈도우)
+
+    메시지가 저장될 때마다 캐시된 히스토리 끝에 추가하고 window 크기로 자르므로,
+    같은 프로세스에서 이어지는 대화는 히스토리 조회 쿼리 없이 처리됩니다.
+
+    프로세스 단위 캐시이므로 다른 워커 프로세스에서 저장된 메시지는 TTL 이후에 반영됩니다.
+    append는 만료 시각을 연장하지 않으므로, 항목은 DB에서 채운 시점부터 TTL이 지나면 다시 조회됩니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, window: int):
+        self.enabled = ttl > 0
+        self.window = window
+        self.ttl = ttl
+        # 값: (DB에서 채운 시각, 히스토리)
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+
+    def _get_entry(self, chat_id: str) -> Optional[tuple[float, list[dict]]]:
+        """
+        만료되지 않은 캐시 항목 조회 (DB에서 채운 지 TTL이 지난 항목은 삭제)
+
+        Args:
+            chat_id: 채팅 ID
+
+        Returns:
+            Optional[tuple[float, list[dict]]]: (채운 시각, 히스토리) 또는 None
+        """
+        if not self.enabled:
+            return None
+        entry = self._cache.get(chat_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self._cache.pop(chat_id, None)
+            return None
+        return entry
+
+    def get(self, chat_id: str) -> Optional[list[dict]]:
+        """
+        캐시된 히스토리 조회
+
+        Args:
+            chat_id: 채팅 ID
+
+        Returns:
+            Optional[list[dict]]: 오래된 순 히스토리 복사본 (없으면 None)
+        """
+        entry = self._get_entry(chat_id)
+        return list(entry[1]) if entry is not None else None
+
+    def set(self, chat_id: str, history: list[dict]) -> None:
+        """
+        히스토리 캐싱 (DB에서 조회한 직후 호출)
+
+        Args:
+            chat_id: 채팅 ID
+            history: 오래된 순 히스토리
+        """
+        if not self.enabled:
+            return
+        self._cache[chat_id] = (time.monotonic(), list(history[-self.window:]))
+
+    def append(self, chat_id: str, role: str, content: str) -> None:
+        """
+        저장된 메시지를 캐시된 히스토리에 추가 (커밋 후 호출, 캐시에 없으면 무시)
+
+        처음 채운 시각을 유지하여 만료 시각이 늘어나지 않도록 합니다.
+
+        Args:
+            chat_id: 채팅 ID
+            role: 메시지 역할
+            content: 메시지 내용
+        """
+        entry = self._get_entry(chat_id)
+        if entry is None:
+            return
+        filled_at, history = entry
+        history = [*history, {"role": role, "content": content}]
+        self._cache[chat_id] = (filled_at, history[-self.window:])
+
+
+class QueryCache:
+    """
+    RAG 질의 캐시 (질의 임베딩, 유사 청크 검색 결과)
+
+    재시도/재생성처럼 같은 질문이 반복될 때 임베딩 API 호출과 벡터 검색을 생략합니다.
+    질의는 대소문자/공백을 정규화하여 키로 사용합니다.
+
+    문서가 추가/삭제되면 검색 결과 캐시를 비워야 합니다 (invalidate_search).
+    프로세스 단위 캐시이므로 다른 워커 프로세스의 변경은 TTL 이후에 반영됩니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.enabled = ttl > 0
+        self._embeddings: TTLCache = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+        self._results: TTLCache = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """질의 정규화 (소문자 + 연속 공백 하나로)"""
+        return " ".join(query.lower().split())
+
+    def get_embedding(self, query: str) -> Optional[list[float]]:
+        """
+        캐시된 질의 임베딩 조회
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            Optional[list[float]]: 임베딩 벡터 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        return self._embeddings.get(self.normalize(query))
+
+    def set_embedding(self, query: str, embedding: list[float]) -> None:
+        """
+        질의 임베딩 캐싱
+
+        Args:
+            query: 검색 쿼리
+            embedding: 임베딩 벡터
+        """
+        if not self.enabled:
+            return
+        self._embeddings[self.normalize(query)] = embedding
+
+    def _result_key(self, query: str, document_ids: Optional[list[str]], k: int) -> Hashable:
+        return (self.normalize(query), tuple(sorted(document_ids or ())), k)
+
+    def get_results(self, query: str, document_ids: Optional[list[str]], k: int) -> Optional[list[dict]]:
+        """
+        캐시된 검색 결과 조회
+
+        Args:
+            query: 검색 쿼리
+            document_ids: 검색 대상 문서 ID 목록
+            k: 반환할 결과 수
+
+        Returns:
+            Optional[list[dict]]: 검색 결과 복사본 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        results = self._results.get(self._result_key(query, document_ids, k))
+        return list(results) if results is not None else None
+
+    def set_results(
+        self,
+        query: str,
+        document_ids: Optional[list[str]],
+        k: int,
+        results: list[dict]
+    ) -> None:
+        """
+        검색 결과 캐싱
+
+        Args:
+            query: 검색 쿼리
+            document_ids: 검색 대상 문서 ID 목록
+            k: 반환할 결과 수
+            results: 검색 결과
+        """
+        if not self.enabled:
+            return
+        self._results[self._result_key(query, document_ids, k)] = list(results)
+
+    def invalidate_search(self) -> None:
+        """검색 결과 캐시 전체 무효화 (문서 청크 추가/삭제 시 호출)"""
+        self._results.clear()
+
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.RESPONSE_CACHE_TTL
+)
+
+conversation_cache = ConversationCache(
+    maxsize=settings.CONVERSATION_CACHE_MAXSIZE,
+    ttl=settings.CONVERSATION_CACHE_TTL,
+    window=settings.MAX_CONVERSATION_HISTORY * 2
+)
+
+query_cache = QueryCache(
+    maxsize=settings.QUERY_CACHE_MAXSIZE,
+    ttl=settings.QUERY_CACHE_TTL
+)
@@ -4,8 +4,9 @@ Application Configuration Module
 환경 변수를 로드하고 타입 안전한 설정 관리를 제공합니다.
 """
 
+from functools import lru_cache, cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -18,6 +19,20 @@ class Settings(BaseSettings):
     # Database Configuration
     DATABASE_URL: str
     DB_SCHEMA: str = "public"
+    SQL_ECHO: bool = False  # SQL 로그 출력 (디버깅용)
+    DB_AUTO_CREATE: bool = False  # 시작 시 스키마/테이블 자동 생성 (개발용)
+
+    # Connection Pool Settings
+    POOL_SIZE: int = 10
+    MAX_OVERFLOW: int = 20
+    POOL_RECYCLE: int = 1800  # 30분
+    POOL_TIMEOUT: int = 30
+    POOL_PRE_PING: bool = False  # 장시간 유휴 연결이 끊기는 개발 환경에서만 사용
+    STATEMENT_CACHE_SIZE: int = 256  # 연결당 prepared statement 캐시 크기
+
+    # Circuit Breaker Settings
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    DB_CIRCUIT_RESET_TIMEOUT: int = 30  # 초
     
     # Application Configuration
     PORT: int = 8000
@@ -32,6 +47,8 @@ class Settings(BaseSettings):
     GCP_PROJECT_ID: str
     GCP_BUCKET_NAME: str
     GOOGLE_APPLICATION_CREDENTIALS: str
+    SIGNED_URL_EXPIRATION: int = 900  # 직접 업로드용 서명 URL 유효 시간 (초)
+    CDN_HOST: Optional[str] = None  # 버킷 앞단 Cloud CDN 호스트 (설정 시 문서 URL에 사용)
     
     # GCS URLs
     USER_DEFAULT_AVATAR_URL: str
@@ -41,26 +58,60 @@ class Settings(BaseSettings):
     # OpenAI API Keys
     OPENAI_API_KEY: str
     
-    # ChromaDB
+    # Response Cache (프로세스 내 캐시, 0이면 비활성화)
+    # 다른 인스턴스/워커 프로세스(arq 문서 처리 포함)의 변경은 무효화하지 못하므로 기본값은 비활성화,
+    # 단일 프로세스로 운영하거나 TTL 동안의 오래된 응답을 허용할 수 있는 배포에서만 설정
+    RESPONSE_CACHE_TTL: int = 0  # 초
+    RESPONSE_CACHE_MAXSIZE: int = 10000
+    QUERY_CACHE_TTL: int = 300  # RAG 질의 임베딩/검색 결과 캐시 (초)
+    QUERY_CACHE_MAXSIZE: int = 1024
+
+    # Task Queue (arq) - 설정하지 않으면 FastAPI BackgroundTasks로 처리
+    REDIS_URL: Optional[str] = None
+    DOCUMENT_JOB_MAX_TRIES: int = 3  # 문서 처리 작업 최대 시도 횟수
+    DOCUMENT_JOB_RETRY_DELAY: int = 10  # 재시도 지연 (초, 시도 횟수에 비례)
+    DOCUMENT_JOB_TIMEOUT: int = 600  # 작업 1건 최대 실행 시간 (초)
+
+    # Vector Store
+    VECTOR_BACKEND: str = "chroma"  # chroma: 로컬 ChromaDB (개발용), pgvector: PostgreSQL HNSW 인덱스 (pgvector 0.8+ 권장)
     CHROMA_DB_PATH: str = "./chroma"
+    PGVECTOR_DIMENSIONS: int = 1536  # 임베딩 차원 (text-embedding-3-small)
+    PGVECTOR_EF_SEARCH: int = 100  # HNSW 검색 후보 수 (클수록 recall↑, 속도↓)
+    PGVECTOR_HALFVEC: bool = True  # 임베딩을 float16(halfvec)으로 저장 (pgvector 0.7+, 기존 테이블과 일치해야 함)
     
     # File Upload Settings
     ALLOWED_FILE_TYPES: str = "pdf,md,txt"
     MAX_FILE_SIZE: int = 52428800  # 50MB
+    PDF_BACKEND: str = "pdfium"  # PDF 텍스트 추출 백엔드 (pdfium 또는 pypdf)
+    PDF_USE_PROCESS_POOL: bool = True  # False면 큰 PDF도 스레드 하나에서 추출 (작은 컨테이너용)
+    PDF_PROCESS_WORKERS: int = 2  # PDF 추출 프로세스 수 상한 (프로세스마다 PDF 전체를 메모리에 올림, CPU 수를 넘지 않음)
     
     # RAG Settings
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
+    CHUNK_MIN_SIZE: int = 100  # 이보다 짧은 청크는 인접 청크와 병합
+    TEXT_SPLITTER: str = "semantic"  # 청크 분할기 (semantic: Rust 기반, langchain: 기존 분할기)
     TOP_K_RESULTS: int = 4
+    USE_RERANKER: bool = False  # 크로스 인코더로 재정렬 (sentence-transformers 설치 필요)
+    RERANKER_MODEL: str = "BAAI/bge-reranker-base"
+    RERANK_FETCH_MULTIPLIER: int = 4  # 재정렬 전 후보 수 = TOP_K_RESULTS * 배수
     
     # LLM Settings
     LLM_MODEL: str = "gpt-4o-mini"
     EMBEDDING_MODEL: str = "text-embedding-3-small"
+    EMBEDDING_BATCH_SIZE: int = 512  # 임베딩 API 호출당 청크 수 (최대 2048)
+    EMBEDDING_CONCURRENCY: int = 4  # 동시에 보내는 임베딩 API 요청 수
+    OPENAI_MAX_CONCURRENCY: int = 8  # 프로세스 전체에서 동시에 보내는 OpenAI API 요청 수
+    OPENAI_MAX_RETRIES: int = 6  # 429/5xx/연결 오류 시 최대 시도 횟수 (지수 백오프)
     LLM_TEMPERATURE: float = 0.0
     LLM_MAX_TOKENS: int = 1000
 
     # Conversation History
-    MAX_CONVERSATION_HISTORY: int = 10
+    MAX_CONVERSATION_HISTORY: int = 2  # 그대로 전달할 최근 대화 쌍 수 (user+assistant)
+    CONVERSATION_RETRIEVAL_K: int = 5  # 벡터 검색으로 추가할 관련 이전 대화 턴 수
+    HISTORY_TOKEN_BUDGET: int = 2000  # 프롬프트에 넣을 대화 히스토리 최대 토큰 수 (최근 메시지 우선)
+    CONVERSATION_CACHE_TTL: int = 60  # 초 (프로세스 내 캐시, 0이면 비활성화)
+    CONVERSATION_CACHE_MAXSIZE: int = 10000
 
     model_config = SettingsConfigDict(
         env_file=".env.development",
@@ -68,20 +119,20 @@ class Settings(BaseSettings):
         case_sensitive=False
     )
     
-    @property
+    @cached_property
     def allowed_origins_list(self) -> List[str]:
         """
-        CORS용 허용된 origin 목록을 반환합니다.
+        CORS용 허용된 origin 목록을 반환합니다 (최초 접근 시 한 번만 계산).
         
         Returns:
             List[str]: 허용된 origin URL 목록
         """
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
-    @property
+    @cached_property
     def allowed_file_types_list(self) -> List[str]:
         """
-        허용된 파일 타입 목록을 반환합니다.
+        허용된 파일 타입 목록을 반환합니다 (최초 접근 시 한 번만 계산).
         
         Returns:
             List[str]: 허용된 파일 확장자 목록
@@ -89,5 +140,18 @@ class Settings(BaseSettings):
         return [file_type.strip() for file_type in self.ALLOWED_FILE_TYPES.split(",")]
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    설정 인스턴스를 반환합니다 (캐싱)
+
+    .env 파일 파싱과 검증은 최초 호출 시 한 번만 수행됩니다.
+
+    Returns:
+        Settings: 애플리케이션 설정 인스턴스
+    """
+    return Settings()
+
+
 # 전역 설정 인스턴스
-settings: Settings = Settings()
+settings: Settings = get_settings()
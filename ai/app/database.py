@@ -7,16 +7,31 @@ SQLAlchemy 비동기 엔진 및 세션 관리를 제공합니다.
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy import text
+from sqlalchemy import exc as sa_exc
+from asyncpg import exceptions as pg_exc
 from typing import AsyncGenerator
 
 from app.config import settings
+from app.db_manager import CircuitBreaker
 
-# 비동기 엔진 생성
+# 비동기 엔진 생성 (async 엔진의 기본 풀인 AsyncAdaptedQueuePool 사용)
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
-    echo=settings.ENVIRONMENT == "development",
+    echo=settings.SQL_ECHO,
     future=True,
-    pool_pre_ping=True
+    pool_pre_ping=settings.POOL_PRE_PING,
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_recycle=settings.POOL_RECYCLE,
+    pool_timeout=settings.POOL_TIMEOUT,
+    connect_args={
+        # asyncpg의 타입 introspection 쿼리가 PG JIT 컴파일로 느려지는 것을 방지
+        "server_settings": {"jit": "off"},
+        "command_timeout": 10,
+        # SQLAlchemy 어댑터 / asyncpg 양쪽의 prepared statement 캐시
+        "prepared_statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.STATEMENT_CACHE_SIZE
+    }
 )
 
 # 비동기 세션 팩토리
@@ -28,6 +43,25 @@ AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     autoflush=False
 )
 
+# 데이터베이스 서킷 브레이커
+db_circuit_breaker: CircuitBreaker = CircuitBreaker(
+    failure_threshold=settings.DB_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.DB_CIRCUIT_RESET_TIMEOUT
+)
+
+# 서킷 브레이커가 실패로 집계하는 예외
+# asyncpg 어댑터는 연결 시점의 오류를 SQLAlchemy 예외로 감싸지 않으므로
+# (ConnectionRefusedError, socket.gaierror, TimeoutError, CannotConnectNowError 등) 원본 예외도 포함
+DB_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+    sa_exc.TimeoutError,
+    OSError,
+    TimeoutError,
+    pg_exc.PostgresConnectionError,
+    pg_exc.CannotConnectNowError
+)
+
 # Base 클래스 정의
 Base = declarative_base()
 
@@ -37,12 +71,62 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     데이터베이스 세션 의존성 함수
     
     FastAPI 의존성으로 사용되며, 요청마다 새로운 DB 세션을 제공합니다.
+    서킷이 열려 있으면 커넥션을 기다리지 않고 즉시 503을 반환합니다.
     
     Yields:
         AsyncSession: 비동기 데이터베이스 세션
+
+    Raises:
+        HTTPException: 데이터베이스 서킷이 열려 있는 경우 (503)
     """
+    trial = db_circuit_breaker.before_call()
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
+        except DB_CONNECTION_ERRORS:
+            # 연결 실패 / 커넥션 풀 대기 시간 초과
+            db_circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # DB와 무관한 오류로 끝난 시험 요청은 결과를 판단하지 않고 다음 요청에 넘김
+            if trial:
+                db_circuit_breaker.release_trial()
+            raise
+        else:
+            db_circuit_breaker.record_success()
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 데이터베이스 세션 의존성 함수
+
+    AUTOCOMMIT 연결에 세션을 바인딩하여 조회 전용 엔드포인트에서
+    BEGIN/COMMIT 왕복을 생략합니다. 쓰기 작업에는 get_db를 사용해야 합니다.
+
+    Yields:
+        AsyncSession: 비동기 데이터베이스 세션 (AUTOCOMMIT)
+
+    Raises:
+        HTTPException: 데이터베이스 서킷이 열려 있는 경우 (503)
+    """
+    trial = db_circuit_breaker.before_call()
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            async with AsyncSession(bind=conn, expire_on_commit=False, autoflush=False) as session:
+                yield session
+    except DB_CONNECTION_ERRORS:
+        # 연결 실패 / 커넥션 풀 대기 시간 초과
+        db_circuit_breaker.record_failure()
+        raise
+    except BaseException:
+        # DB와 무관한 오류로 끝난 시험 요청은 결과를 판단하지 않고 다음 요청에 넘김
+        if trial:
+            db_circuit_breaker.release_trial()
+        raise
+    else:
+        db_circuit_breaker.record_success()
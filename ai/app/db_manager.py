@@ -0,0 +1,88 @@
+"""
+Database Connection Manager Module
+
+데이터베이스 장애 시 요청이 커넥션 대기로 쌓이지 않도록 서킷 브레이커를 제공합니다.
+"""
+
+import time
+from typing import Optional
+from fastapi import HTTPException, status
+
+
+class CircuitBreaker:
+    """
+    데이터베이스 서킷 브레이커
+
+    연속된 연결 실패가 임계값을 넘으면 일정 시간 동안(open) 요청을 즉시 503으로 거절합니다.
+    reset_timeout이 지나면 요청 하나만 시험적으로 통과시키고(half-open),
+    성공하면 다시 정상 상태(closed)로, 실패하면 다시 open 상태로 돌아갑니다.
+    시험 요청이 끝나기 전까지 다른 요청은 계속 503으로 거절합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """
+        현재 서킷 상태를 반환합니다.
+
+        Returns:
+            str: closed, open, half_open 중 하나
+        """
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self) -> bool:
+        """
+        요청 처리 전 서킷 상태 확인
+
+        Returns:
+            bool: half-open 상태의 시험 요청이면 True
+
+        Raises:
+            HTTPException: 서킷이 열려 있거나, 시험 요청이 진행 중인 경우 (503)
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return False
+
+        if state == self.HALF_OPEN:
+            now = time.monotonic()
+            # 시험 요청이 없거나, 시험 요청이 reset_timeout 동안 끝나지 않은 경우에만 새 시험 요청 허용
+            if self._trial_started_at is None or now - self._trial_started_at >= self.reset_timeout:
+                self._trial_started_at = now
+                return True
+
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database is temporarily unavailable."
+        )
+
+    def record_success(self) -> None:
+        """성공 기록 - 실패 횟수를 초기화하고 서킷을 닫습니다."""
+        self.failure_count = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """실패 기록 - 임계값에 도달하거나 시험 요청이 실패하면 서킷을 엽니다."""
+        self.failure_count += 1
+        if self._trial_started_at is not None or self.failure_count >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._trial_started_at = None
+
+    def release_trial(self) -> None:
+        """시험 요청이 DB 오류가 아닌 이유로 끝난 경우 - 다음 요청이 다시 시험 요청이 됩니다."""
+        self._trial_started_at = None
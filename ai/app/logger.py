@@ -0,0 +1,57 @@
+"""
+Logging Configuration Module
+
+로그 기록이 이벤트 루프를 막지 않도록 QueueHandler/QueueListener 기반 로깅을 설정합니다.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 로그 포맷 (기존 [INFO]/[ERROR] 접두사 형식 유지)
+LOG_FORMAT = "[%(levelname)s] %(asctime)s %(name)s - %(message)s"
+
+# 루트 로거에 연결된 큐 핸들러와 큐를 비우는 리스너 스레드 (setup_logging 호출 시 생성)
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    루트 로거에 QueueHandler를 연결하고 출력 스레드(QueueListener)를 시작합니다.
+
+    로거 호출은 큐에 레코드만 넣고 즉시 반환하며,
+    포맷팅과 stdout 쓰기는 리스너 스레드에서 처리됩니다.
+    여러 번 호출해도 한 번만 설정됩니다.
+
+    Args:
+        level: 루트 로거 레벨
+    """
+    global _queue_handler, _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    _queue_handler = QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """큐 핸들러를 떼어내고, 리스너 스레드를 멈춰 큐에 남은 로그를 모두 출력합니다."""
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
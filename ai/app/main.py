@@ -2,19 +2,98 @@
 Nura Server - FastAPI Application Entry Point
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
+from app.logger import setup_logging, shutdown_logging
 from app.routers import categories, chats, documents, messages
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    서버 수명 주기 관리
+
+    시작 시 데이터베이스 연결을 테스트하고 (DB_AUTO_CREATE인 경우) 테이블을 생성하며,
+    종료 시 데이터베이스 연결을 정리합니다.
+    """
+    from app.database import engine, Base
+    from sqlalchemy import text
+    from sqlalchemy.orm import configure_mappers
+    import app.models  # 모든 모델 import
+
+    # 비동기 친화적 로깅 설정 (출력은 별도 스레드에서 처리)
+    setup_logging()
+
+    # 매퍼 구성을 첫 요청이 아닌 시작 시점에 미리 수행
+    configure_mappers()
+
+    try:
+        # 데이터베이스 연결 테스트
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT 1"))
+            await conn.commit()
+        print("✅ PostgreSQL 연결 성공")
+
+        # 커넥션 풀 워밍업 (첫 요청에서 연결 생성 비용이 발생하지 않도록)
+        conns = await asyncio.gather(*(engine.connect() for _ in range(settings.POOL_SIZE)))
+        await asyncio.gather(*(conn.close() for conn in conns))
+        print(f"✅ 커넥션 풀 워밍업 완료 ({settings.POOL_SIZE}개)")
+
+        if settings.DB_AUTO_CREATE:
+            async with engine.begin() as conn:
+                # 여러 워커가 동시에 DDL을 실행하지 않도록 advisory lock (트랜잭션 종료 시 해제)
+                await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('nura_schema_init'))"))
+
+                # 스키마 생성 (없으면)
+                await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.DB_SCHEMA}"))
+                print(f"✅ {settings.DB_SCHEMA} 스키마 확인/생성 완료")
+
+                # 테이블 생성
+                await conn.run_sync(Base.metadata.create_all)
+            print(f"✅ 데이터베이스 테이블 생성 완료 ({settings.DB_SCHEMA} 스키마)")
+
+    except Exception as e:
+        print(f"❌ 데이터베이스 초기화 실패: {e}")
+        raise
+
+    yield
+
+    # 작업 큐 커넥션 정리
+    if settings.REDIS_URL:
+        from app.workers.queue import close_arq_pool
+        await close_arq_pool()
+
+    # GCS 다운로드용 HTTP 클라이언트 정리
+    from app.utils.gcs_upload import gcs_uploader
+    await gcs_uploader.close()
+
+    # PDF 추출용 프로세스 풀 종료 (자식 프로세스 정리)
+    from app.services.document_service import shutdown_pdf_executor
+    await asyncio.to_thread(shutdown_pdf_executor)
+
+    await engine.dispose()
+    print("✅ PostgreSQL 연결 종료")
+
+    # 큐에 남은 로그 출력 후 리스너 종료
+    shutdown_logging()
+
+
 # FastAPI 앱 생성
 app: FastAPI = FastAPI(
     title="Nura Server",
     description="RAG 파이프라인 기반 AI 문서 분석 및 질의응답 시스템",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson으로 응답 직렬화
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 설정
@@ -60,49 +139,3 @@ async def health_check() -> dict[str, str]:
         "status": "healthy",
         "environment": settings.ENVIRONMENT
     }
-
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """
-    서버 시작 시 실행되는 이벤트
-    
-    데이터베이스 연결을 테스트하고 테이블을 생성합니다.
-    """
-    from app.database import engine, Base
-    from sqlalchemy import text
-    import app.models  # 모든 모델 import
-    
-    try:
-        # 데이터베이스 연결 테스트
-        async with engine.connect() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            await conn.commit()
-        print("✅ PostgreSQL 연결 성공")
-        
-        # 스키마 생성 (없으면)
-        async with engine.begin() as conn:
-            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.DB_SCHEMA}"))
-        print(f"✅ {settings.DB_SCHEMA} 스키마 확인/생성 완료")
-        
-        # 테이블 생성
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        print(f"✅ 데이터베이스 테이블 생성 완료 ({settings.DB_SCHEMA} 스키마)")
-        
-    except Exception as e:
-        print(f"❌ 데이터베이스 초기화 실패: {e}")
-        raise
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """
-    서버 종료 시 실행되는 이벤트
-    
-    데이터베이스 연결을 정리합니다.
-    """
-    from app.database import engine
-    
-    await engine.dispose()
-    print("✅ PostgreSQL 연결 종료")
@@ -4,34 +4,84 @@ Models Package
 SQLAlchemy ORM 모델을 포함합니다.
 """
 
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from ulid import ULID
-from sqlalchemy import String, DateTime
+from sqlalchemy import DateTime, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 from typing import Optional
 
 from app.database import Base
-from app.config import Settings
+from app.config import settings as _settings
 
 # 환경변수에서 스키마 로드
-_settings = Settings()
 DB_SCHEMA = _settings.DB_SCHEMA
 
+# 부분 인덱스 조건: soft delete 되지 않은 행만 인덱싱 (PostgreSQL)
+LIVE_ROWS = text('"deletedAt" IS NULL')
+
 
 def generate_ulid() -> str:
     """ULID 생성 함수"""
     return str(ULID())
 
 
+def normalize_ulid(value: str) -> str:
+    """
+    ULID 문자열을 DB에서 읽은 값과 같은 정규형(대문자 26자)으로 변환
+
+    ULIDType은 소문자 ULID도 바인딩하지만 조회 결과는 항상 정규형(대문자)이므로,
+    요청으로 받은 ID를 조회 결과와 비교하기 전에 사용합니다.
+    형식이 잘못된 값은 그대로 반환합니다 (어떤 행과도 일치하지 않음).
+    """
+    try:
+        return str(ULID.from_str(value.upper()))
+    except ValueError:
+        return value
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시각 (timezone-aware, timestamptz 컬럼용)"""
+    return datetime.now(timezone.utc)
+
+
+class ULIDType(TypeDecorator):
+    """
+    ULID 컬럼 타입
+
+    DB에는 16바이트 네이티브 UUID로 저장하고, Python에서는 26자 ULID 문자열로 다룹니다.
+    ULID의 바이트 순서를 그대로 유지하므로 시간순 정렬(인덱스 지역성)이 보존됩니다.
+    """
+    impl = UUID(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[uuid.UUID]:
+        if value is None:
+            return None
+        try:
+            return ULID.from_str(value.upper()).to_uuid()  # 소문자 ULID도 허용
+        except ValueError:
+            # 형식이 잘못된 ID는 어떤 행과도 일치하지 않도록 NULL로 바인딩 (→ 404)
+            return None
+
+    def process_result_value(self, value: Optional[uuid.UUID], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(ULID.from_uuid(value))
+
+
 class TimestampMixin:
     """
     타임스탬프 믹스인
 
     createdAt, updatedAt, deletedAt 필드를 제공합니다.
+    타임스탬프는 DB 서버 시각(now())으로 채워집니다.
     """
-    createdAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updatedAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    deletedAt: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    createdAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updatedAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    deletedAt: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class ULIDMixin:
@@ -40,7 +90,7 @@ class ULIDMixin:
 
     ULID 기본 키를 제공합니다.
     """
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, default=generate_ulid)
+    id: Mapped[str] = mapped_column(ULIDType, primary_key=True, default=generate_ulid)
 
 
 class BaseModel(Base, ULIDMixin, TimestampMixin):
@@ -60,17 +110,22 @@ from app.models.chat import Chat
 from app.models.document import Document
 from app.models.chat_document import ChatDocument
 from app.models.message import Message
+from app.models.message_document import MessageDocument
 
 
 __all__ = [
     "Base",
     "BaseModel",
     "ULIDMixin",
+    "ULIDType",
     "TimestampMixin",
     "generate_ulid",
+    "normalize_ulid",
+    "utc_now",
     "Category",
     "Chat",
     "Document",
     "ChatDocument",
     "Message",
+    "MessageDocument",
 ]
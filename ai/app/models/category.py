@@ -4,11 +4,11 @@ Category Model
 카테고리 테이블 ORM 모델
 """
 
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
-from app.models import BaseModel
+from app.models import BaseModel, DB_SCHEMA, LIVE_ROWS
 
 if TYPE_CHECKING:
     from app.models.chat import Chat
@@ -21,6 +21,13 @@ class Category(BaseModel):
     채팅을 분류하기 위한 카테고리
     """
     __tablename__ = "categories"
+    __table_args__ = (
+        # 카테고리 목록: userId + deletedAt IS NULL, (createdAt, id) 정렬/키셋 (삭제되지 않은 카테고리만 인덱싱)
+        Index("ix_categories_user_created_live", "userId", "createdAt", "id", postgresql_where=LIVE_ROWS),
+        # 사용자별 카테고리 이름 중복 방지 (삭제되지 않은 카테고리만)
+        Index("ux_categories_user_name_live", "userId", "name", unique=True, postgresql_where=LIVE_ROWS),
+        {"schema": DB_SCHEMA},
+    )
 
     # Fields
     userId: Mapped[Optional[str]] = mapped_column(String(26), nullable=True)
@@ -28,4 +35,4 @@ class Category(BaseModel):
     description: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
 
     # Relationships
-    chats: Mapped[list["Chat"]] = relationship(back_populates="category", lazy="selectin")
+    chats: Mapped[list["Chat"]] = relationship(back_populates="category", lazy="raise")
@@ -4,11 +4,11 @@ Chat Model
 채팅 테이블 ORM 모델
 """
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
-from app.models import BaseModel, DB_SCHEMA
+from app.models import BaseModel, ULIDType, DB_SCHEMA, LIVE_ROWS
 
 if TYPE_CHECKING:
     from app.models.category import Category
@@ -23,13 +23,20 @@ class Chat(BaseModel):
     문서 기반 대화 세션
     """
     __tablename__ = "chats"
+    __table_args__ = (
+        # 채팅 목록: userId + deletedAt IS NULL, (updatedAt, id) 정렬/키셋 (삭제되지 않은 채팅만 인덱싱)
+        Index("ix_chats_user_updated_live", "userId", "updatedAt", "id", postgresql_where=LIVE_ROWS),
+        # 카테고리별 채팅 조회 / 개수 집계
+        Index("ix_chats_category_live", "categoryId", postgresql_where=LIVE_ROWS),
+        {"schema": DB_SCHEMA},
+    )
 
     # Fields
     userId: Mapped[Optional[str]] = mapped_column(String(26), nullable=True)
-    categoryId: Mapped[Optional[str]] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.categories.id", ondelete="SET NULL"), nullable=True)
+    categoryId: Mapped[Optional[str]] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.categories.id", ondelete="SET NULL"), nullable=True)
     title: Mapped[str] = mapped_column(String(100))
 
     # Relationships
-    category: Mapped[Optional["Category"]] = relationship(back_populates="chats", lazy="selectin")
-    messages: Mapped[list["Message"]] = relationship(back_populates="chat", lazy="selectin", cascade="all, delete-orphan")
-    chatDocuments: Mapped[list["ChatDocument"]] = relationship(back_populates="chat", lazy="selectin", cascade="all, delete-orphan")
+    category: Mapped[Optional["Category"]] = relationship(back_populates="chats", lazy="raise")
+    messages: Mapped[list["Message"]] = relationship(back_populates="chat", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
+    chatDocuments: Mapped[list["ChatDocument"]] = relationship(back_populates="chat", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
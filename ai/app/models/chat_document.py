@@ -4,12 +4,12 @@ ChatDocument Model
 채팅-문서 연결 테이블 ORM 모델 (M:N 관계)
 """
 
-from sqlalchemy import String, ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from app.models import BaseModel, DB_SCHEMA
+from app.models import BaseModel, ULIDType, DB_SCHEMA
 
 if TYPE_CHECKING:
     from app.models.chat import Chat
@@ -23,11 +23,16 @@ class ChatDocument(BaseModel):
     채팅과 문서의 M:N 관계를 관리
     """
     __tablename__ = "chat_documents"
+    __table_args__ = (
+        # 채팅당 같은 문서는 한 번만 연결
+        Index("ux_chat_documents_chat_document", "chatId", "documentId", unique=True),
+        {"schema": DB_SCHEMA},
+    )
     
     # Fields
-    chatId: Mapped[str] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.chats.id", ondelete="CASCADE"))
-    documentId: Mapped[str] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.documents.id", ondelete="CASCADE"))
-    addedAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    chatId: Mapped[str] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.chats.id", ondelete="CASCADE"))
+    documentId: Mapped[str] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.documents.id", ondelete="CASCADE"))
+    addedAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     chat: Mapped["Chat"] = relationship(back_populates="chatDocuments")
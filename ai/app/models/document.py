@@ -43,10 +43,10 @@ class Document(BaseModel):
     filename: Mapped[str] = mapped_column(String(255))
     filePath: Mapped[str] = mapped_column(String(500))
     fileType: Mapped[FileType] = mapped_column(SQLEnum(FileType, name="file_type_enum", schema=DB_SCHEMA))
-    fileSize: Mapped[int] = mapped_column(Integer)
+    fileSize: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # NULL: 서명 URL 업로드 완료 전
     status: Mapped[DocumentStatus] = mapped_column(SQLEnum(DocumentStatus, name="document_status_enum", schema=DB_SCHEMA), default=DocumentStatus.PROCESSING)
     chunkCount: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=0)
 
     # Relationships
-    chatDocuments: Mapped[list["ChatDocument"]] = relationship(back_populates="document", lazy="selectin", cascade="all, delete-orphan")
-    messageDocuments: Mapped[list["MessageDocument"]] = relationship(back_populates="document", cascade="all, delete-orphan")
+    chatDocuments: Mapped[list["ChatDocument"]] = relationship(back_populates="document", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
+    messageDocuments: Mapped[list["MessageDocument"]] = relationship(back_populates="document", cascade="all, delete-orphan", passive_deletes=True)
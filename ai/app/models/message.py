@@ -4,13 +4,13 @@ Message Model
 메시지 테이블 ORM 모델
 """
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Text, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 import enum
 
-from app.models import BaseModel, DB_SCHEMA
+from app.models import BaseModel, ULIDType, DB_SCHEMA, LIVE_ROWS
 
 if TYPE_CHECKING:
     from app.models.chat import Chat
@@ -30,13 +30,18 @@ class Message(BaseModel):
     채팅의 대화 메시지 (사용자 질문 + AI 응답)
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # 메시지 목록 / 대화 히스토리: chatId + createdAt 정렬 (삭제되지 않은 메시지만 인덱싱)
+        Index("ix_messages_chat_created_live", "chatId", "createdAt", postgresql_where=LIVE_ROWS),
+        {"schema": DB_SCHEMA},
+    )
 
     # Fields
-    chatId: Mapped[str] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.chats.id", ondelete="CASCADE"))
+    chatId: Mapped[str] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.chats.id", ondelete="CASCADE"))
     role: Mapped[MessageRole] = mapped_column(SQLEnum(MessageRole, name="message_role_enum", schema=DB_SCHEMA))
     content: Mapped[str] = mapped_column(Text)
     sources: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Relationships
     chat: Mapped["Chat"] = relationship(back_populates="messages")
-    messageDocuments: Mapped[list["MessageDocument"]] = relationship(back_populates="message", cascade="all, delete-orphan")
+    messageDocuments: Mapped[list["MessageDocument"]] = relationship(back_populates="message", cascade="all, delete-orphan", passive_deletes=True)
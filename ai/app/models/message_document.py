@@ -4,11 +4,11 @@ MessageDocument Model
 메시지-문서 연결 테이블 ORM 모델
 """
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from app.models import BaseModel, DB_SCHEMA
+from app.models import BaseModel, ULIDType, DB_SCHEMA
 
 if TYPE_CHECKING:
     from app.models.message import Message
@@ -22,10 +22,15 @@ class MessageDocument(BaseModel):
     각 메시지에 첨부된 문서를 추적
     """
     __tablename__ = "message_documents"
+    __table_args__ = (
+        # 메시지별 첨부 문서 조회
+        Index("ix_message_documents_message", "messageId"),
+        {"schema": DB_SCHEMA},
+    )
 
     # Fields
-    messageId: Mapped[str] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.messages.id", ondelete="CASCADE"))
-    documentId: Mapped[str] = mapped_column(String(26), ForeignKey(f"{DB_SCHEMA}.documents.id", ondelete="CASCADE"))
+    messageId: Mapped[str] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.messages.id", ondelete="CASCADE"))
+    documentId: Mapped[str] = mapped_column(ULIDType, ForeignKey(f"{DB_SCHEMA}.documents.id", ondelete="CASCADE"))
 
     # Relationships
     message: Mapped["Message"] = relationship(back_populates="messageDocuments")
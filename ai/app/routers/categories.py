@@ -4,10 +4,11 @@ Categories Router
 카테고리 관련 API 엔드포인트 (Controller Layer)
 """
 
-from fastapi import APIRouter, Depends, Query, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_db_ro
 from app.services.category_service import CategoryService
 from app.schemas.category import (
     CategoryCreate,
@@ -15,31 +16,47 @@ from app.schemas.category import (
     CategoryResponse,
     CategoryDetail
 )
-from app.schemas.common import SuccessResponse
+from app.schemas.common import SuccessResponse, PaginatedResponse, json_response
+from app.utils.pagination import encode_cursor
+from app.cache import response_cache
 
 router = APIRouter(prefix="/api/v1/categories", tags=["categories"])
 
 
-@router.get("")
+@router.get("", response_model=PaginatedResponse[CategoryResponse])
 async def get_categories(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor)"),
     user_id: str = Query(..., description="사용자 ID"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse[list[CategoryResponse]]:
+    db: AsyncSession = Depends(get_db_ro)
+) -> Response:
     """
     카테고리 목록 조회
 
     Args:
         page: 페이지 번호
         limit: 페이지당 개수
+        cursor: 다음 페이지 커서
         db: 데이터베이스 세션
 
     Returns:
-        SuccessResponse: 카테고리 목록
+        PaginatedResponse: 카테고리 목록 (다음 페이지 커서 포함)
     """
-    categories = await CategoryService.get_categories(db, page, limit, user_id)
-    return SuccessResponse(data=categories)
+    # 캐시된 응답이 있으면 바로 반환
+    cache_key = ("categories", page, limit, cursor)
+    generation = response_cache.generation(user_id)
+    cached = response_cache.get(user_id, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    categories = await CategoryService.get_categories(db, page, limit, user_id, cursor)
+    next_cursor = (
+        encode_cursor(categories[-1].created_at, categories[-1].id) if len(categories) == limit else None
+    )
+    response = json_response(PaginatedResponse[CategoryResponse](data=categories, next_cursor=next_cursor))
+    response_cache.set(user_id, cache_key, response.body, generation)
+    return response
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -65,12 +82,12 @@ async def create_category(
     return SuccessResponse(data=category)
 
 
-@router.get("/{category_id}")
+@router.get("/{category_id}", response_model=SuccessResponse[CategoryDetail])
 async def get_category(
     category_id: str,
     user_id: str = Query(..., description="사용자 ID"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse[CategoryDetail]:
+    db: AsyncSession = Depends(get_db_ro)
+) -> Response:
     """
     카테고리 상세 조회
 
@@ -84,8 +101,17 @@ async def get_category(
     Raises:
         HTTPException: 카테고리를 찾을 수 없는 경우
     """
+    # 캐시된 응답이 있으면 바로 반환
+    cache_key = ("category", category_id)
+    generation = response_cache.generation(user_id)
+    cached = response_cache.get(user_id, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     category_detail = await CategoryService.get_category_by_id(db, category_id, user_id)
-    return SuccessResponse(data=category_detail)
+    response = json_response(SuccessResponse[CategoryDetail](data=category_detail))
+    response_cache.set(user_id, cache_key, response.body, generation)
+    return response
 
 
 @router.patch("/{category_id}")
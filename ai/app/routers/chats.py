@@ -5,10 +5,10 @@ Chats Router
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, UploadFile, File, Body
+from fastapi import APIRouter, Depends, Query, UploadFile, File, Body, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_db_ro
 from app.services.chat_service import ChatService
 from app.services.message_service import MessageService
 from app.schemas.chat import (
@@ -16,19 +16,22 @@ from app.schemas.chat import (
     ChatResponse,
     ChatDetail
 )
-from app.schemas.common import SuccessResponse
+from app.schemas.common import SuccessResponse, PaginatedResponse, json_response
+from app.utils.pagination import encode_cursor
+from app.cache import response_cache
 
 router = APIRouter(prefix="/api/v1/chats", tags=["chats"])
 
 
-@router.get("")
+@router.get("", response_model=PaginatedResponse[ChatResponse])
 async def get_chats(
     user_id: str = Query(..., description="사용자 ID"),
     category_id: Optional[str] = Query(None, description="카테고리 ID (필터링)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse[list[ChatResponse]]:
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor)"),
+    db: AsyncSession = Depends(get_db_ro)
+) -> Response:
     """
     채팅 목록 조회
 
@@ -37,21 +40,34 @@ async def get_chats(
         category_id: 카테고리 ID (선택)
         page: 페이지 번호
         limit: 페이지당 개수
+        cursor: 다음 페이지 커서
         db: 데이터베이스 세션
 
     Returns:
-        SuccessResponse: 채팅 목록
+        PaginatedResponse: 채팅 목록 (다음 페이지 커서 포함)
     """
-    chats = await ChatService.get_chats(db, user_id, page, limit, category_id)
-    return SuccessResponse(data=chats)
-
-
-@router.get("/{chat_id}")
+    # 캐시된 응답이 있으면 바로 반환
+    cache_key = ("chats", category_id, page, limit, cursor)
+    generation = response_cache.generation(user_id)
+    cached = response_cache.get(user_id, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    chats = await ChatService.get_chats(db, user_id, page, limit, category_id, cursor)
+    next_cursor = (
+        encode_cursor(chats[-1].updated_at, chats[-1].id) if len(chats) == limit else None
+    )
+    response = json_response(PaginatedResponse[ChatResponse](data=chats, next_cursor=next_cursor))
+    response_cache.set(user_id, cache_key, response.body, generation)
+    return response
+
+
+@router.get("/{chat_id}", response_model=SuccessResponse[ChatDetail])
 async def get_chat(
     chat_id: str,
     user_id: str = Query(..., description="사용자 ID"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse[ChatDetail]:
+    db: AsyncSession = Depends(get_db_ro)
+) -> Response:
     """
     채팅 상세 조회
 
@@ -66,8 +82,17 @@ async def get_chat(
     Raises:
         HTTPException: 채팅을 찾을 수 없거나 권한이 없는 경우
     """
+    # 캐시된 응답이 있으면 바로 반환
+    cache_key = ("chat", chat_id)
+    generation = response_cache.generation(user_id)
+    cached = response_cache.get(user_id, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     chat_detail = await ChatService.get_chat_by_id(db, chat_id, user_id)
-    return SuccessResponse(data=chat_detail)
+    response = json_response(SuccessResponse[ChatDetail](data=chat_detail))
+    response_cache.set(user_id, cache_key, response.body, generation)
+    return response
 
 
 @router.patch("/{chat_id}")
@@ -167,13 +192,13 @@ async def bulk_delete_chats(
     result = await ChatService.delete_multiple_chats(db, chat_ids, user_id)
     return SuccessResponse(data=result)
 
-@router.get("/{chat_id}/messages")
+@router.get("/{chat_id}/messages", response_model=SuccessResponse[dict])
 async def get_chat_messages(
     chat_id: str,
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(50, ge=1, le=100, description="페이지당 개수"),
-    db: AsyncSession = Depends(get_db)
-) -> SuccessResponse[dict]:
+    db: AsyncSession = Depends(get_db_ro)
+) -> Response:
     """
     채팅의 메시지 목록 조회
 
@@ -187,4 +212,4 @@ async def get_chat_messages(
         SuccessResponse: 메시지 목록
     """
     result = await MessageService.get_messages(db, chat_id, page, limit)
-    return SuccessResponse(data=result)
\ No newline at end of file
+    return json_response(SuccessResponse(data=result))
\ No newline at end of file
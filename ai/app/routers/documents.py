@@ -8,9 +8,9 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query, UploadFile, File, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_db_ro
 from app.services.document_service import DocumentService
-from app.schemas.document import DocumentUploadResponse
+from app.schemas.document import DocumentUploadResponse, DocumentUploadUrlRequest, DocumentUploadUrlResponse
 from app.schemas.common import SuccessResponse
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
@@ -41,12 +41,64 @@ async def upload_document(
     return SuccessResponse(data=document)
 
 
+@router.post("/upload-url")
+async def create_upload_url(
+    upload_request: DocumentUploadUrlRequest,
+    user_id: str = Query(default="default-user", description="사용자 ID"),
+    db: AsyncSession = Depends(get_db)
+) -> SuccessResponse[DocumentUploadUrlResponse]:
+    """
+    GCS 직접 업로드용 서명 URL 발급
+
+    클라이언트는 응답의 uploadUrl로 파일을 PUT(Content-Type 헤더 포함)한 뒤
+    POST /{document_id}/complete를 호출합니다.
+
+    Args:
+        upload_request: 업로드할 파일 정보 (파일명, 크기)
+        user_id: 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        SuccessResponse: 문서 ID와 서명된 업로드 URL
+
+    Raises:
+        HTTPException: 파일 타입이나 크기가 유효하지 않은 경우
+    """
+    upload = await DocumentService.create_upload_url(db, upload_request, user_id)
+    return SuccessResponse(data=upload)
+
+
+@router.post("/{document_id}/complete")
+async def complete_upload(
+    document_id: str,
+    background_tasks: BackgroundTasks = None,
+    user_id: str = Query(default="default-user", description="사용자 ID"),
+    db: AsyncSession = Depends(get_db)
+) -> SuccessResponse[DocumentUploadResponse]:
+    """
+    서명 URL 업로드 완료 처리 (문서 처리 시작)
+
+    Args:
+        document_id: 문서 ID
+        user_id: 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        SuccessResponse: 업로드된 문서 정보
+
+    Raises:
+        HTTPException: 문서가 없거나 파일이 업로드되지 않은 경우
+    """
+    document = await DocumentService.complete_upload(db, document_id, user_id, background_tasks)
+    return SuccessResponse(data=document)
+
+
 @router.get("")
 async def get_documents(
     status: Optional[str] = Query(None, description="상태 필터 (processing, completed, failed)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ) -> dict:
     """
     문서 목록 조회
@@ -67,7 +119,7 @@ async def get_documents(
 @router.get("/{document_id}")
 async def get_document(
     document_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ) -> dict:
     """
     문서 상세 조회
@@ -86,7 +138,7 @@ async def get_document(
 @router.get("/{document_id}/status")
 async def get_document_status(
     document_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ) -> dict:
     """
     문서 처리 상태 조회
@@ -5,6 +5,7 @@ Messages Router
 """
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -36,3 +37,32 @@ async def create_message(
     result = await MessageService.create_message(db, message_data)
     return SuccessResponse(data=result)
 
+
+
+@router.post("/stream")
+async def create_message_stream(
+    message_data: MessageCreate,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    메시지 생성 (AI 응답을 Server-Sent Events로 스트리밍)
+
+    응답 토큰은 token 이벤트({"content": "..."})로 생성되는 대로 전달되고,
+    저장된 메시지 정보는 마지막 done 이벤트로 전달됩니다 (POST /api/v1/messages 응답과 같은 형식).
+
+    Args:
+        message_data: 메시지 생성 데이터
+        db: 데이터베이스 세션
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+
+    Raises:
+        HTTPException: 채팅을 찾을 수 없거나, 문서가 없거나, 문서가 준비되지 않은 경우
+    """
+    events = await MessageService.create_message_stream(db, message_data)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
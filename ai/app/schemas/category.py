@@ -61,3 +61,7 @@ class ChatSummary(CamelCaseModel):
     id: str
     title: str
     created_at: datetime
+
+
+# ChatSummary 전방 참조 해석 (model_construct 사용 시 검증을 거치지 않으므로 미리 빌드)
+CategoryDetail.model_rebuild()
@@ -4,6 +4,8 @@ Common Schemas
 공통으로 사용되는 스키마를 정의합니다.
 """
 
+from functools import lru_cache
+from fastapi import Response
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Generic, TypeVar, Optional
 from datetime import datetime
@@ -12,9 +14,10 @@ from datetime import datetime
 T = TypeVar('T')
 
 
+@lru_cache(maxsize=None)
 def to_camel(string: str) -> str:
     """
-    snake_case를 camelCase로 변환
+    snake_case를 camelCase로 변환 (필드명별 결과 캐싱)
 
     Args:
         string: snake_case 문자열
@@ -36,7 +39,8 @@ class CamelCaseModel(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
         populate_by_name=True,  # snake_case와 camelCase 모두 허용
-        from_attributes=True
+        from_attributes=True,
+        defer_build=True  # 스키마 빌드를 첫 사용 시점으로 지연 (import/시작 시간 단축)
     )
 
 
@@ -48,6 +52,41 @@ class SuccessResponse(BaseModel, Generic[T]):
     data: T
 
 
+class PaginatedResponse(BaseModel, Generic[T]):
+    """
+    목록 성공 응답 스키마 (다음 페이지 커서 포함)
+    """
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True
+    )
+
+    success: bool = True
+    data: list[T]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+
+def json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Pydantic 모델을 JSON Response로 직접 변환
+
+    response_model 검증과 jsonable_encoder를 거치지 않고
+    pydantic-core가 직렬화한 bytes를 그대로 응답합니다.
+
+    Args:
+        model: 응답 모델 (camelCase alias 적용)
+        status_code: HTTP 상태 코드
+
+    Returns:
+        Response: application/json 응답
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 class ErrorDetail(BaseModel):
     """
     에러 상세 정보
@@ -23,6 +23,24 @@ class DocumentUploadResponse(CamelCaseModel):
     created_at: datetime
 
 
+class DocumentUploadUrlRequest(CamelCaseModel):
+    """
+    서명 URL 업로드 요청 스키마
+    """
+    filename: str = Field(..., min_length=1, max_length=255, description="파일명")
+    file_size: int = Field(..., ge=0, description="파일 크기 (바이트)")
+
+
+class DocumentUploadUrlResponse(CamelCaseModel):
+    """
+    서명 URL 업로드 응답 스키마
+    """
+    id: str
+    upload_url: str
+    content_type: str
+    expires_in: int
+
+
 class DocumentResponse(CamelCaseModel):
     """
     문서 응답 스키마 (목록용)
@@ -4,14 +4,22 @@ Category Service
 카테고리 관련 비즈니스 로직
 """
 
+import logging
 from typing import Optional
-from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import String, select, func, and_
+from sqlalchemy import String, select, update, exists, func, and_, tuple_, literal, bindparam, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, ProgrammingError
+from sqlalchemy.orm import selectinload
+from asyncpg.exceptions import InvalidColumnReferenceError
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.models import generate_ulid, utc_now
 from app.models.category import Category
 from app.models.chat import Chat
+from app.models.message import Message
+from app.models.chat_document import ChatDocument
 from app.schemas.category import (
     CategoryCreate,
     CategoryUpdate,
@@ -19,16 +27,48 @@ from app.schemas.category import (
     CategoryDetail,
     ChatSummary
 )
+from app.services.rag_service import RAGService
+from app.cache import response_cache
+from app.utils.pagination import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# 목록 응답 변환용 TypeAdapter (스키마를 한 번만 빌드하여 재사용)
+_category_list_adapter = TypeAdapter(list[CategoryResponse])
+
+# 소유권 검증용 문장 (lambda_stmt로 컴파일된 SQL을 캐시하여 재사용)
+_category_by_id = lambda_stmt(
+    lambda: select(Category).where(
+        Category.id == bindparam("id"),
+        Category.deletedAt.is_(None)
+    )
+)
+_category_owned = lambda_stmt(
+    lambda: select(
+        exists().where(
+            Category.id == bindparam("id"),
+            Category.userId == bindparam("user_id"),
+            Category.deletedAt.is_(None)
+        )
+    )
+)
+
+
 class CategoryService:
     """
     카테고리 비즈니스 로직 처리 서비스
     """
 
+    # ux_categories_user_name_live 인덱스 사용 가능 여부
+    # (마이그레이션 전 DB에서는 ON CONFLICT가 실패하므로 사전 확인 경로로 전환, 프로세스 재시작 시 다시 시도)
+    _name_index_ready: bool = True
+
     @staticmethod
     async def validate_category_ownership(
         db: AsyncSession,
         category_id: str,
-        user_id: str
+        user_id: str,
+        options: tuple = ()
     ) -> Category:
         """
         카테고리 소유권 검증 (유틸리티 메서드)
@@ -37,6 +77,7 @@ class CategoryService:
             db: 데이터베이스 세션
             category_id: 카테고리 ID
             user_id: 사용자 ID
+            options: 함께 적용할 로더 옵션 (예: selectinload(Category.chats))
 
         Returns:
             Category: 검증된 카테고리 객체
@@ -44,13 +85,16 @@ class CategoryService:
         Raises:
             HTTPException: 카테고리를 찾을 수 없거나 소유자가 아닌 경우 (404)
         """
-        query = select(Category).where(
-            and_(
-                Category.id == category_id,
-                Category.deletedAt.is_(None)
+        if options:
+            query = select(Category).options(*options).where(
+                and_(
+                    Category.id == category_id,
+                    Category.deletedAt.is_(None)
+                )
             )
-        )
-        result = await db.execute(query)
+            result = await db.execute(query)
+        else:
+            result = await db.execute(_category_by_id, {"id": category_id})
         category = result.scalar_one_or_none()
 
         if not category:
@@ -67,12 +111,33 @@ class CategoryService:
 
         return category
 
+    @staticmethod
+    async def owns_category(
+        db: AsyncSession,
+        category_id: str,
+        user_id: str
+    ) -> bool:
+        """
+        카테고리 소유 여부 확인 (행을 로드하지 않는 EXISTS 쿼리)
+        카테고리 객체가 필요 없는 검증에 사용
+
+        Args:
+            db: 데이터베이스 세션
+            category_id: 카테고리 ID
+            user_id: 사용자 ID
+
+        Returns:
+            bool: 삭제되지 않은 본인 카테고리이면 True
+        """
+        return bool(await db.scalar(_category_owned, {"id": category_id, "user_id": user_id}))
+
     @staticmethod
     async def get_categories(
         db: AsyncSession,
         page: int,
         limit: int,
-        user_id: str
+        user_id: str,
+        cursor: Optional[str] = None
     ) -> list[CategoryResponse]:
         """
         카테고리 목록 조회
@@ -81,29 +146,48 @@ class CategoryService:
             db: 데이터베이스 세션
             page: 페이지 번호
             limit: 페이지당 개수
+            cursor: 다음 페이지 커서 (선택, 주어지면 page 대신 키셋 페이지네이션)
 
         Returns:
             list[CategoryResponse]: 카테고리 목록
+
+        Raises:
+            HTTPException: 커서가 잘못된 경우
         """
+        conditions = [
+            Category.deletedAt.is_(None),
+            Category.userId == user_id
+        ]
 
-        # 페이지네이션 계산
-        offset = (page - 1) * limit
+        # 페이지네이션 계산 (커서가 있으면 (createdAt, id) 키셋으로 OFFSET 없이 이어서 조회)
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            conditions.append(
+                tuple_(Category.createdAt, Category.id) < tuple_(
+                    literal(cursor_created_at, Category.createdAt.type),
+                    literal(cursor_id, Category.id.type)
+                )
+            )
+            offset = 0
+        else:
+            offset = (page - 1) * limit
 
-        # 카테고리 목록 조회 (채팅 개수 포함)
+        # 카테고리 목록 조회 (삭제되지 않은 채팅 개수를 outer join 집계로 포함)
         query = (
             select(
                 Category,
-                func.count(func.distinct(Category.chats)).label("chatCount")
+                func.count(Chat.id).label("chat_count")
             )
-            .outerjoin(Category.chats)
-            .where(
+            .outerjoin(
+                Chat,
                 and_(
-                    Category.deletedAt.is_(None),
-                    Category.userId == user_id
+                    Chat.categoryId == Category.id,
+                    Chat.deletedAt.is_(None)
                 )
             )
+            .where(and_(*conditions))
             .group_by(Category.id)
-            .order_by(Category.createdAt.desc())
+            .order_by(Category.createdAt.desc(), Category.id.desc())
             .offset(offset)
             .limit(limit)
         )
@@ -111,19 +195,105 @@ class CategoryService:
         result = await db.execute(query)
         rows = result.all()
 
-        # 응답 생성
-        return [
-            CategoryResponse(
-                id=category.id,
-                name=category.name,
-                user_id=category.userId,
-                description=category.description,
-                chat_count=chat_count,
-                created_at=category.createdAt,
-                updated_at=category.updatedAt
-            )
+        # 응답 생성 (목록 전체를 한 번의 pydantic-core 호출로 변환)
+        return _category_list_adapter.validate_python([
+            {
+                "id": category.id,
+                "name": category.name,
+                "user_id": category.userId,
+                "description": category.description,
+                "chat_count": chat_count,
+                "created_at": category.createdAt,
+                "updated_at": category.updatedAt
+            }
             for category, chat_count in rows
-        ]
+        ])
+
+    @staticmethod
+    async def _insert_category_on_conflict(
+        db: AsyncSession,
+        category_data: CategoryCreate,
+        user_id: str
+    ) -> Optional[Category]:
+        """
+        INSERT ... ON CONFLICT DO NOTHING으로 카테고리 삽입 (중복 확인과 INSERT를 한 번에)
+
+        ux_categories_user_name_live 인덱스가 없으면 사전 확인 경로로 전환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            category_data: 카테고리 생성 데이터
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[Category]: 생성된 카테고리 (같은 이름이 있으면 None)
+        """
+        insert_query = (
+            pg_insert(Category)
+            .values(
+                id=generate_ulid(),
+                name=category_data.name,
+                userId=user_id,
+                description=category_data.description
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Category.userId, Category.name],
+                index_where=Category.deletedAt.is_(None)
+            )
+            .returning(Category)
+        )
+        try:
+            # 실패해도 트랜잭션 전체가 중단되지 않도록 SAVEPOINT 안에서 실행
+            async with db.begin_nested():
+                return await db.scalar(insert_query)
+        except ProgrammingError as e:
+            # "no unique or exclusion constraint matching the ON CONFLICT specification" (42P10) 인 경우만
+            # 인덱스 없음으로 판단하고, 그 외 오류(권한, 컬럼 등)는 그대로 발생
+            if getattr(e.orig, "sqlstate", None) != InvalidColumnReferenceError.sqlstate:
+                raise
+            logger.warning(
+                "ux_categories_user_name_live index is missing, falling back to pre-check insert "
+                "(run migrations/002_indexes.sql): %s", e.orig
+            )
+            CategoryService._name_index_ready = False
+            return await CategoryService._insert_category_checked(db, category_data, user_id)
+
+    @staticmethod
+    async def _insert_category_checked(
+        db: AsyncSession,
+        category_data: CategoryCreate,
+        user_id: str
+    ) -> Optional[Category]:
+        """
+        중복 확인 후 카테고리 삽입 (유니크 인덱스가 없는 DB용)
+
+        Args:
+            db: 데이터베이스 세션
+            category_data: 카테고리 생성 데이터
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[Category]: 생성된 카테고리 (같은 이름이 있으면 None)
+        """
+        existing = await db.scalar(
+            select(exists().where(
+                Category.name == category_data.name,
+                Category.deletedAt.is_(None),
+                Category.userId == user_id
+            ))
+        )
+        if existing:
+            return None
+
+        new_category = Category(
+            name=category_data.name,
+            userId=user_id,
+            description=category_data.description
+        )
+        db.add(new_category)
+        await db.flush()
+        await db.refresh(new_category)
+        return new_category
 
     @staticmethod
     async def create_category(
@@ -144,36 +314,22 @@ class CategoryService:
         Raises:
             HTTPException: 중복된 이름이 존재하는 경우
         """
-        # 중복 확인
-        existing_query = select(Category).where(
-            and_(
-                Category.name == category_data.name,
-                Category.deletedAt.is_(None),
-                Category.userId == user_id,
-            )
-        )
-        result = await db.execute(existing_query)
-        existing = result.scalar_one_or_none()
+        if CategoryService._name_index_ready:
+            new_category = await CategoryService._insert_category_on_conflict(db, category_data, user_id)
+        else:
+            new_category = await CategoryService._insert_category_checked(db, category_data, user_id)
 
-        if existing:
+        if new_category is None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Category '{category_data.name}' already exists."
             )
 
-        # 카테고리 생성
-        new_category = Category(
-            name=category_data.name,
-            userId=user_id,
-            description=category_data.description
-        )
-
-        db.add(new_category)
         await db.commit()
-        await db.refresh(new_category)
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
 
         # 응답 생성
-        return CategoryResponse(
+        return CategoryResponse.model_construct(
             id=new_category.id,
             name=new_category.name,
             user_id=new_category.userId,
@@ -202,12 +358,14 @@ class CategoryService:
         Raises:
             HTTPException: 카테고리를 찾을 수 없는 경우
         """
-        # 카테고리 소유권 검증
-        category = await CategoryService.validate_category_ownership(db, category_id, user_id)
+        # 카테고리 소유권 검증 (채팅 목록 함께 로드)
+        category = await CategoryService.validate_category_ownership(
+            db, category_id, user_id, options=(selectinload(Category.chats),)
+        )
 
         # 채팅 목록 조회 (삭제되지 않은 것만)
         chats = [
-            ChatSummary(
+            ChatSummary.model_construct(
                 id=chat.id,
                 title=chat.title,
                 created_at=chat.createdAt
@@ -217,7 +375,7 @@ class CategoryService:
         ]
 
         # 응답 생성
-        return CategoryDetail(
+        return CategoryDetail.model_construct(
             id=category.id,
             name=category.name,
             user_id=category.userId,
@@ -280,8 +438,17 @@ class CategoryService:
                 # category 인스턴스의 field를 value로 설정
                 setattr(category, field, value)
 
-            category.updatedAt = datetime.utcnow()
-            await db.commit()
+            category.updatedAt = utc_now()
+            try:
+                await db.commit()
+            except IntegrityError:
+                # 중복 확인 이후 동시에 같은 이름이 생성된 경우 (ux_categories_user_name_live)
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Category name '{category_data.name}' already exists."
+                )
+            response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
             await db.refresh(category)
 
         # 채팅 개수 조회 (쿼리 최적화)
@@ -295,7 +462,7 @@ class CategoryService:
         chat_count = chat_count_result.scalar() or 0
 
         # 응답 생성
-        return CategoryResponse(
+        return CategoryResponse.model_construct(
             id=category.id,
             name=category.name,
             user_id=category.userId,
@@ -328,20 +495,58 @@ class CategoryService:
         # 카테고리 소유권 검증
         category = await CategoryService.validate_category_ownership(db, category_id, user_id)
 
-        now = datetime.utcnow()
+        now = utc_now()
 
         # 트랜잭션으로 카테고리와 해당 카테고리의 모든 채팅 삭제
         # Soft Delete: 카테고리
         category.deletedAt = now
 
-        # Soft Delete: 카테고리에 속한 모든 채팅 (삭제되지 않은 채팅만)
-        deleted_chat_count = 0
-        for chat in category.chats:
-            if chat.deletedAt is None:
-                chat.deletedAt = now
-                deleted_chat_count += 1
+        # Soft Delete: 카테고리에 속한 모든 채팅 (삭제되지 않은 채팅만, 한 번의 UPDATE)
+        chat_result = await db.execute(
+            update(Chat)
+            .where(
+                and_(
+                    Chat.categoryId == category_id,
+                    Chat.deletedAt.is_(None)
+                )
+            )
+            .values(deletedAt=now)
+            .returning(Chat.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_chat_ids = chat_result.scalars().all()
+        deleted_chat_count = len(deleted_chat_ids)
+
+        if deleted_chat_ids:
+            # 삭제된 채팅의 메시지 soft delete
+            await db.execute(
+                update(Message)
+                .where(
+                    and_(
+                        Message.chatId.in_(deleted_chat_ids),
+                        Message.deletedAt.is_(None)
+                    )
+                )
+                .values(deletedAt=now)
+                .execution_options(synchronize_session=False)
+            )
+
+            # 삭제된 채팅의 ChatDocument soft delete
+            await db.execute(
+                update(ChatDocument)
+                .where(
+                    and_(
+                        ChatDocument.chatId.in_(deleted_chat_ids),
+                        ChatDocument.deletedAt.is_(None)
+                    )
+                )
+                .values(deletedAt=now)
+                .execution_options(synchronize_session=False)
+            )
 
         await db.commit()
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
+        await RAGService.delete_conversations(deleted_chat_ids)  # 삭제된 채팅의 대화 턴 벡터 삭제
 
         # 응답 생성
         return {
@@ -7,9 +7,12 @@ Chat Service
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, update, exists, func, and_, tuple_, literal, bindparam, lambda_stmt
+from sqlalchemy.orm import joinedload, selectinload, contains_eager
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.models import normalize_ulid, utc_now
 from app.models.chat import Chat
 from app.models.category import Category
 from app.models.message import Message
@@ -22,6 +25,29 @@ from app.schemas.chat import (
     DocumentSimple
 )
 from app.services.category_service import CategoryService
+from app.services.rag_service import RAGService
+from app.utils.pagination import decode_cursor
+from app.cache import response_cache
+
+# 목록 응답 변환용 TypeAdapter (스키마를 한 번만 빌드하여 재사용)
+_chat_list_adapter = TypeAdapter(list[ChatResponse])
+
+# 소유권 검증용 문장 (lambda_stmt로 컴파일된 SQL을 캐시하여 재사용)
+_chat_by_id = lambda_stmt(
+    lambda: select(Chat).where(
+        Chat.id == bindparam("id"),
+        Chat.deletedAt.is_(None)
+    )
+)
+_chat_owned = lambda_stmt(
+    lambda: select(
+        exists().where(
+            Chat.id == bindparam("id"),
+            Chat.userId == bindparam("user_id"),
+            Chat.deletedAt.is_(None)
+        )
+    )
+)
 
 
 class ChatService:
@@ -35,7 +61,8 @@ class ChatService:
     async def validate_chat_ownership(
         db: AsyncSession,
         chat_id: str,
-        user_id: str
+        user_id: str,
+        options: tuple = ()
     ) -> Chat:
         """
         채팅 소유권 검증 (유틸리티 메서드)
@@ -44,6 +71,7 @@ class ChatService:
             db: 데이터베이스 세션
             chat_id: 채팅 ID
             user_id: 사용자 ID
+            options: 함께 적용할 로더 옵션 (예: joinedload(Chat.category))
 
         Returns:
             Chat: 검증된 채팅 객체
@@ -51,13 +79,16 @@ class ChatService:
         Raises:
             HTTPException: 채팅을 찾을 수 없거나 소유자가 아닌 경우 (404)
         """
-        query = select(Chat).where(
-            and_(
-                Chat.id == chat_id,
-                Chat.deletedAt.is_(None)
+        if options:
+            query = select(Chat).options(*options).where(
+                and_(
+                    Chat.id == chat_id,
+                    Chat.deletedAt.is_(None)
+                )
             )
-        )
-        result = await db.execute(query)
+            result = await db.execute(query)
+        else:
+            result = await db.execute(_chat_by_id, {"id": chat_id})
         chat = result.scalar_one_or_none()
 
         if not chat:
@@ -74,13 +105,65 @@ class ChatService:
 
         return chat
 
+    @staticmethod
+    async def owns_chat(
+        db: AsyncSession,
+        chat_id: str,
+        user_id: str
+    ) -> bool:
+        """
+        채팅 소유 여부 확인 (행을 로드하지 않는 EXISTS 쿼리)
+        채팅 객체가 필요 없는 검증에 사용
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+            user_id: 사용자 ID
+
+        Returns:
+            bool: 삭제되지 않은 본인 채팅이면 True
+        """
+        return bool(await db.scalar(_chat_owned, {"id": chat_id, "user_id": user_id}))
+
+    @staticmethod
+    async def _get_chat_stats(
+        db: AsyncSession,
+        chat_id: str
+    ) -> tuple[int, int, Optional[datetime]]:
+        """
+        채팅의 document_count, message_count, last_message_at을 한 번의 쿼리로 조회
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+
+        Returns:
+            tuple: (document_count, message_count, last_message_at)
+        """
+        live_documents = and_(
+            ChatDocument.chatId == chat_id,
+            ChatDocument.deletedAt.is_(None)
+        )
+        live_messages = and_(
+            Message.chatId == chat_id,
+            Message.deletedAt.is_(None)
+        )
+        stats_query = select(
+            select(func.count(ChatDocument.id)).where(live_documents).scalar_subquery(),
+            select(func.count(Message.id)).where(live_messages).scalar_subquery(),
+            select(func.max(Message.createdAt)).where(live_messages).scalar_subquery()
+        )
+        document_count, message_count, last_message_at = (await db.execute(stats_query)).one()
+        return document_count or 0, message_count or 0, last_message_at
+
     @staticmethod
     async def get_chats(
         db: AsyncSession,
         user_id: str,
         page: int,
         limit: int,
-        category_id: Optional[str] = None
+        category_id: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> list[ChatResponse]:
         """
         채팅 목록 조회
@@ -92,85 +175,120 @@ class ChatService:
             page: 페이지 번호
             limit: 페이지당 개수
             category_id: 카테고리 ID (선택)
+            cursor: 다음 페이지 커서 (선택, 주어지면 page 대신 키셋 페이지네이션)
 
         Returns:
             list[ChatResponse]: 채팅 목록
+
+        Raises:
+            HTTPException: 카테고리를 찾을 수 없거나 커서가 잘못된 경우
         """
-        # 페이지네이션 계산
-        offset = (page - 1) * limit
+        conditions = [
+            Chat.deletedAt.is_(None),
+            Chat.userId == user_id
+        ]
+        # category_id가 주어지면 필터링
+        if category_id:
+            conditions.append(Chat.categoryId == category_id)
+
+        # 페이지네이션 계산 (커서가 있으면 (updatedAt, id) 키셋으로 OFFSET 없이 이어서 조회)
+        if cursor:
+            cursor_updated_at, cursor_id = decode_cursor(cursor)
+            conditions.append(
+                tuple_(Chat.updatedAt, Chat.id) < tuple_(
+                    literal(cursor_updated_at, Chat.updatedAt.type),
+                    literal(cursor_id, Chat.id.type)
+                )
+            )
+            offset = 0
+        else:
+            offset = (page - 1) * limit
 
         # 카테고리 필터링이 있다면 소유권 검증
-        if category_id:
-            await CategoryService.validate_category_ownership(db, category_id, user_id)
+        if category_id and not await CategoryService.owns_category(db, category_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found."
+            )
+
+        # 페이지에 해당하는 채팅 ID만 먼저 선택 (userId, updatedAt, id 인덱스 사용)
+        page_subquery = (
+            select(Chat.id)
+            .where(and_(*conditions))
+            .order_by(Chat.updatedAt.desc(), Chat.id.desc())
+            .offset(offset)
+            .limit(limit)
+            .subquery()
+        )
+        page_chat_ids = select(page_subquery.c.id)
 
-        # 서브쿼리: document_count
-        document_count_subquery = (
-            select(func.count(ChatDocument.id))
+        # 집계: 페이지 채팅들의 document_count (GROUP BY 한 번)
+        document_counts = (
+            select(
+                ChatDocument.chatId.label("chat_id"),
+                func.count(ChatDocument.id).label("document_count")
+            )
             .where(
                 and_(
-                    ChatDocument.chatId == Chat.id,
+                    ChatDocument.chatId.in_(page_chat_ids),
                     ChatDocument.deletedAt.is_(None)
                 )
             )
-            .correlate(Chat)
-            .scalar_subquery()
+            .group_by(ChatDocument.chatId)
+            .subquery()
         )
 
-        # 서브쿼리: last_message_at
-        last_message_at_subquery = (
-            select(func.max(Message.createdAt))
+        # 집계: 페이지 채팅들의 last_message_at (GROUP BY 한 번)
+        last_messages = (
+            select(
+                Message.chatId.label("chat_id"),
+                func.max(Message.createdAt).label("last_message_at")
+            )
             .where(
                 and_(
-                    Message.chatId == Chat.id,
+                    Message.chatId.in_(page_chat_ids),
                     Message.deletedAt.is_(None)
                 )
             )
-            .correlate(Chat)
-            .scalar_subquery()
+            .group_by(Message.chatId)
+            .subquery()
         )
 
-        # 메인 쿼리
+        # 메인 쿼리: 채팅 + 카테고리 + 집계를 한 번에 조회
         query = (
             select(
                 Chat,
-                document_count_subquery.label("document_count"),
-                last_message_at_subquery.label("last_message_at")
+                document_counts.c.document_count,
+                last_messages.c.last_message_at
             )
-            .where(
-                and_(
-                    Chat.deletedAt.is_(None),
-                    Chat.userId == user_id,
-                    # category_id가 주어지면 필터링
-                    Chat.categoryId == category_id if category_id else True
-                )
-            )
-            .order_by(Chat.updatedAt.desc())
-            .offset(offset)
-            .limit(limit)
+            .join(page_subquery, page_subquery.c.id == Chat.id)
+            .outerjoin(Chat.category)
+            .outerjoin(document_counts, document_counts.c.chat_id == Chat.id)
+            .outerjoin(last_messages, last_messages.c.chat_id == Chat.id)
+            .options(contains_eager(Chat.category))
+            .order_by(Chat.updatedAt.desc(), Chat.id.desc())
         )
 
-
-
         result = await db.execute(query)
         rows = result.all()
 
-        # 응답 생성
-        return [
-            ChatResponse(
-                id=chat.id,
-                title=chat.title,
-                user_id=chat.userId,
-                category=CategorySimple(
-                    id=chat.category.id,
-                    name=chat.category.name,
-                ) if chat.category else None,
-                document_count=document_count or 0,
-                last_message_at=last_message_at,
-                created_at=chat.createdAt,
-                updated_at=chat.updatedAt
-            )
+        # 응답 생성 (목록 전체를 한 번의 pydantic-core 호출로 변환)
+        return _chat_list_adapter.validate_python([
+            {
+                "id": chat.id,
+                "title": chat.title,
+                "user_id": chat.userId,
+                "category": {
+                    "id": chat.category.id,
+                    "name": chat.category.name
+                } if chat.category else None,
+                "document_count": document_count or 0,
+                "last_message_at": last_message_at,
+                "created_at": chat.createdAt,
+                "updated_at": chat.updatedAt
+            }
             for chat, document_count, last_message_at in rows
-        ]
+        ])
 
     @staticmethod
     async def get_chat_by_id(
@@ -193,15 +311,21 @@ class ChatService:
         Raises:
             HTTPException: 채팅을 찾을 수 없거나 권한이 없는 경우
         """
-        # 채팅 소유권 검증
-        chat = await ChatService.validate_chat_ownership(db, chat_id, user_id)
+        # 채팅 소유권 검증 (카테고리, 연결 문서 함께 로드)
+        chat = await ChatService.validate_chat_ownership(
+            db, chat_id, user_id,
+            options=(
+                joinedload(Chat.category),
+                selectinload(Chat.chatDocuments).joinedload(ChatDocument.document)
+            )
+        )
 
         # 문서 목록 조회 (ChatDocument의 addedAt 포함)
         documents = []
         for chat_doc in chat.chatDocuments:
             if chat_doc.deletedAt is None and chat_doc.document.deletedAt is None:
                 documents.append(
-                    DocumentSimple(
+                    DocumentSimple.model_construct(
                         id=chat_doc.document.id,
                         filename=chat_doc.document.filename,
                         file_type=chat_doc.document.fileType.value,
@@ -222,11 +346,11 @@ class ChatService:
         last_message_at = last_message_at_result.scalar()
 
         # 응답 생성
-        return ChatDetail(
+        return ChatDetail.model_construct(
             id=chat.id,
             title=chat.title,
             user_id=chat.userId,
-            category=CategorySimple(
+            category=CategorySimple.model_construct(
                 id=chat.category.id,
                 name=chat.category.name
             ) if chat.category else None,
@@ -259,12 +383,19 @@ class ChatService:
         Raises:
             HTTPException: 채팅을 찾을 수 없거나 권한이 없는 경우, 카테고리를 찾을 수 없는 경우
         """
-        # 채팅 소유권 검증
-        chat = await ChatService.validate_chat_ownership(db, chat_id, user_id)
+        # 채팅 소유권 검증 (카테고리 함께 로드)
+        chat = await ChatService.validate_chat_ownership(
+            db, chat_id, user_id, options=(joinedload(Chat.category),)
+        )
 
         # category_id가 있다면 카테고리 소유권 검증
-        if chat_data.category_id is not None:
-            await CategoryService.validate_category_ownership(db, chat_data.category_id, user_id)
+        if chat_data.category_id is not None and not await CategoryService.owns_category(
+            db, chat_data.category_id, user_id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found."
+            )
 
         # .model_dump(exclude_unset=True)로 Pydantic 모델에서 설정된 필드만 딕셔너리로 반환
         update_data = chat_data.model_dump(exclude_unset=True)
@@ -281,44 +412,20 @@ class ChatService:
                 model_field = field_mapping.get(field, field)
                 setattr(chat, model_field, value)
 
-            chat.updatedAt = datetime.utcnow()
+            chat.updatedAt = utc_now()
             await db.commit()
+            response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
             await db.refresh(chat)
 
-        # document_count, message_count, last_message_at 조회
-        document_count_query = select(func.count(ChatDocument.id)).where(
-            and_(
-                ChatDocument.chatId == chat_id,
-                ChatDocument.deletedAt.is_(None)
-            )
-        )
-        document_count_result = await db.execute(document_count_query)
-        document_count = document_count_result.scalar() or 0
-
-        message_count_query = select(func.count(Message.id)).where(
-            and_(
-                Message.chatId == chat_id,
-                Message.deletedAt.is_(None)
-            )
-        )
-        message_count_result = await db.execute(message_count_query)
-        message_count = message_count_result.scalar() or 0
-
-        last_message_at_query = select(func.max(Message.createdAt)).where(
-            and_(
-                Message.chatId == chat_id,
-                Message.deletedAt.is_(None)
-            )
-        )
-        last_message_at_result = await db.execute(last_message_at_query)
-        last_message_at = last_message_at_result.scalar()
+        # document_count, message_count, last_message_at 조회 (한 번의 쿼리)
+        document_count, message_count, last_message_at = await ChatService._get_chat_stats(db, chat_id)
 
         # 응답 생성
-        return ChatResponse(
+        return ChatResponse.model_construct(
             id=chat.id,
             title=chat.title,
             user_id=chat.userId,
-            category=CategorySimple(
+            category=CategorySimple.model_construct(
                 id=chat.category.id,
                 name=chat.category.name
             ) if chat.category else None,
@@ -354,40 +461,16 @@ class ChatService:
 
         # 카테고리 해제
         chat.categoryId = None
-        chat.updatedAt = datetime.utcnow()
+        chat.updatedAt = utc_now()
         await db.commit()
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
         await db.refresh(chat)
 
-        # document_count, message_count, last_message_at 조회
-        document_count_query = select(func.count(ChatDocument.id)).where(
-            and_(
-                ChatDocument.chatId == chat_id,
-                ChatDocument.deletedAt.is_(None)
-            )
-        )
-        document_count_result = await db.execute(document_count_query)
-        document_count = document_count_result.scalar() or 0
-
-        message_count_query = select(func.count(Message.id)).where(
-            and_(
-                Message.chatId == chat_id,
-                Message.deletedAt.is_(None)
-            )
-        )
-        message_count_result = await db.execute(message_count_query)
-        message_count = message_count_result.scalar() or 0
-
-        last_message_at_query = select(func.max(Message.createdAt)).where(
-            and_(
-                Message.chatId == chat_id,
-                Message.deletedAt.is_(None)
-            )
-        )
-        last_message_at_result = await db.execute(last_message_at_query)
-        last_message_at = last_message_at_result.scalar()
+        # document_count, message_count, last_message_at 조회 (한 번의 쿼리)
+        document_count, message_count, last_message_at = await ChatService._get_chat_stats(db, chat_id)
 
         # 응답 생성
-        return ChatResponse(
+        return ChatResponse.model_construct(
             id=chat.id,
             title=chat.title,
             user_id=chat.userId,
@@ -422,45 +505,51 @@ class ChatService:
         # 채팅 소유권 검증
         chat = await ChatService.validate_chat_ownership(db, chat_id, user_id)
 
-        # 삭제 전 개수 확인
-        message_count_query = select(func.count(Message.id)).where(
-            and_(
-                Message.chatId == chat_id,
-                Message.deletedAt.is_(None)
+        now = utc_now()
+
+        # Soft Delete
+        chat.deletedAt = now
+
+        # 관련 메시지 soft delete (한 번의 UPDATE, 영향받은 행 수 = 삭제된 메시지 수)
+        message_result = await db.execute(
+            update(Message)
+            .where(
+                and_(
+                    Message.chatId == chat_id,
+                    Message.deletedAt.is_(None)
+                )
             )
+            .values(deletedAt=now)
+            .execution_options(synchronize_session=False)
         )
-        message_count_result = await db.execute(message_count_query)
-        deleted_messages = message_count_result.scalar() or 0
+        deleted_messages = message_result.rowcount
 
-        document_count_query = select(func.count(ChatDocument.id)).where(
-            and_(
-                ChatDocument.chatId == chat_id,
-                ChatDocument.deletedAt.is_(None)
+        # 관련 ChatDocument soft delete (한 번의 UPDATE, 영향받은 행 수 = 연결 해제된 문서 수)
+        chat_doc_result = await db.execute(
+            update(ChatDocument)
+            .where(
+                and_(
+                    ChatDocument.chatId == chat_id,
+                    ChatDocument.deletedAt.is_(None)
+                )
             )
+            .values(deletedAt=now)
+            .execution_options(synchronize_session=False)
         )
-        document_count_result = await db.execute(document_count_query)
-        affected_documents = document_count_result.scalar() or 0
-
-        now = datetime.utcnow()
-
-        # Soft Delete (CASCADE로 Message, ChatDocument도 자동 처리됨)
-        chat.deletedAt = now
-
-        # 관련 메시지 soft delete
-        for message in chat.messages:
-            if message.deletedAt is None:
-                message.deletedAt = now
-
-        # 관련 ChatDocument soft delete
-        for chat_doc in chat.chatDocuments:
-            if chat_doc.deletedAt is None:
-                chat_doc.deletedAt = now
+        affected_documents = chat_doc_result.rowcount
 
         # 카테고리가 있다면 updatedAt 업데이트
-        if chat.categoryId and chat.category:
-            chat.category.updatedAt = now
+        if chat.categoryId:
+            await db.execute(
+                update(Category)
+                .where(Category.id == chat.categoryId)
+                .values(updatedAt=now)
+                .execution_options(synchronize_session=False)
+            )
 
         await db.commit()
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
+        await RAGService.delete_conversations([chat.id])  # 대화 턴 벡터 삭제
 
         # 응답 생성
         return {
@@ -491,74 +580,89 @@ class ChatService:
         Raises:
             HTTPException: 채팅을 찾을 수 없거나 권한이 없는 경우
         """
+        now = utc_now()
+
         if not chat_ids:
             return {
                 "deleted_count": 0,
                 "deleted_chat_ids": [],
-                "deleted_at": datetime.utcnow().isoformat(),
+                "deleted_at": now.isoformat(),
                 "total_deleted_messages": 0,
                 "total_affected_documents": 0
             }
 
-        now = datetime.utcnow()
-        deleted_chat_ids = []
+        # 소유한(삭제되지 않은) 채팅만 한 번의 UPDATE로 soft delete
+        # 권한이 없거나 존재하지 않는 채팅은 조건에서 걸러져 무시됨
+        chat_update = (
+            update(Chat)
+            .where(
+                and_(
+                    Chat.id.in_(chat_ids),
+                    Chat.userId == user_id,
+                    Chat.deletedAt.is_(None)
+                )
+            )
+            .values(deletedAt=now)
+            .returning(Chat.id, Chat.categoryId)
+            .execution_options(synchronize_session=False)
+        )
+        chat_result = await db.execute(chat_update)
+        deleted_rows = chat_result.all()
+
+        # 요청 순서대로 삭제된 채팅 ID 정리 (중복 제거)
+        deleted_id_set = {chat_id for chat_id, _ in deleted_rows}
+        deleted_chat_ids = [
+            chat_id for chat_id in dict.fromkeys(normalize_ulid(chat_id) for chat_id in chat_ids)
+            if chat_id in deleted_id_set
+        ]
+
         total_deleted_messages = 0
         total_affected_documents = 0
-        updated_category_ids = set()
-
-        # 각 채팅에 대해 소유권 검증 및 삭제
-        for chat_id in chat_ids:
-            try:
-                # 채팅 소유권 검증
-                chat = await ChatService.validate_chat_ownership(db, chat_id, user_id)
 
-                # 삭제 전 개수 확인
-                message_count_query = select(func.count(Message.id)).where(
+        if deleted_chat_ids:
+            # 관련 메시지 soft delete
+            message_result = await db.execute(
+                update(Message)
+                .where(
                     and_(
-                        Message.chatId == chat_id,
+                        Message.chatId.in_(deleted_chat_ids),
                         Message.deletedAt.is_(None)
                     )
                 )
-                message_count_result = await db.execute(message_count_query)
-                deleted_messages = message_count_result.scalar() or 0
-                total_deleted_messages += deleted_messages
+                .values(deletedAt=now)
+                .execution_options(synchronize_session=False)
+            )
+            total_deleted_messages = message_result.rowcount
 
-                document_count_query = select(func.count(ChatDocument.id)).where(
+            # 관련 ChatDocument soft delete
+            chat_doc_result = await db.execute(
+                update(ChatDocument)
+                .where(
                     and_(
-                        ChatDocument.chatId == chat_id,
+                        ChatDocument.chatId.in_(deleted_chat_ids),
                         ChatDocument.deletedAt.is_(None)
                     )
                 )
-                document_count_result = await db.execute(document_count_query)
-                affected_documents = document_count_result.scalar() or 0
-                total_affected_documents += affected_documents
-
-                # Soft Delete
-                chat.deletedAt = now
-
-                # 관련 메시지 soft delete
-                for message in chat.messages:
-                    if message.deletedAt is None:
-                        message.deletedAt = now
-
-                # 관련 ChatDocument soft delete
-                for chat_doc in chat.chatDocuments:
-                    if chat_doc.deletedAt is None:
-                        chat_doc.deletedAt = now
-
-                # 카테고리가 있다면 updatedAt 업데이트 (중복 방지)
-                if chat.categoryId and chat.category:
-                    if chat.categoryId not in updated_category_ids:
-                        chat.category.updatedAt = now
-                        updated_category_ids.add(chat.categoryId)
-
-                deleted_chat_ids.append(str(chat_id))
+                .values(deletedAt=now)
+                .execution_options(synchronize_session=False)
+            )
+            total_affected_documents = chat_doc_result.rowcount
 
-            except HTTPException:
-                # 권한이 없거나 존재하지 않는 채팅은 무시
-                continue
+            # 카테고리가 있다면 updatedAt 업데이트
+            updated_category_ids = {
+                category_id for _, category_id in deleted_rows if category_id
+            }
+            if updated_category_ids:
+                await db.execute(
+                    update(Category)
+                    .where(Category.id.in_(updated_category_ids))
+                    .values(updatedAt=now)
+                    .execution_options(synchronize_session=False)
+                )
 
         await db.commit()
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
+        await RAGService.delete_conversations(deleted_chat_ids)  # 대화 턴 벡터 삭제
 
         # 응답 생성
         return {
@@ -4,21 +4,174 @@ Document Service
 문서 관련 비즈니스 로직
 """
 
+import io
 import os
+import logging
+import math
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from fastapi import HTTPException, status, UploadFile, BackgroundTasks
+from starlette.concurrency import run_in_threadpool
 from pypdf import PdfReader
+import pypdfium2 as pdfium
 import httpx
 
 from app.models.document import Document, FileType, DocumentStatus
-from app.schemas.document import DocumentUploadResponse
+from app.schemas.document import DocumentUploadResponse, DocumentUploadUrlRequest, DocumentUploadUrlResponse
 from app.utils.gcs_upload import gcs_uploader
 from app.services.rag_service import RAGService
 from app.config import settings
+from app.database import AsyncSessionLocal
+from app.cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+
+# PDF 텍스트 추출용 프로세스 풀 (CPU 바운드 작업, 첫 사용 시 생성)
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+# 현재 프로세스에서 실행하는 PDFium 호출 전용 단일 스레드
+# PDFium(pypdfium2)은 서로 다른 문서라도 여러 스레드에서 동시에 호출하면 안전하지 않으므로,
+# 동시에 처리되는 작업(arq max_jobs, BackgroundTasks)의 PDFium 호출을 한 스레드로 직렬화
+_pdfium_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdfium")
+
+
+def _pdf_worker_count() -> int:
+    """
+    PDF 추출 프로세스 수 (설정값과 CPU 수 중 작은 값)
+
+    Returns:
+        int: 프로세스 수
+    """
+    return max(1, min(settings.PDF_PROCESS_WORKERS, os.cpu_count() or 1))
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    """
+    PDF 텍스트 추출용 프로세스 풀 반환 (지연 생성)
+
+    이벤트 루프/스레드/DB 커넥션을 가진 부모 프로세스를 fork하지 않도록
+    forkserver(지원되지 않으면 spawn)로 자식 프로세스를 만듭니다.
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 풀
+    """
+    global _pdf_executor
+    if _pdf_executor is None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=_pdf_worker_count(),
+            mp_context=multiprocessing.get_context(method)
+        )
+    return _pdf_executor
+
+
+def shutdown_pdf_executor() -> None:
+    """
+    PDF 텍스트 추출용 프로세스 풀 종료 (서버/워커 종료 시 호출)
+
+    대기 중인 작업은 취소하고 자식 프로세스가 종료될 때까지 기다립니다.
+    """
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=True, cancel_futures=True)
+        _pdf_executor = None
+
+
+async def _run_pdf_in_thread(backend: str, func, *args):
+    """
+    PDF 파싱 함수를 이벤트 루프 밖의 스레드에서 실행
+
+    pdfium 백엔드는 전용 단일 스레드에서, pypdf 백엔드는 공용 스레드풀에서 실행합니다.
+
+    Args:
+        backend: 추출 백엔드 ("pdfium" 또는 "pypdf")
+        func: 실행할 동기 함수
+        *args: 함수 인자
+
+    Returns:
+        func의 반환값
+    """
+    if backend == "pdfium":
+        return await asyncio.get_running_loop().run_in_executor(_pdfium_executor, func, *args)
+    return await run_in_threadpool(func, *args)
+
+
+def _count_pdf_pages(pdf_bytes: bytes, backend: str) -> int:
+    """
+    PDF 페이지 수 조회
+
+    Args:
+        pdf_bytes: PDF 파일 내용
+        backend: 추출 백엔드 ("pdfium" 또는 "pypdf")
+
+    Returns:
+        int: 페이지 수
+    """
+    if backend == "pdfium":
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    return len(PdfReader(io.BytesIO(pdf_bytes)).pages)
+
+
+def _extract_pypdf_page_text(page) -> str:
+    """
+    pypdf 페이지 텍스트 추출 (텍스트 객체가 없는 페이지는 파싱 생략)
+
+    Args:
+        page: pypdf 페이지 객체
+
+    Returns:
+        str: 페이지 텍스트 (없으면 빈 문자열)
+    """
+    contents = page.get_contents()
+    # 텍스트는 항상 BT ... ET 블록 안에 그려지므로, BT가 없으면(스캔 이미지, 도형 위주 페이지)
+    # 수 MB의 그래픽 연산자를 해석하지 않고 바로 건너뜀
+    if contents is None or b"BT" not in contents.get_data():
+        return ""
+    return page.extract_text() or ""
+
+
+def _extract_pdf_page_range(pdf_bytes: bytes, start: int, stop: int, backend: str) -> str:
+    """
+    PDF의 [start, stop) 페이지 텍스트 추출 (프로세스 풀 워커에서 실행)
+
+    Args:
+        pdf_bytes: PDF 파일 내용
+        start: 시작 페이지 인덱스
+        stop: 끝 페이지 인덱스 (미포함)
+        backend: 추출 백엔드 ("pdfium" 또는 "pypdf")
+
+    Returns:
+        str: 페이지별 텍스트를 줄바꿈으로 이은 문자열
+    """
+    if backend != "pdfium":
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        return "\n".join(_extract_pypdf_page_text(reader.pages[i]) for i in range(start, stop))
+
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        parts = []
+        for i in range(start, stop):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                # 글자가 없는 페이지(스캔 이미지 등)는 텍스트 추출 생략
+                parts.append(textpage.get_text_range() if textpage.count_chars() else "")
+            finally:
+                textpage.close()
+                page.close()
+        return "\n".join(parts)
+    finally:
+        pdf.close()
 
 
 class DocumentService:
@@ -30,6 +183,9 @@ class DocumentService:
     ALLOWED_EXTENSIONS = {"pdf", "md", "txt"}
     MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 52428800))  # 50MB
 
+    # 프로세스 하나가 맡을 최소 페이지 수 (작은 PDF는 프로세스 전송 비용이 더 큼)
+    PDF_MIN_PAGES_PER_WORKER = 10
+
     @staticmethod
     async def _extract_text_from_file(file_path: str, file_type: FileType) -> str:
         """
@@ -45,32 +201,39 @@ class DocumentService:
         Raises:
             Exception: 텍스트 추출 실패 시
         """
-        # GCS에서 파일 다운로드 (서비스 계정 인증 사용)
-        from google.cloud import storage
-
-        # URL에서 blob 이름 추출
-        # https://storage.googleapis.com/bucket-name/user-documents/uuid.pdf
-        # -> user-documents/uuid.pdf
-        bucket_name = settings.GCP_BUCKET_NAME
-        blob_name = file_path.split(f"{bucket_name}/")[-1]
-
-        # GCS 클라이언트로 파일 다운로드
-        client = storage.Client.from_service_account_json(settings.GOOGLE_APPLICATION_CREDENTIALS)
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        file_content = blob.download_as_bytes()
+        # GCS에서 파일 다운로드 (업로드와 같은 클라이언트/버킷 재사용)
+        file_content = await gcs_uploader.download_document(file_path)
 
         # 파일 타입별 텍스트 추출
         if file_type == FileType.PDF:
-            # PDF 파일 처리
-            import io
-            pdf_file = io.BytesIO(file_content)
-            reader = PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            # PDF 파일 처리 (페이지 구간별로 나누어 프로세스 풀에서 병렬 추출)
+            # 파싱은 동기 CPU 작업이므로 이벤트 루프 밖(스레드/프로세스)에서 실행
+            backend = settings.PDF_BACKEND
+            page_count = await _run_pdf_in_thread(backend, _count_pdf_pages, file_content, backend)
+            workers = min(
+                _pdf_worker_count(),
+                page_count // DocumentService.PDF_MIN_PAGES_PER_WORKER
+            )
+            if workers <= 1 or not settings.PDF_USE_PROCESS_POOL:
+                text = await _run_pdf_in_thread(
+                    backend, _extract_pdf_page_range, file_content, 0, page_count, backend
+                )
+                return text.strip()
+
+            step = math.ceil(page_count / workers)
+            loop = asyncio.get_running_loop()
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    _get_pdf_executor(),
+                    _extract_pdf_page_range,
+                    file_content,
+                    start,
+                    min(start + step, page_count),
+                    backend
+                )
+                for start in range(0, page_count, step)
+            ))
+            return "\n".join(parts).strip()
 
         elif file_type == FileType.MARKDOWN or file_type == FileType.TEXT:
             # Markdown 또는 Text 파일 처리
@@ -80,25 +243,20 @@ class DocumentService:
             raise ValueError(f"Unsupported file type: {file_type}")
 
     @staticmethod
-    async def _process_document_background(document_id: str, db_url: str):
+    async def _process_document_background(
+        document_id: str,
+        final_attempt: bool = True
+    ):
         """
         백그라운드에서 문서 처리 (텍스트 추출, 청킹, 임베딩, ChromaDB 저장)
 
         Args:
             document_id: 문서 ID
-            db_url: 데이터베이스 URL
+            final_attempt: 마지막 시도 여부 (False면 실패 시 FAILED로 바꾸지 않고 예외를 다시 발생시켜 재시도)
         """
-        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-        from sqlalchemy.orm import sessionmaker
-
-        # postgresql:// → postgresql+asyncpg:// 변환
-        async_db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-
-        # 새로운 DB 세션 생성 (백그라운드 태스크용)
-        engine = create_async_engine(async_db_url, echo=False)
-        async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-        async with async_session() as session:
+        # 앱과 같은 엔진/커넥션 풀을 쓰는 세션 팩토리 재사용 (작업마다 엔진을 만들지 않음)
+        document = None
+        async with AsyncSessionLocal() as session:
             try:
                 # 문서 조회
                 doc_query = select(Document).where(Document.id == document_id)
@@ -106,11 +264,11 @@ class DocumentService:
                 document = result.scalar_one_or_none()
 
                 if not document:
-                    print(f"[ERROR] Document {document_id} not found")
+                    logger.error("Document %s not found", document_id)
                     return
 
                 # 1. 텍스트 추출
-                print(f"[INFO] Extracting text from document {document_id}...")
+                logger.info("Extracting text from document %s...", document_id)
                 text = await DocumentService._extract_text_from_file(
                     document.filePath,
                     document.fileType
@@ -120,7 +278,7 @@ class DocumentService:
                     raise ValueError("Extracted text is empty")
 
                 # 2. ChromaDB에 저장 (청킹 및 임베딩은 RAGService에서 자동 처리)
-                print(f"[INFO] Adding document {document_id} to vectorstore...")
+                logger.info("Adding document %s to vectorstore...", document_id)
                 chunk_count = await RAGService.add_document_to_vectorstore(
                     document_id=document_id,
                     text=text,
@@ -134,64 +292,176 @@ class DocumentService:
                 document.status = DocumentStatus.COMPLETED
                 document.chunkCount = chunk_count
                 await session.commit()
+                response_cache.invalidate_user(document.userId)  # 조회 캐시 무효화 (문서 상태 변경)
 
-                print(f"[SUCCESS] Document {document_id} processed successfully ({chunk_count} chunks)")
+                logger.info("Document %s processed successfully (%d chunks)", document_id, chunk_count)
 
             except Exception as e:
-                print(f"[ERROR] Failed to process document {document_id}: {str(e)}")
+                logger.error("Failed to process document %s: %s", document_id, e)
+                # 재시도가 남아 있으면 상태를 유지하고 작업 큐에 실패를 알림
+                if not final_attempt:
+                    raise
                 # 실패 시 상태 업데이트
                 if document:
                     document.status = DocumentStatus.FAILED
                     await session.commit()
-            finally:
-                await engine.dispose()
+                    response_cache.invalidate_user(document.userId)  # 조회 캐시 무효화 (문서 상태 변경)
+
+            except BaseException:
+                # 작업 시간 초과(job_timeout) / 워커 종료로 취소된 경우에도 마지막 시도라면
+                # 문서가 PROCESSING으로 남지 않도록 새 세션에서 FAILED로 표시한 뒤 다시 발생
+                if final_attempt and document:
+                    logger.error("Processing of document %s was cancelled", document_id)
+                    await asyncio.shield(asyncio.ensure_future(
+                        DocumentService._mark_document_failed(document_id, document.userId)
+                    ))
+                raise
 
     @staticmethod
-    async def upload_document(
-        db: AsyncSession,
-        file: UploadFile,
-        user_id: str,
-        background_tasks: Optional[BackgroundTasks] = None
-    ) -> DocumentUploadResponse:
+    async def _mark_document_failed(document_id: str, user_id: str) -> None:
         """
-        문서 업로드 및 처리 시작
+        처리 중인 문서를 FAILED로 표시 (취소된 처리 작업의 세션과 별개로 실행)
 
         Args:
-            db: 데이터베이스 세션
-            file: 업로드 파일
-            user_id: 사용자 ID
+            document_id: 문서 ID
+            user_id: 문서 소유자 ID (조회 캐시 무효화용)
+        """
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    update(Document)
+                    .where(Document.id == document_id, Document.status == DocumentStatus.PROCESSING)
+                    .values(status=DocumentStatus.FAILED)
+                )
+                await session.commit()
+            response_cache.invalidate_user(user_id)  # 조회 캐시 무효화 (문서 상태 변경)
+        except Exception as e:
+            logger.error("Failed to mark document %s as failed: %s", document_id, e)
+
+    @staticmethod
+    def _validate_extension(filename: Optional[str]) -> str:
+        """
+        파일 확장자 검증
+
+        Args:
+            filename: 파일명
 
         Returns:
-            DocumentUploadResponse: 업로드된 문서 정보
+            str: 소문자 확장자 (pdf, md, txt)
 
         Raises:
-            HTTPException: 파일 타입이나 크기가 유효하지 않은 경우
+            HTTPException: 파일명이 없거나 지원하지 않는 파일 타입인 경우
         """
-        # 파일 확장자 검증
-        if not file.filename:
+        if not filename:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Filename is required."
             )
 
-        file_extension = file.filename.split(".")[-1].lower()
+        file_extension = filename.split(".")[-1].lower()
         if file_extension not in DocumentService.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                 detail=f"UNSUPPORTED_FILE_TYPE: Only {', '.join(DocumentService.ALLOWED_EXTENSIONS)} files are supported."
             )
+        return file_extension
+
+    @staticmethod
+    def _validate_size(file_size: int):
+        """
+        파일 크기 검증
 
-        # 파일 크기 검증
-        file_content = await file.read()
-        file_size = len(file_content)
-        await file.seek(0)  # 파일 포인터 리셋
+        Args:
+            file_size: 파일 크기 (바이트)
 
+        Raises:
+            HTTPException: 최대 크기를 초과한 경우 (413)
+        """
         if file_size > DocumentService.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail=f"FILE_TOO_LARGE: Maximum file size is {DocumentService.MAX_FILE_SIZE / 1024 / 1024}MB."
             )
 
+    @staticmethod
+    async def _schedule_processing(
+        document_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ):
+        """
+        문서 처리 작업 시작 (작업 큐 또는 백그라운드 태스크)
+
+        Args:
+            document_id: 문서 ID
+            background_tasks: FastAPI 백그라운드 태스크 (작업 큐가 없을 때 사용)
+        """
+        # 작업 큐(arq)로 문서 처리 시작
+        if settings.REDIS_URL:
+            from app.workers.queue import enqueue_document_processing
+            await enqueue_document_processing(document_id)
+            logger.info("Document processing job enqueued for document %s", document_id)
+        # 큐가 설정되지 않은 경우 백그라운드 태스크로 처리
+        elif background_tasks:
+            background_tasks.add_task(
+                DocumentService._process_document_background,
+                document_id=document_id
+            )
+            logger.info("Background task scheduled for document %s", document_id)
+
+    @staticmethod
+    def _to_upload_response(document: Document) -> DocumentUploadResponse:
+        """
+        Document 모델을 업로드 응답 스키마로 변환
+
+        Args:
+            document: 문서 모델
+
+        Returns:
+            DocumentUploadResponse: 업로드된 문서 정보
+        """
+        return DocumentUploadResponse(
+            id=document.id,
+            filename=document.filename,
+            file_path=document.filePath,
+            file_type=document.fileType.value,
+            file_size=document.fileSize,
+            status=document.status.value,
+            created_at=document.createdAt
+        )
+
+    @staticmethod
+    async def upload_document(
+        db: AsyncSession,
+        file: UploadFile,
+        user_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> DocumentUploadResponse:
+        """
+        문서 업로드 및 처리 시작
+
+        Args:
+            db: 데이터베이스 세션
+            file: 업로드 파일
+            user_id: 사용자 ID
+
+        Returns:
+            DocumentUploadResponse: 업로드된 문서 정보
+
+        Raises:
+            HTTPException: 파일 타입이나 크기가 유효하지 않은 경우
+        """
+        # 파일 확장자 검증
+        file_extension = DocumentService._validate_extension(file.filename)
+
+        # 파일 크기 검증 (내용을 메모리로 읽지 않고 크기만 확인)
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+            file.file.seek(0)  # 파일 포인터 리셋
+
+        DocumentService._validate_size(file_size)
+
         # Document 레코드 생성 (status: processing)
         new_document = Document(
             userId=user_id,
@@ -219,26 +489,10 @@ class DocumentService:
             await db.commit()
             await db.refresh(new_document)
 
-            # 백그라운드 태스크로 문서 처리 시작
-            if background_tasks:
-                # settings에서 DATABASE_URL 가져오기
-                db_url = settings.DATABASE_URL
-                background_tasks.add_task(
-                    DocumentService._process_document_background,
-                    document_id=new_document.id,
-                    db_url=db_url
-                )
-                print(f"[INFO] Background task scheduled for document {new_document.id}")
-
-            return DocumentUploadResponse(
-                id=new_document.id,
-                filename=new_document.filename,
-                file_path=new_document.filePath,
-                file_type=new_document.fileType.value,
-                file_size=new_document.fileSize,
-                status=new_document.status.value,
-                created_at=new_document.createdAt
-            )
+            # 문서 처리 시작
+            await DocumentService._schedule_processing(new_document.id, background_tasks)
+
+            return DocumentService._to_upload_response(new_document)
 
         except Exception as e:
             # GCS 업로드 실패 시 Document 레코드 삭제
@@ -249,4 +503,141 @@ class DocumentService:
                 detail=f"Failed to upload document: {str(e)}"
             )
 
+    @staticmethod
+    async def create_upload_url(
+        db: AsyncSession,
+        upload_request: DocumentUploadUrlRequest,
+        user_id: str
+    ) -> DocumentUploadUrlResponse:
+        """
+        GCS 직접 업로드용 서명 URL 발급
+
+        파일 내용이 API 서버를 거치지 않도록 클라이언트가 서명 URL로 GCS에 직접 PUT한 뒤,
+        complete_upload를 호출하면 문서 처리가 시작됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            upload_request: 업로드할 파일 정보 (파일명, 크기)
+            user_id: 사용자 ID
+
+        Returns:
+            DocumentUploadUrlResponse: 문서 ID와 서명된 업로드 URL
+
+        Raises:
+            HTTPException: 파일 타입이나 크기가 유효하지 않은 경우
+        """
+        file_extension = DocumentService._validate_extension(upload_request.filename)
+        DocumentService._validate_size(upload_request.file_size)
+
+        # Document 레코드 생성 (status: processing, 처리는 업로드 완료 후 시작)
+        # fileSize는 업로드 완료 시 실제 크기로 채움 (NULL = 업로드 대기 중, 첨부/조회 대상에서 제외)
+        new_document = Document(
+            userId=user_id,
+            filename=upload_request.filename,
+            filePath="",
+            fileType=FileType(file_extension),
+            fileSize=None,
+            status=DocumentStatus.PROCESSING,
+            chunkCount=0
+        )
+        db.add(new_document)
+        await db.flush()  # ULID 기본 키 확정
+
+        upload_url, gcs_url = gcs_uploader.generate_signed_upload_url(
+            document_id=new_document.id,
+            file_extension=file_extension,
+            expires_in=settings.SIGNED_URL_EXPIRATION
+        )
+        new_document.filePath = gcs_url
+        await db.commit()
+
+        return DocumentUploadUrlResponse(
+            id=new_document.id,
+            upload_url=upload_url,
+            content_type=gcs_uploader.content_type(file_extension),
+            expires_in=settings.SIGNED_URL_EXPIRATION
+        )
+
+    @staticmethod
+    async def complete_upload(
+        db: AsyncSession,
+        document_id: str,
+        user_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> DocumentUploadResponse:
+        """
+        서명 URL 업로드 완료 처리 및 문서 처리 시작
+
+        Args:
+            db: 데이터베이스 세션
+            document_id: 문서 ID
+            user_id: 사용자 ID
+            background_tasks: FastAPI 백그라운드 태스크
+
+        Returns:
+            DocumentUploadResponse: 업로드된 문서 정보
+
+        Raises:
+            HTTPException: 문서가 없거나, 이미 완료 처리되었거나, GCS에 파일이 없거나, 파일이 너무 큰 경우
+        """
+        result = await db.execute(
+            select(Document).where(
+                and_(
+                    Document.id == document_id,
+                    Document.userId == user_id,
+                    Document.deletedAt.is_(None)
+                )
+            )
+        )
+        document = result.scalar_one_or_none()
+        if not document:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found."
+            )
+
+        # 서명 URL로 발급된 업로드 대기 문서만 완료 처리 가능 (multipart 업로드/처리된 문서 제외)
+        if document.status != DocumentStatus.PROCESSING or document.fileSize is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Upload has already been completed."
+            )
+
+        # 실제 업로드된 파일 크기 확인 (클라이언트가 보낸 크기를 그대로 신뢰하지 않음)
+        file_size = await gcs_uploader.get_document_size(document.filePath)
+        if file_size is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="File has not been uploaded yet."
+            )
+        if file_size > DocumentService.MAX_FILE_SIZE:
+            await gcs_uploader.delete_document(document.filePath)
+            document.status = DocumentStatus.FAILED
+            await db.commit()
+            DocumentService._validate_size(file_size)
+
+        # 조건부 업데이트: 동시에 여러 번 호출되어도 한 번만 처리 작업을 시작
+        completed_id = await db.scalar(
+            update(Document)
+            .where(
+                Document.id == document_id,
+                Document.status == DocumentStatus.PROCESSING,
+                Document.fileSize.is_(None)
+            )
+            .values(fileSize=file_size)
+            .returning(Document.id)
+        )
+        if completed_id is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Upload has already been completed."
+            )
+        await db.commit()
+        document.fileSize = file_size
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
+
+        # 문서 처리 시작
+        await DocumentService._schedule_processing(document.id, background_tasks)
 
+        return DocumentService._to_upload_response(document)
@@ -4,11 +4,16 @@ Message Service
 메시지 관련 비즈니스 로직
 """
 
-from datetime import datetime
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, exists, func, and_, or_
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.models import generate_ulid, normalize_ulid
 from app.models.message import Message, MessageRole
 from app.models.chat import Chat
 from app.models.document import Document, DocumentStatus
@@ -25,7 +30,32 @@ from app.schemas.message import (
 )
 from app.services.chat_service import ChatService
 from app.services.category_service import CategoryService
+from app.schemas.common import SuccessResponse
 from app.services.rag_service import RAGService
+from app.cache import response_cache, conversation_cache
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 백그라운드 태스크 (GC로 취소되지 않도록 참조 유지)
+_background_tasks: set[asyncio.Task] = set()
+
+def _sse_event(event: str, data: str) -> str:
+    """
+    Server-Sent Events 형식 문자열 생성
+
+    Args:
+        event: 이벤트 이름
+        data: 이벤트 데이터 (JSON 문자열)
+
+    Returns:
+        str: SSE 이벤트 문자열
+    """
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+# 메시지 목록 변환용 TypeAdapter (스키마를 한 번만 빌드하여 재사용)
+_message_list_adapter = TypeAdapter(list[MessageResponse])
 
 
 class MessageService:
@@ -34,36 +64,73 @@ class MessageService:
     """
 
     @staticmethod
-    async def _get_document(db: AsyncSession, doc_id: str) -> Document:
+    async def _get_documents(db: AsyncSession, doc_ids: list[str]) -> list[Document]:
         """
-        문서 조회 (삭제되지 않은 문서만)
+        문서 일괄 조회 (삭제되지 않은 문서만, 한 번의 IN 쿼리)
 
         Args:
             db: 데이터베이스 세션
-            doc_id: 문서 ID
+            doc_ids: 문서 ID 리스트
 
         Returns:
-            Document: 문서 객체
+            list[Document]: doc_ids 순서대로 정렬된 문서 리스트
 
         Raises:
             HTTPException: 문서를 찾을 수 없는 경우
         """
         doc_query = select(Document).where(
             and_(
-                Document.id == doc_id,
-                Document.deletedAt.is_(None)
+                Document.id.in_(doc_ids),
+                Document.deletedAt.is_(None),
+                Document.fileSize.is_not(None)  # 업로드가 완료되지 않은 문서 제외
             )
         )
         doc_result = await db.execute(doc_query)
-        document = doc_result.scalar_one_or_none()
+        documents_by_id = {doc.id: doc for doc in doc_result.scalars().all()}
+
+        # 요청 ID(소문자 허용)를 조회 결과와 같은 정규형으로 맞춰 비교
+        doc_ids = [normalize_ulid(doc_id) for doc_id in doc_ids]
+        for doc_id in doc_ids:
+            if doc_id not in documents_by_id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Document {doc_id} not found."
+                )
 
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document {doc_id} not found."
-            )
+        return [documents_by_id[doc_id] for doc_id in doc_ids]
+
+    @staticmethod
+    async def _insert_message(
+        db: AsyncSession,
+        chat_id: str,
+        role: MessageRole,
+        content: str,
+        sources: Optional[list[dict]] = None
+    ) -> Message:
+        """
+        메시지 저장 (INSERT ... RETURNING 한 번으로 생성 + 서버 기본값 조회)
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+            role: 메시지 역할
+            content: 메시지 내용
+            sources: 출처 정보 (선택)
 
-        return document
+        Returns:
+            Message: 생성된 메시지
+        """
+        return await db.scalar(
+            insert(Message)
+            .values(
+                id=generate_ulid(),
+                chatId=chat_id,
+                role=role,
+                content=content,
+                sources=sources
+            )
+            .returning(Message)
+        )
 
     @staticmethod
     async def _update_chat_timestamp(db: AsyncSession, chat_id: str):
@@ -74,19 +141,22 @@ class MessageService:
             db: 데이터베이스 세션
             chat_id: 채팅 ID
         """
-        chat_update_query = select(Chat).where(Chat.id == chat_id)
-        chat_update_result = await db.execute(chat_update_query)
-        chat_to_update = chat_update_result.scalar_one()
-        chat_to_update.updatedAt = datetime.utcnow()
+        # 행을 로드하지 않고 UPDATE 한 번으로 갱신 (시각은 DB의 now() 사용)
+        await db.execute(
+            update(Chat)
+            .where(Chat.id == chat_id)
+            .values(updatedAt=func.now())
+            .execution_options(synchronize_session=False)
+        )
 
     @staticmethod
     async def _attach_documents_to_message(
         db: AsyncSession,
         message_id: str,
         document_ids: list[str]
-    ) -> tuple[list[DocumentAttachment], list[Document]]:
+    ) -> tuple[list[DocumentAttachment], list[str]]:
         """
-        메시지에 문서 첨부 및 RAG용 문서 수집
+        메시지에 문서 첨부 및 RAG용 문서 ID 수집
 
         Args:
             db: 데이터베이스 세션
@@ -94,24 +164,16 @@ class MessageService:
             document_ids: 첨부할 문서 ID 리스트
 
         Returns:
-            tuple: (첨부된 문서 정보 리스트, RAG용 문서 리스트)
+            tuple: (첨부된 문서 정보 리스트, RAG용 문서 ID 리스트)
 
         Raises:
             HTTPException: 문서를 찾을 수 없는 경우
         """
         attached_documents = []
-        documents_for_rag = []
-
-        for doc_id in document_ids:
-            document = await MessageService._get_document(db, doc_id)
-
-            # MessageDocument 생성
-            message_document = MessageDocument(
-                messageId=message_id,
-                documentId=document.id
-            )
-            db.add(message_document)
+        document_ids_for_rag = []
 
+        documents = await MessageService._get_documents(db, document_ids)
+        for document in documents:
             attached_documents.append(DocumentAttachment(
                 id=document.id,
                 filename=document.filename
@@ -119,50 +181,68 @@ class MessageService:
 
             # completed 문서만 RAG에 사용
             if document.status == DocumentStatus.COMPLETED:
-                documents_for_rag.append(document)
-
-        await db.commit()
-        return attached_documents, documents_for_rag
+                document_ids_for_rag.append(document.id)
+
+        # MessageDocument 일괄 생성 (한 번의 INSERT)
+        await db.execute(
+            insert(MessageDocument),
+            [
+                {"id": generate_ulid(), "messageId": message_id, "documentId": attachment.id}
+                for attachment in attached_documents
+            ]
+        )
+        return attached_documents, document_ids_for_rag
 
     @staticmethod
-    async def _get_chat_documents_for_rag(
+    async def _get_documents_for_rag(
         db: AsyncSession,
-        chat_id: str
-    ) -> list[Document]:
+        chat_id: str,
+        user_id: str
+    ) -> list[str]:
         """
-        채팅에 연결된 completed 문서들 조회 (RAG용)
+        RAG에 사용할 completed 문서 ID 조회 (한 번의 쿼리, 검색에는 ID만 필요)
+        - 채팅에 연결된 문서가 있으면 해당 문서들
+        - 없으면 사용자의 모든 completed 문서
 
         Args:
             db: 데이터베이스 세션
             chat_id: 채팅 ID
+            user_id: 사용자 ID
 
         Returns:
-            list[Document]: RAG에 사용 가능한 문서 리스트
+            list[str]: RAG에 사용 가능한 문서 ID 리스트
         """
-        documents_for_rag = []
-
-        chat_docs_query = select(ChatDocument).where(
-            and_(
-                ChatDocument.chatId == chat_id,
-                ChatDocument.deletedAt.is_(None)
+        # 채팅에 연결된 completed 문서 ID (CTE)
+        chat_docs = (
+            select(Document.id)
+            .join(ChatDocument, ChatDocument.documentId == Document.id)
+            .where(
+                and_(
+                    ChatDocument.chatId == chat_id,
+                    ChatDocument.deletedAt.is_(None),
+                    Document.deletedAt.is_(None),
+                    Document.status == DocumentStatus.COMPLETED
+                )
             )
+            .cte("chat_docs")
         )
-        chat_docs_result = await db.execute(chat_docs_query)
-        chat_documents = chat_docs_result.scalars().all()
 
-        for chat_doc in chat_documents:
-            doc_query = select(Document).where(
-                and_(
-                    Document.id == chat_doc.documentId,
-                    Document.deletedAt.is_(None)
+        # 채팅 문서가 있으면 그 문서들, 없으면 사용자 문서 전체로 대체
+        doc_query = select(Document.id).where(
+            and_(
+                Document.deletedAt.is_(None),
+                Document.status == DocumentStatus.COMPLETED,
+                or_(
+                    Document.id.in_(select(chat_docs.c.id)),
+                    and_(
+                        Document.userId == user_id,
+                        ~exists(select(chat_docs.c.id))
+                    )
                 )
             )
-            doc_result = await db.execute(doc_query)
-            doc = doc_result.scalar_one_or_none()
-            if doc and doc.status == DocumentStatus.COMPLETED:
-                documents_for_rag.append(doc)
-
-        return documents_for_rag
+        )
+        doc_result = await db.execute(doc_query)
+        return list(doc_result.scalars().all())
 
     @staticmethod
     async def _get_conversation_history(
@@ -181,9 +261,15 @@ class MessageService:
         Returns:
             list[dict]: 대화 히스토리 [{"role": "user", "content": "..."}, ...]
         """
+        # 같은 프로세스에서 이어지는 대화는 캐시된 롤링 윈도우 사용
+        if limit * 2 <= conversation_cache.window:
+            cached = conversation_cache.get(chat_id)
+            if cached is not None:
+                return cached[-limit * 2:]
+
         # 최근 limit*2개 메시지 조회 (user+assistant 쌍)
         query = (
-            select(Message)
+            select(Message.role, Message.content)  # 필요한 컬럼만 조회
             .where(
                 and_(
                     Message.chatId == chat_id,
@@ -195,26 +281,231 @@ class MessageService:
         )
 
         result = await db.execute(query)
-        messages = result.scalars().all()
+        messages = result.all()
 
         # 시간 순서대로 뒤집기 (오래된 것부터)
         messages = list(reversed(messages))
 
         # role과 content만 추출
-        return [
+        history = [
             {
                 "role": msg.role.value,
                 "content": msg.content
             }
             for msg in messages
         ]
+        if limit * 2 >= conversation_cache.window:
+            conversation_cache.set(chat_id, history)
+        return history
+
+    @staticmethod
+    def _merge_history(relevant_turns: list[dict], recent_history: list[dict]) -> list[dict]:
+        """
+        벡터 검색으로 찾은 이전 대화 턴과 최근 대화를 합침
+
+        Args:
+            relevant_turns: 관련 이전 대화 턴 (오래된 순)
+            recent_history: 최근 대화 (오래된 순)
+
+        Returns:
+            list[dict]: 대화 히스토리 [{"role": "user", "content": "..."}, ...]
+        """
+        # 최근 대화에 이미 포함된 턴은 제외
+        recent = {(msg["role"], msg["content"]) for msg in recent_history}
+        earlier = [
+            {"role": turn["role"], "content": turn["content"]}
+            for turn in relevant_turns
+            if (turn["role"], turn["content"]) not in recent
+        ]
+        return earlier + recent_history
+
+    @staticmethod
+    def _run_in_background(coro) -> asyncio.Task:
+        """
+        코루틴을 백그라운드 태스크로 실행 (완료될 때까지 참조 유지)
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            asyncio.Task: 실행 중인 태스크
+        """
+        task = asyncio.create_task(coro)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
+
+    @staticmethod
+    async def _index_turns(chat_id: str, turns: list[dict]) -> None:
+        """
+        대화 턴 벡터 저장 (실패해도 대화에는 영향 없음)
+
+        Args:
+            chat_id: 채팅 ID
+            turns: 저장할 대화 턴 리스트
+        """
+        try:
+            await RAGService.index_turns(chat_id, turns)
+        except Exception as e:
+            logger.warning("Failed to index conversation turns for chat %s: %s", chat_id, e)
+
+    @staticmethod
+    async def _retrieve_context(
+        db: AsyncSession,
+        chat_id: str,
+        user_query: str,
+        document_ids: list[str]
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        응답 생성에 사용할 대화 히스토리와 문서 청크 조회
+
+        최근 대화 MAX_CONVERSATION_HISTORY쌍은 그대로, 그 이전 대화는 질문과 관련된
+        턴만 벡터 검색으로 골라 전달하므로 대화가 길어져도 프롬프트 크기가 일정합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+            user_query: 사용자 질문
+            document_ids: RAG에 사용할 문서 ID 리스트
+
+        Returns:
+            tuple[list[dict], list[dict]]: (대화 히스토리, 관련 문서 청크)
+        """
+        # 1. 최근 대화 DB 조회와 질의 임베딩을 동시에 진행
+        # 한쪽이 실패해도 세션 사용이 끝날 때까지 기다린 뒤 예외를 전달 (롤백과 겹치지 않도록)
+        from app.config import settings
+        results = await asyncio.gather(
+            MessageService._get_conversation_history(
+                db,
+                chat_id,
+                limit=settings.MAX_CONVERSATION_HISTORY
+            ),
+            RAGService.embed_query(user_query),
+            return_exceptions=True
+        )
+        for outcome in results:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        recent_history, query_embedding = results
+
+        # 2. 관련 이전 대화 턴 검색과 문서 청크 검색을 동시에 진행 (같은 쿼리 임베딩 재사용)
+        searches = [RAGService.search_conversation(chat_id, query_embedding)]
+        if document_ids:
+            searches.append(
+                RAGService.search_similar_chunks(
+                    query=user_query,
+                    document_ids=document_ids,
+                    query_embedding=query_embedding
+                )
+            )
+        found = await asyncio.gather(*searches)
+        conversation_history = MessageService._merge_history(found[0], recent_history)
+        context_chunks = found[1] if document_ids else []
+        return conversation_history, context_chunks
+
+    @staticmethod
+    def _build_sources(context_chunks: list[dict]) -> Optional[list[dict]]:
+        """
+        검색된 청크로 소스 정보 생성 (SourceInfo 스키마에 맞게)
+
+        Args:
+            context_chunks: 관련 문서 청크 리스트
+
+        Returns:
+            Optional[list[dict]]: 소스 정보 리스트 (청크가 없으면 None)
+        """
+        sources = []
+        for i, chunk in enumerate(context_chunks):
+            doc_id = chunk['metadata'].get('document_id')
+            filename = chunk['metadata'].get('filename', 'Unknown')
+            chunk_index = chunk['metadata'].get('chunk_index', i)
+            content = chunk['content'][:200]  # 미리보기 200자
+
+            sources.append({
+                "document_id": doc_id,
+                "document_name": filename,
+                "chunk_id": f"{doc_id}_{chunk_index}",
+                "page": None,
+                "similarity": 0.0,  # ChromaDB에서 거리 정보 없으면 기본값
+                "content_preview": content
+            })
+        return sources if sources else None
+
+    @staticmethod
+    async def _save_assistant_message(
+        db: AsyncSession,
+        chat_id: str,
+        user_message_id: str,
+        user_query: str,
+        content: str,
+        sources: Optional[list[dict]]
+    ) -> Message:
+        """
+        AI 메시지 저장 및 대화 턴 벡터 저장 예약
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+            user_message_id: 사용자 메시지 ID
+            user_query: 사용자 질문
+            content: AI 응답 내용
+            sources: 소스 정보 리스트
+
+        Returns:
+            Message: 저장된 AI 메시지
+        """
+        assistant_message = await MessageService._insert_message(
+            db, chat_id, MessageRole.ASSISTANT, content, sources
+        )
+
+        # 채팅 updatedAt 갱신
+        await MessageService._update_chat_timestamp(db, chat_id)
+
+        await db.commit()
+        conversation_cache.append(chat_id, MessageRole.ASSISTANT.value, assistant_message.content)
+
+        # 이번 대화 턴을 대화 벡터스토어에 저장 (응답을 기다리게 하지 않도록 백그라운드 실행)
+        MessageService._run_in_background(
+            MessageService._index_turns(chat_id, [
+                {"id": user_message_id, "role": MessageRole.USER.value, "content": user_query},
+                {"id": assistant_message.id, "role": MessageRole.ASSISTANT.value, "content": assistant_message.content}
+            ])
+        )
+        return assistant_message
+
+    @staticmethod
+    async def _save_error_message(db: AsyncSession, chat_id: str, error: Exception) -> Message:
+        """
+        AI 응답 생성 실패 시 기본 메시지 저장
+
+        Args:
+            db: 데이터베이스 세션
+            chat_id: 채팅 ID
+            error: 발생한 예외
+
+        Returns:
+            Message: 저장된 AI 메시지
+        """
+        await db.rollback()
+        assistant_message = await MessageService._insert_message(
+            db, chat_id, MessageRole.ASSISTANT,
+            f"죄송합니다. AI 응답 생성 중 오류가 발생했습니다: {str(error)}"
+        )
+
+        # 채팅 updatedAt 갱신
+        await MessageService._update_chat_timestamp(db, chat_id)
+
+        await db.commit()
+        conversation_cache.append(chat_id, MessageRole.ASSISTANT.value, assistant_message.content)
+        return assistant_message
 
     @staticmethod
     async def _generate_ai_response(
         db: AsyncSession,
         chat_id: str,
+        user_message_id: str,
         user_query: str,
-        documents_for_rag: list[Document]
+        document_ids: list[str]
     ) -> Message:
         """
         AI 응답 생성 및 저장
@@ -222,108 +513,160 @@ class MessageService:
         Args:
             db: 데이터베이스 세션
             chat_id: 채팅 ID
+            user_message_id: 사용자 메시지 ID
             user_query: 사용자 질문
-            documents_for_rag: RAG에 사용할 문서 리스트
+            document_ids: RAG에 사용할 문서 ID 리스트
 
         Returns:
             Message: 생성된 AI 메시지
         """
         try:
-            # 대화 히스토리 조회
-            from app.config import settings
-            conversation_history = await MessageService._get_conversation_history(
-                db,
-                chat_id,
-                limit=settings.MAX_CONVERSATION_HISTORY
+            conversation_history, context_chunks = await MessageService._retrieve_context(
+                db, chat_id, user_query, document_ids
             )
 
-            # RAG 질의응답 처리
-            if documents_for_rag:
-                # 1. 문서 ID 추출
-                document_ids = [doc.id for doc in documents_for_rag]
+            # LLM을 사용하여 응답 생성 (관련 청크가 없으면 일반 대화)
+            assistant_content = await RAGService.generate_response(
+                query=user_query,
+                context_chunks=context_chunks,
+                conversation_history=conversation_history,
+                cache_key=chat_id
+            )
 
-                # 2. 관련 청크 검색
-                context_chunks = await RAGService.search_similar_chunks(
-                    query=user_query,
-                    document_ids=document_ids
-                )
+            return await MessageService._save_assistant_message(
+                db, chat_id, user_message_id, user_query,
+                assistant_content, MessageService._build_sources(context_chunks)
+            )
 
-                # 3. LLM을 사용하여 응답 생성
-                if context_chunks:
-                    # Case A: 관련 청크를 찾은 경우 - 문서 기반 응답
-                    assistant_content = await RAGService.generate_response(
-                        query=user_query,
-                        context_chunks=context_chunks,
-                        conversation_history=conversation_history
-                    )
+        except Exception as e:
+            # AI 응답 생성 실패 시 롤백하지 않고 기본 메시지 생성
+            return await MessageService._save_error_message(db, chat_id, e)
 
-                    # 소스 정보 생성 (SourceInfo 스키마에 맞게)
-                    sources = []
-                    for i, chunk in enumerate(context_chunks):
-                        doc_id = chunk['metadata'].get('document_id')
-                        filename = chunk['metadata'].get('filename', 'Unknown')
-                        chunk_index = chunk['metadata'].get('chunk_index', i)
-                        content = chunk['content'][:200]  # 미리보기 200자
-
-                        sources.append({
-                            "document_id": doc_id,
-                            "document_name": filename,
-                            "chunk_id": f"{doc_id}_{chunk_index}",
-                            "page": None,
-                            "similarity": 0.0,  # ChromaDB에서 거리 정보 없으면 기본값
-                            "content_preview": content
-                        })
-                    assistant_sources = sources if sources else None
-                else:
-                    # 문서는 있지만 관련 청크를 찾지 못한 경우 → Case B로 폴백
-                    assistant_content = await RAGService.generate_response(
-                        query=user_query,
-                        context_chunks=[],
-                        conversation_history=conversation_history
+    @staticmethod
+    async def _save_interrupted_response(
+        chat_id: str,
+        user_message: Message,
+        parts: list[str],
+        context_chunks: list[dict],
+        user_id: str
+    ) -> None:
+        """
+        스트리밍 도중 클라이언트 연결이 끊긴 경우의 AI 메시지 저장
+
+        받은 조각이 있으면 부분 응답을, 없으면 오류 메시지를 저장하여
+        채팅에 사용자 메시지만 남지 않도록 합니다.
+        연결이 끊긴 시점에 응답 저장 커밋이 이미 반영되었을 수 있으므로,
+        사용자 메시지 이후의 AI 메시지가 있으면 저장하지 않습니다.
+
+        Args:
+            chat_id: 채팅 ID
+            user_message: 저장된 사용자 메시지
+            parts: 지금까지 받은 응답 조각
+            context_chunks: 응답에 사용한 컨텍스트 청크
+            user_id: 사용자 ID
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                already_saved = await db.scalar(
+                    select(
+                        exists().where(
+                            and_(
+                                Message.chatId == chat_id,
+                                Message.role == MessageRole.ASSISTANT,
+                                Message.createdAt > user_message.createdAt,
+                                Message.deletedAt.is_(None)
+                            )
+                        )
                     )
-                    assistant_sources = None
-            else:
-                # Case B: 문서가 없는 경우 - 일반 대화
-                assistant_content = await RAGService.generate_response(
-                    query=user_query,
-                    context_chunks=[],
-                    conversation_history=conversation_history
                 )
-                assistant_sources = None
+                if already_saved:
+                    return
+                if parts:
+                    await MessageService._save_assistant_message(
+                        db, chat_id, user_message.id, user_message.content,
+                        "".join(parts), MessageService._build_sources(context_chunks)
+                    )
+                else:
+                    await MessageService._save_error_message(
+                        db, chat_id, ConnectionAbortedError("클라이언트 연결이 끊어졌습니다.")
+                    )
+            response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
+        except Exception as e:
+            logger.error("Failed to save interrupted response for chat %s: %s", chat_id, e)
 
-            # AI 메시지 저장
-            assistant_message = Message(
-                chatId=chat_id,
-                role=MessageRole.ASSISTANT,
-                content=assistant_content,
-                sources=assistant_sources
-            )
-            db.add(assistant_message)
+    @staticmethod
+    async def _stream_ai_response(
+        chat_info: Optional[ChatCreateInfo],
+        user_message: Message,
+        attached_documents: list[DocumentAttachment],
+        document_ids: list[str],
+        user_id: str
+    ) -> AsyncIterator[str]:
+        """
+        AI 응답을 SSE 이벤트로 스트리밍한 뒤 저장
 
-            # 채팅 updatedAt 갱신
-            await MessageService._update_chat_timestamp(db, chat_id)
+        요청 세션은 스트리밍 시작 전에 정리되므로 별도 세션을 사용합니다.
+        토큰은 token 이벤트로, 저장된 메시지 정보는 마지막 done 이벤트로 전달합니다.
 
-            await db.commit()
-            await db.refresh(assistant_message)
-            return assistant_message
+        Args:
+            chat_info: 새로 생성된 채팅 정보 (기존 채팅이면 None)
+            user_message: 저장된 사용자 메시지
+            attached_documents: 사용자 메시지에 첨부된 문서
+            document_ids: RAG에 사용할 문서 ID 리스트
+            user_id: 사용자 ID
+
+        Yields:
+            str: SSE 이벤트 문자열
+        """
+        chat_id = user_message.chatId
+        parts: list[str] = []
+        context_chunks: list[dict] = []
+        assistant_message: Optional[Message] = None
+        async with AsyncSessionLocal() as db:
+            try:
+                conversation_history, context_chunks = await MessageService._retrieve_context(
+                    db, chat_id, user_message.content, document_ids
+                )
 
-        except Exception as e:
-            # AI 응답 생성 실패 시 롤백하지 않고 기본 메시지 생성
-            await db.rollback()
-            assistant_message = Message(
-                chatId=chat_id,
-                role=MessageRole.ASSISTANT,
-                content=f"죄송합니다. AI 응답 생성 중 오류가 발생했습니다: {str(e)}",
-                sources=None
-            )
-            db.add(assistant_message)
+                async for token in RAGService.stream_response(
+                    query=user_message.content,
+                    context_chunks=context_chunks,
+                    conversation_history=conversation_history,
+                    cache_key=chat_id
+                ):
+                    parts.append(token)
+                    yield _sse_event("token", json.dumps({"content": token}, ensure_ascii=False))
+
+                assistant_message = await MessageService._save_assistant_message(
+                    db, chat_id, user_message.id, user_message.content,
+                    "".join(parts), MessageService._build_sources(context_chunks)
+                )
 
-            # 채팅 updatedAt 갱신
-            await MessageService._update_chat_timestamp(db, chat_id)
+            except Exception as e:
+                # AI 응답 생성 실패 시 기본 메시지 저장 (done 이벤트로 전달)
+                assistant_message = await MessageService._save_error_message(db, chat_id, e)
+
+            except (asyncio.CancelledError, GeneratorExit):
+                # 클라이언트 연결 끊김: 받은 부분까지(없으면 오류 메시지) 저장 후 다시 발생
+                # (취소가 저장을 중단시키지 않도록 별도 세션의 백그라운드 태스크로 실행)
+                if assistant_message is None:
+                    task = MessageService._run_in_background(
+                        MessageService._save_interrupted_response(
+                            chat_id, user_message, parts, context_chunks, user_id
+                        )
+                    )
+                    try:
+                        await asyncio.shield(task)
+                    except asyncio.CancelledError:
+                        pass
+                raise
+
+        response_cache.invalidate_user(user_id)  # 조회 캐시 무효화
 
-            await db.commit()
-            await db.refresh(assistant_message)
-            return assistant_message
+        result = MessageService._to_create_response(
+            chat_info, user_message, attached_documents, assistant_message
+        )
+        yield _sse_event("done", SuccessResponse(data=result).model_dump_json(by_alias=True))
 
     @staticmethod
     async def get_messages(
@@ -349,7 +692,14 @@ class MessageService:
 
         # 메시지 조회 (삭제되지 않은 것만, 생성일 순으로 정렬)
         query = (
-            select(Message)
+            select(
+                Message.id,
+                Message.chatId,
+                Message.role,
+                Message.content,
+                Message.sources,
+                Message.createdAt
+            )  # 응답에 필요한 컬럼만 조회
             .where(
                 and_(
                     Message.chatId == chat_id,
@@ -362,45 +712,41 @@ class MessageService:
         )
 
         result = await db.execute(query)
-        messages = result.scalars().all()
+        messages = result.all()
 
-        # 각 메시지의 첨부 문서 조회 (JOIN으로 한 번에 로드)
-        message_responses = []
-        for message in messages:
-            # 메시지에 첨부된 문서 조회 (JOIN으로 document를 함께 로드)
+        # 페이지 내 모든 메시지의 첨부 문서를 한 번의 JOIN 쿼리로 조회
+        attachments: dict = {message.id: [] for message in messages}
+        if attachments:
             doc_query = (
-                select(MessageDocument, Document)
+                select(MessageDocument.messageId, Document.id, Document.filename)
                 .join(Document, MessageDocument.documentId == Document.id)
                 .where(
                     and_(
-                        MessageDocument.messageId == message.id,
+                        MessageDocument.messageId.in_(list(attachments)),
                         MessageDocument.deletedAt.is_(None),
                         Document.deletedAt.is_(None)
                     )
                 )
             )
             doc_result = await db.execute(doc_query)
-            doc_rows = doc_result.all()
+            for message_id, doc_id, filename in doc_result.all():
+                attachments[message_id].append({"id": str(doc_id), "filename": filename})
 
-            attached_documents = [
-                DocumentAttachment(
-                    id=str(doc.id),
-                    filename=doc.filename
-                )
-                for _, doc in doc_rows
-            ]
+        # 응답 모델 대신 dict로 모아 두었다가 한 번에 변환
+        message_rows = [
+            {
+                "id": str(message.id),
+                "chat_id": str(message.chatId),
+                "role": message.role.value,
+                "content": message.content,
+                "attached_documents": attachments[message.id],
+                "sources": message.sources,
+                "created_at": message.createdAt
+            }
+            for message in messages
+        ]
 
-            message_responses.append(
-                MessageResponse(
-                    id=str(message.id),
-                    chat_id=str(message.chatId),
-                    role=message.role.value,
-                    content=message.content,
-                    attached_documents=attached_documents,
-                    sources=message.sources,
-                    created_at=message.createdAt
-                )
-            )
+        message_responses = _message_list_adapter.validate_python(message_rows)
 
         return {
             "chat_id": chat_id,
@@ -411,22 +757,19 @@ class MessageService:
         }
 
     @staticmethod
-    async def create_message(
+    async def _save_user_message(
         db: AsyncSession,
         message_data: MessageCreate
-    ) -> MessageCreateResponse:
+    ) -> tuple[Optional[ChatCreateInfo], Message, list[DocumentAttachment], list[str]]:
         """
-        메시지 생성 및 AI 응답 생성
-        - chat_id가 null이면 새 채팅 생성
-        - chat_id가 있으면 기존 채팅에 추가
-        - 매 메시지마다 document_ids를 첨부 가능
+        사용자 메시지 저장 (필요 시 새 채팅 생성, 문서 첨부 포함)
 
         Args:
             db: 데이터베이스 세션
             message_data: 메시지 생성 데이터
 
         Returns:
-            MessageCreateResponse: 생성된 메시지 정보 (chat 포함 여부는 chat_id에 따라 다름)
+            tuple: (새 채팅 정보 또는 None, 사용자 메시지, 첨부 문서, RAG에 사용할 문서 ID 리스트)
 
         Raises:
             HTTPException: 채팅을 찾을 수 없거나, 문서가 없거나, 문서가 준비되지 않은 경우
@@ -442,51 +785,59 @@ class MessageService:
 
         # Case 2: 기존 채팅에 메시지 추가 (chat_id != null 이라면)
         else:
-            # 채팅 소유권 검증
-            chat = await ChatService.validate_chat_ownership(
-                db, message_data.chat_id, message_data.user_id
-            )
-            chat_id = chat.id
+            # 채팅 소유권 검증 (채팅 객체는 필요 없으므로 EXISTS로 확인)
+            if not await ChatService.owns_chat(db, message_data.chat_id, message_data.user_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Chat not found."
+                )
+            # 대화 캐시/대화 벡터 키가 삭제 시 ID와 일치하도록 정규 표기로 맞춤
+            chat_id = normalize_ulid(message_data.chat_id)
 
         # 사용자 메시지 저장
-        user_message = Message(
-            chatId=chat_id,
-            role=MessageRole.USER,
-            content=message_data.content,
-            sources=None
+        user_message = await MessageService._insert_message(
+            db, chat_id, MessageRole.USER, message_data.content
         )
-        db.add(user_message)
-        await db.commit()
-        await db.refresh(user_message)
 
         # 문서 첨부 및 RAG용 문서 수집
         if message_data.document_ids:
-            attached_documents, documents_for_rag = await MessageService._attach_documents_to_message(
+            attached_documents, document_ids_for_rag = await MessageService._attach_documents_to_message(
                 db, user_message.id, message_data.document_ids
             )
         else:
             attached_documents = []
-            # 1차: 채팅에 연결된 문서 확인
-            documents_for_rag = await MessageService._get_chat_documents_for_rag(db, chat_id)
+            # 채팅에 연결된 문서 (없으면 사용자의 모든 완료된 문서)
+            document_ids_for_rag = await MessageService._get_documents_for_rag(
+                db, chat_id, message_data.user_id
+            )
 
-            # 2차: 채팅에 문서가 없으면 사용자의 모든 완료된 문서 사용
-            if not documents_for_rag:
-                user_docs_query = select(Document).where(
-                    and_(
-                        Document.userId == message_data.user_id,
-                        Document.status == DocumentStatus.COMPLETED,
-                        Document.deletedAt.is_(None)
-                    )
-                )
-                user_docs_result = await db.execute(user_docs_query)
-                documents_for_rag = list(user_docs_result.scalars().all())
+        # 새 채팅, 채팅-문서 연결, 사용자 메시지, 메시지-문서 연결을 한 번에 커밋
+        # (검증 실패 시 아무것도 저장되지 않음)
+        await db.commit()
+        response_cache.invalidate_user(message_data.user_id)  # 조회 캐시 무효화
+        conversation_cache.append(chat_id, MessageRole.USER.value, user_message.content)
 
-        # AI 응답 생성
-        assistant_message = await MessageService._generate_ai_response(
-            db, chat_id, message_data.content, documents_for_rag
-        )
+        return chat_info, user_message, attached_documents, document_ids_for_rag
 
-        # 응답 생성
+    @staticmethod
+    def _to_create_response(
+        chat_info: Optional[ChatCreateInfo],
+        user_message: Message,
+        attached_documents: list[DocumentAttachment],
+        assistant_message: Message
+    ) -> MessageCreateResponse:
+        """
+        메시지 생성 응답 구성
+
+        Args:
+            chat_info: 새로 생성된 채팅 정보 (기존 채팅이면 None)
+            user_message: 사용자 메시지
+            attached_documents: 사용자 메시지에 첨부된 문서
+            assistant_message: AI 메시지
+
+        Returns:
+            MessageCreateResponse: 메시지 생성 응답
+        """
         return MessageCreateResponse(
             chat=chat_info,
             user_message=MessageResponse(
@@ -509,6 +860,68 @@ class MessageService:
             )
         )
 
+    @staticmethod
+    async def create_message(
+        db: AsyncSession,
+        message_data: MessageCreate
+    ) -> MessageCreateResponse:
+        """
+        메시지 생성 및 AI 응답 생성
+        - chat_id가 null이면 새 채팅 생성
+        - chat_id가 있으면 기존 채팅에 추가
+        - 매 메시지마다 document_ids를 첨부 가능
+
+        Args:
+            db: 데이터베이스 세션
+            message_data: 메시지 생성 데이터
+
+        Returns:
+            MessageCreateResponse: 생성된 메시지 정보 (chat 포함 여부는 chat_id에 따라 다름)
+
+        Raises:
+            HTTPException: 채팅을 찾을 수 없거나, 문서가 없거나, 문서가 준비되지 않은 경우
+        """
+        chat_info, user_message, attached_documents, document_ids_for_rag = (
+            await MessageService._save_user_message(db, message_data)
+        )
+
+        # AI 응답 생성
+        assistant_message = await MessageService._generate_ai_response(
+            db, user_message.chatId, user_message.id, message_data.content, document_ids_for_rag
+        )
+        response_cache.invalidate_user(message_data.user_id)  # 조회 캐시 무효화
+
+        return MessageService._to_create_response(
+            chat_info, user_message, attached_documents, assistant_message
+        )
+
+    @staticmethod
+    async def create_message_stream(
+        db: AsyncSession,
+        message_data: MessageCreate
+    ) -> AsyncIterator[str]:
+        """
+        메시지 생성 후 AI 응답을 SSE로 스트리밍
+
+        사용자 메시지 저장과 검증은 스트리밍 전에 끝내므로, 검증 실패는 일반 HTTP 에러로 반환됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            message_data: 메시지 생성 데이터
+
+        Returns:
+            AsyncIterator[str]: SSE 이벤트 스트림 (token 이벤트 여러 개 + done 이벤트)
+
+        Raises:
+            HTTPException: 채팅을 찾을 수 없거나, 문서가 없거나, 문서가 준비되지 않은 경우
+        """
+        chat_info, user_message, attached_documents, document_ids_for_rag = (
+            await MessageService._save_user_message(db, message_data)
+        )
+        return MessageService._stream_ai_response(
+            chat_info, user_message, attached_documents, document_ids_for_rag, message_data.user_id
+        )
+
     @staticmethod
     async def _create_new_chat_with_message(
         db: AsyncSession,
@@ -535,51 +948,48 @@ class MessageService:
             )
             category_info = {"id": category.id, "name": category.name}
 
-        # 채팅 제목 생성 (메시지 내용의 처음 50자)
-        title = message_data.content[:50] if len(message_data.content) > 50 else message_data.content
-
-        # 새 채팅 생성
-        new_chat = Chat(
-            userId=message_data.user_id,
-            categoryId=message_data.category_id,
-            title=title
-        )
-        db.add(new_chat)
-        await db.commit()
-        await db.refresh(new_chat)
-
-        # 문서 연결 (document_ids가 있는 경우)
+        # 문서 검증 (document_ids가 있는 경우) - 채팅을 만들기 전에 먼저 확인
         documents_info = []
         if message_data.document_ids:
-            for doc_id in message_data.document_ids:
-                try:
-                    document = await MessageService._get_document(db, doc_id)
-                except HTTPException:
-                    # 이미 채팅이 생성되었으므로 롤백하고 에러
-                    await db.rollback()
-                    raise
+            # 중복 ID 제거 (채팅-문서 연결은 유일해야 함, 순서 유지)
+            documents = await MessageService._get_documents(
+                db, list(dict.fromkeys(message_data.document_ids))
+            )
 
+            for document in documents:
                 # FAILED 상태 문서는 차단
                 if document.status == DocumentStatus.FAILED:
-                    await db.rollback()
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Document {document.filename} processing failed."
                     )
 
-                # ChatDocument 연결 생성
-                chat_document = ChatDocument(
-                    chatId=new_chat.id,
-                    documentId=document.id
-                )
-                db.add(chat_document)
-
                 documents_info.append({
                     "id": document.id,
                     "filename": document.filename
                 })
 
-            await db.commit()
+        # 채팅 제목 생성 (메시지 내용의 처음 50자)
+        title = message_data.content[:50] if len(message_data.content) > 50 else message_data.content
+
+        # 새 채팅 생성 (커밋은 사용자 메시지 저장과 함께 create_message에서 한 번에 수행)
+        new_chat = Chat(
+            userId=message_data.user_id,
+            categoryId=message_data.category_id,
+            title=title
+        )
+        db.add(new_chat)
+        await db.flush()
+
+        # ChatDocument 연결 일괄 생성 (한 번의 INSERT)
+        if documents_info:
+            await db.execute(
+                insert(ChatDocument),
+                [
+                    {"id": generate_ulid(), "chatId": new_chat.id, "documentId": info["id"]}
+                    for info in documents_info
+                ]
+            )
 
         return ChatCreateInfo(
             id=new_chat.id,
@@ -4,14 +4,166 @@ RAG Service
 RAG (Retrieval-Augmented Generation) 관련 비즈니스 로직
 """
 
-from typing import Optional
+import asyncio
+import logging
+import tiktoken
+from typing import AsyncIterator, Optional, Union, TYPE_CHECKING
+from starlette.concurrency import run_in_threadpool
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_community.vectorstores import Chroma
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document as LangchainDocument
+from semantic_text_splitter import TextSplitter
 
 from app.models.document import Document
 from app.config import settings
+from app.cache import query_cache
+from app.services.vector import VectorBackend
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 OpenAI 오류 (레이트 리밋, 서버 오류, 연결/타임아웃)
+RETRYABLE_OPENAI_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+_exponential_wait = wait_exponential_jitter(initial=1, max=60)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """
+    재시도 대기 시간 계산 (Retry-After 헤더 우선, 없으면 지터가 포함된 지수 백오프)
+
+    Args:
+        retry_state: tenacity 재시도 상태
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        try:
+            if "retry-after-ms" in response.headers:
+                return min(float(response.headers["retry-after-ms"]) / 1000, 60)
+            if "retry-after" in response.headers:
+                return min(float(response.headers["retry-after"]), 60)
+        except ValueError:
+            pass
+    return _exponential_wait(retry_state)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """재시도 전 경고 로그"""
+    logger.warning(
+        "OpenAI 요청 실패, %.1f초 후 재시도 (%d/%d): %r",
+        retry_state.next_action.sleep,
+        retry_state.attempt_number,
+        settings.OPENAI_MAX_RETRIES,
+        retry_state.outcome.exception()
+    )
+
+
+def _openai_retrying() -> AsyncRetrying:
+    """OpenAI 호출용 재시도 정책"""
+    return AsyncRetrying(
+        retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+        wait=_wait_retry_after,
+        stop=stop_after_attempt(settings.OPENAI_MAX_RETRIES),
+        before_sleep=_log_retry,
+        reraise=True
+    )
+
+
+# 벡터스토어 컬렉션 이름 (문서 청크는 langchain Chroma 기본 컬렉션을 그대로 사용)
+DOCUMENT_COLLECTION = "langchain"
+CONVERSATION_COLLECTION = "conversations"
+
+# 시스템 프롬프트 (고정 문자열이므로 프롬프트 캐시 prefix로 재사용됨)
+SYSTEM_PROMPT_WITH_DOCS = """당신은 친절한 AI 어시스턴트입니다. 사용자가 업로드한 문서 내용을 참고하여 답변할 수 있습니다.
+마지막 사용자 메시지에 참고 문서 내용과 사용자 질문이 함께 주어집니다.
+
+답변 시 주의사항:
+1. 이전 대화 내용을 참고하여 맥락을 이해하세요.
+2. 문서 내용이 질문과 관련이 있다면 우선적으로 참고하여 답변하세요.
+3. 문서 내용을 사용했다면 어떤 문서를 참고했는지 간단히 언급하세요.
+4. 문서 내용이 질문과 관련이 없다면, 일반 지식을 바탕으로 친절하게 답변하세요.
+5. 한국어로 답변하세요."""
+
+SYSTEM_PROMPT_CHAT = """당신은 친절한 AI 어시스턴트입니다.
+
+답변 시 주의사항:
+1. 이전 대화 내용을 참고하여 맥락을 이해하세요.
+2. 친절하고 정확하게 답변하세요.
+3. 한국어로 답변하세요.
+4. 모르는 내용은 모른다고 솔직히 말하세요."""
+
+# 마지막 사용자 메시지 템플릿 (참고 문서 + 질문)
+CONTEXT_CHUNK_TEMPLATE = "[문서: {filename}]\n{content}"
+DOCUMENT_QUESTION_TEMPLATE = "참고 문서 내용:\n\n{context}\n\n사용자 질문: {query}"
+
+# 시스템 메시지는 매 호출 동일하므로 한 번만 생성하여 재사용
+_SYSTEM_MESSAGE_WITH_DOCS = SystemMessage(content=SYSTEM_PROMPT_WITH_DOCS)
+_SYSTEM_MESSAGE_CHAT = SystemMessage(content=SYSTEM_PROMPT_CHAT)
+
+
+def _overlap_length(prev: str, chunk: str, overlap: int) -> int:
+    """
+    prev의 끝과 chunk의 시작이 겹치는 글자 수 (최대 overlap)
+
+    Args:
+        prev: 앞 청크
+        chunk: 뒤 청크
+        overlap: 확인할 최대 겹침 길이
+
+    Returns:
+        int: 겹치는 글자 수 (없으면 0)
+    """
+    for size in range(min(overlap, len(prev), len(chunk)), 0, -1):
+        if prev.endswith(chunk[:size]):
+            return size
+    return 0
+
+
+def _merge_small(
+    chunks: list[str],
+    min_size: int,
+    max_size: int,
+    overlap: int
+) -> list[str]:
+    """
+    분할 후 너무 짧은 청크를 인접 청크와 병합 (split-then-merge)
+
+    min_size보다 짧은 청크는 합친 길이가 max_size를 넘지 않는 한 앞 청크에 이어 붙입니다.
+    인접 청크끼리 겹치는 부분(overlap)은 한 번만 남깁니다.
+
+    Args:
+        chunks: 분할기가 만든 청크 리스트
+        min_size: 최소 청크 길이
+        max_size: 최대 청크 길이
+        overlap: 인접 청크 간 최대 겹침 길이
+
+    Returns:
+        list[str]: 병합된 청크 리스트
+    """
+    merged: list[str] = []
+    for chunk in chunks:
+        if merged and (len(merged[-1]) < min_size or len(chunk) < min_size):
+            prev = merged[-1]
+            shared = _overlap_length(prev, chunk, overlap)
+            # 겹치는 부분이 없으면 줄바꿈으로 구분
+            combined = prev + chunk[shared:] if shared else f"{prev}\n{chunk}"
+            if len(combined) <= max_size:
+                merged[-1] = combined
+                continue
+        merged.append(chunk)
+    return merged
 
 
 class RAGService:
@@ -21,19 +173,37 @@ class RAGService:
 
     # settings에서 설정 로드
     OPENAI_API_KEY = settings.OPENAI_API_KEY
+    VECTOR_BACKEND = settings.VECTOR_BACKEND
     CHROMA_DB_PATH = settings.CHROMA_DB_PATH
+    PGVECTOR_EF_SEARCH = settings.PGVECTOR_EF_SEARCH
     CHUNK_SIZE = settings.CHUNK_SIZE
     CHUNK_OVERLAP = settings.CHUNK_OVERLAP
+    CHUNK_MIN_SIZE = settings.CHUNK_MIN_SIZE
+    TEXT_SPLITTER = settings.TEXT_SPLITTER
     TOP_K_RESULTS = settings.TOP_K_RESULTS
+    USE_RERANKER = settings.USE_RERANKER
+    RERANKER_MODEL = settings.RERANKER_MODEL
+    RERANK_FETCH_MULTIPLIER = settings.RERANK_FETCH_MULTIPLIER
+    CONVERSATION_RETRIEVAL_K = settings.CONVERSATION_RETRIEVAL_K
+    HISTORY_TOKEN_BUDGET = settings.HISTORY_TOKEN_BUDGET
     LLM_MODEL = settings.LLM_MODEL
     EMBEDDING_MODEL = settings.EMBEDDING_MODEL
+    EMBEDDING_BATCH_SIZE = settings.EMBEDDING_BATCH_SIZE
+    EMBEDDING_CONCURRENCY = settings.EMBEDDING_CONCURRENCY
     LLM_TEMPERATURE = settings.LLM_TEMPERATURE
     LLM_MAX_TOKENS = settings.LLM_MAX_TOKENS
 
     # 싱글톤 인스턴스
     _embeddings: Optional[OpenAIEmbeddings] = None
-    _vectorstore: Optional[Chroma] = None
+    _vectorstore: Optional[VectorBackend] = None
+    _conversation_store: Optional[VectorBackend] = None
     _llm: Optional[ChatOpenAI] = None
+    _splitter: Optional[Union[TextSplitter, RecursiveCharacterTextSplitter]] = None
+    _reranker: Optional["CrossEncoder"] = None
+    _encoder: Optional[tiktoken.Encoding] = None
+
+    # 프로세스 전체 OpenAI 동시 요청 제한
+    _openai_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
 
     @classmethod
     def get_embeddings(cls) -> OpenAIEmbeddings:
@@ -46,26 +216,60 @@ class RAGService:
         if cls._embeddings is None:
             cls._embeddings = OpenAIEmbeddings(
                 openai_api_key=cls.OPENAI_API_KEY,
-                model=cls.EMBEDDING_MODEL
+                model=cls.EMBEDDING_MODEL,
+                chunk_size=cls.EMBEDDING_BATCH_SIZE,
+                max_retries=0  # 재시도는 _openai_retrying에서 처리
             )
         return cls._embeddings
 
     @classmethod
-    def get_vectorstore(cls) -> Chroma:
+    def _create_vector_backend(cls, name: str, group_key: str) -> VectorBackend:
         """
-        ChromaDB 벡터스토어 가져오기 (싱글톤)
+        VECTOR_BACKEND 설정에 맞는 벡터스토어 백엔드 생성
+
+        VECTOR_BACKEND가 "pgvector"면 PostgreSQL HNSW 인덱스를,
+        그 외에는 로컬 ChromaDB를 사용합니다.
+
+        Args:
+            name: 컬렉션 이름 (pgvector에서는 해당 용도의 테이블 선택)
+            group_key: 그룹 ID가 저장된 메타데이터 필드
 
         Returns:
-            Chroma: 벡터스토어 인스턴스
+            VectorBackend: 벡터스토어 백엔드 인스턴스
+        """
+        if cls.VECTOR_BACKEND == "pgvector":
+            from app.database import engine
+            from app.services.vector.pg import PgVectorBackend, document_chunks, conversation_turns
+            table = conversation_turns if name == CONVERSATION_COLLECTION else document_chunks
+            return PgVectorBackend(engine, table, group_key, ef_search=cls.PGVECTOR_EF_SEARCH)
+
+        from app.services.vector.chroma import ChromaBackend
+        return ChromaBackend(cls.CHROMA_DB_PATH, name, group_key)
+
+    @classmethod
+    def get_vectorstore(cls) -> VectorBackend:
+        """
+        문서 청크 벡터스토어 가져오기 (싱글톤)
+
+        Returns:
+            VectorBackend: 벡터스토어 백엔드 인스턴스
         """
         if cls._vectorstore is None:
-            embeddings = cls.get_embeddings()
-            cls._vectorstore = Chroma(
-                persist_directory=cls.CHROMA_DB_PATH,
-                embedding_function=embeddings
-            )
+            cls._vectorstore = cls._create_vector_backend(DOCUMENT_COLLECTION, "document_id")
         return cls._vectorstore
 
+    @classmethod
+    def get_conversation_store(cls) -> VectorBackend:
+        """
+        대화 턴 벡터스토어 가져오기 (싱글톤)
+
+        Returns:
+            VectorBackend: 벡터스토어 백엔드 인스턴스
+        """
+        if cls._conversation_store is None:
+            cls._conversation_store = cls._create_vector_backend(CONVERSATION_COLLECTION, "conversation_id")
+        return cls._conversation_store
+
     @classmethod
     def get_llm(cls) -> ChatOpenAI:
         """
@@ -79,29 +283,201 @@ class RAGService:
                 openai_api_key=cls.OPENAI_API_KEY,
                 model=cls.LLM_MODEL,
                 temperature=cls.LLM_TEMPERATURE,
-                max_tokens=cls.LLM_MAX_TOKENS
+                max_tokens=cls.LLM_MAX_TOKENS,
+                max_retries=0  # 재시도는 _openai_retrying에서 처리
             )
         return cls._llm
 
+    @classmethod
+    async def _aembed_documents(cls, texts: list[str]) -> list[list[float]]:
+        """
+        여러 텍스트 임베딩 (동시 요청 제한 + 레이트 리밋 재시도)
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            list[list[float]]: 임베딩 벡터 리스트
+        """
+        async for attempt in _openai_retrying():
+            with attempt:
+                async with cls._openai_semaphore:
+                    return await cls.get_embeddings().aembed_documents(texts)
+
+    @classmethod
+    async def _aembed_query(cls, query: str) -> list[float]:
+        """
+        질의 임베딩 (동시 요청 제한 + 레이트 리밋 재시도)
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            list[float]: 임베딩 벡터
+        """
+        async for attempt in _openai_retrying():
+            with attempt:
+                async with cls._openai_semaphore:
+                    return await cls.get_embeddings().aembed_query(query)
+
+    @classmethod
+    async def _ainvoke(cls, messages: list[BaseMessage], **kwargs) -> str:
+        """
+        LLM 호출 (동시 요청 제한 + 레이트 리밋 재시도)
+
+        Args:
+            messages: 프롬프트 메시지 리스트
+            **kwargs: ChatOpenAI 호출 옵션
+
+        Returns:
+            str: 생성된 응답
+        """
+        async for attempt in _openai_retrying():
+            with attempt:
+                async with cls._openai_semaphore:
+                    response = await cls.get_llm().ainvoke(messages, **kwargs)
+                    return response.content
+
+    @classmethod
+    async def _astream(cls, messages: list[BaseMessage], **kwargs) -> AsyncIterator[str]:
+        """
+        LLM 스트리밍 호출
+
+        스트림이 끝날 때까지 동시 요청 수(OPENAI_MAX_CONCURRENCY)에 포함하며,
+        재시도는 첫 조각을 받기 전까지만 합니다.
+        (이미 전송한 조각이 중복되지 않도록 스트림 도중의 오류는 재시도하지 않음)
+
+        Args:
+            messages: 프롬프트 메시지 리스트
+            **kwargs: ChatOpenAI 호출 옵션
+
+        Yields:
+            str: 생성된 응답 조각
+        """
+        semaphore = cls._openai_semaphore
+        async for attempt in _openai_retrying():
+            with attempt:
+                # 백오프 대기 중에는 슬롯을 잡고 있지 않도록 시도마다 획득/반환
+                await semaphore.acquire()
+                stream = None
+                try:
+                    stream = cls.get_llm().astream(messages, **kwargs)
+                    first = await anext(stream, None)
+                except BaseException:
+                    # 실패한 시도의 스트림(HTTP 연결)을 정리한 뒤 재시도
+                    if stream is not None:
+                        await stream.aclose()
+                    semaphore.release()
+                    raise
+
+        try:
+            if first is None:
+                return
+            if first.content:
+                yield first.content
+            async for chunk in stream:
+                if chunk.content:
+                    yield chunk.content
+        finally:
+            await stream.aclose()
+            semaphore.release()
+
+    @classmethod
+    def get_encoder(cls) -> tiktoken.Encoding:
+        """
+        LLM 모델 토크나이저 가져오기 (싱글톤)
+
+        Returns:
+            tiktoken.Encoding: 토크나이저 (모델을 모르면 o200k_base)
+        """
+        if cls._encoder is None:
+            try:
+                cls._encoder = tiktoken.encoding_for_model(cls.LLM_MODEL)
+            except KeyError:
+                cls._encoder = tiktoken.get_encoding("o200k_base")
+        return cls._encoder
+
+    @classmethod
+    def get_reranker(cls) -> "CrossEncoder":
+        """
+        크로스 인코더 리랭커 가져오기 (싱글톤)
+
+        USE_RERANKER가 켜진 경우에만 사용되며, sentence-transformers 설치가 필요합니다.
+
+        Returns:
+            CrossEncoder: 리랭커 모델 인스턴스
+        """
+        if cls._reranker is None:
+            from sentence_transformers import CrossEncoder
+            cls._reranker = CrossEncoder(cls.RERANKER_MODEL, max_length=512)
+        return cls._reranker
+
+    @classmethod
+    def get_splitter(cls) -> Union[TextSplitter, RecursiveCharacterTextSplitter]:
+        """
+        텍스트 분할기 가져오기 (싱글톤)
+
+        TEXT_SPLITTER가 "semantic"이면 Rust 기반 semantic-text-splitter를,
+        "langchain"이면 기존 RecursiveCharacterTextSplitter를 사용합니다.
+
+        Returns:
+            Union[TextSplitter, RecursiveCharacterTextSplitter]: 텍스트 분할기 인스턴스
+        """
+        if cls._splitter is None:
+            if cls.TEXT_SPLITTER == "langchain":
+                cls._splitter = RecursiveCharacterTextSplitter(
+                    chunk_size=cls.CHUNK_SIZE,
+                    chunk_overlap=cls.CHUNK_OVERLAP,
+                    length_function=len,
+                    separators=["\n\n", "\n", " ", ""]
+                )
+            else:
+                # 청크 길이 범위 (CHUNK_SIZE - CHUNK_OVERLAP ~ CHUNK_SIZE 글자)
+                cls._splitter = TextSplitter(
+                    (cls.CHUNK_SIZE - cls.CHUNK_OVERLAP, cls.CHUNK_SIZE),
+                    overlap=cls.CHUNK_OVERLAP
+                )
+        return cls._splitter
+
     @staticmethod
     def split_text(text: str) -> list[str]:
         """
         텍스트를 청크로 분할
 
+        분할 후 CHUNK_MIN_SIZE보다 짧은 청크는 인접 청크와 병합하여
+        문맥이 부족한 조각 청크(임베딩 호출/벡터 행 낭비)를 줄입니다.
+
         Args:
             text: 분할할 텍스트
 
         Returns:
             list[str]: 분할된 청크 리스트
         """
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=RAGService.CHUNK_SIZE,
-            chunk_overlap=RAGService.CHUNK_OVERLAP,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
+        splitter = RAGService.get_splitter()
+        if isinstance(splitter, TextSplitter):
+            chunks = splitter.chunks(text)
+        else:
+            chunks = splitter.split_text(text)
+        return _merge_small(
+            chunks,
+            min_size=RAGService.CHUNK_MIN_SIZE,
+            max_size=RAGService.CHUNK_SIZE,
+            overlap=RAGService.CHUNK_OVERLAP
         )
-        chunks = text_splitter.split_text(text)
-        return chunks
+
+    @staticmethod
+    def chunk_ids(document_id: str, chunk_count: int) -> list[str]:
+        """
+        문서 청크 벡터 ID 생성 (저장/삭제 공용)
+
+        Args:
+            document_id: 문서 ID
+            chunk_count: 청크 수
+
+        Returns:
+            list[str]: "{document_id}_{i}" 형태의 ID 리스트
+        """
+        return [f"{document_id}_{i}" for i in range(chunk_count)]
 
     @staticmethod
     async def add_document_to_vectorstore(
@@ -122,31 +498,69 @@ class RAGService:
         """
         # 텍스트를 청크로 분할
         chunks = RAGService.split_text(text)
-
-        # Langchain Document 객체 생성
-        documents = [
-            LangchainDocument(
-                page_content=chunk,
-                metadata={
-                    **metadata,
-                    "document_id": document_id,
-                    "chunk_index": i
-                }
-            )
-            for i, chunk in enumerate(chunks)
+        if not chunks:
+            return 0
+
+        # 청크를 EMBEDDING_BATCH_SIZE개씩 묶어 배치별 API 호출을 최대 EMBEDDING_CONCURRENCY개까지 동시에 실행
+        semaphore = asyncio.Semaphore(RAGService.EMBEDDING_CONCURRENCY)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await RAGService._aembed_documents(batch)
+
+        batch_size = RAGService.EMBEDDING_BATCH_SIZE
+        batch_results = await asyncio.gather(*(
+            embed_batch(chunks[start:start + batch_size])
+            for start in range(0, len(chunks), batch_size)
+        ))
+        embeddings = [vector for batch in batch_results for vector in batch]
+
+        # 청크별 ID / 메타데이터 구성 (ID가 결정적이므로 재처리 시 중복 저장되지 않음)
+        ids = RAGService.chunk_ids(document_id, len(chunks))
+        metadatas = [
+            {
+                **metadata,
+                "document_id": document_id,
+                "chunk_index": i
+            }
+            for i in range(len(chunks))
         ]
 
-        # 벡터스토어에 추가
+        # 벡터스토어에 한 번에 저장
         vectorstore = RAGService.get_vectorstore()
-        vectorstore.add_documents(documents)
+        await vectorstore.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=chunks,
+            metadatas=metadatas
+        )
+        query_cache.invalidate_search()
 
         return len(chunks)
 
+    @staticmethod
+    async def embed_query(query: str) -> list[float]:
+        """
+        검색 쿼리 임베딩
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            list[float]: 쿼리 임베딩
+        """
+        embedding = query_cache.get_embedding(query)
+        if embedding is None:
+            embedding = await RAGService._aembed_query(query)
+            query_cache.set_embedding(query, embedding)
+        return embedding
+
     @staticmethod
     async def search_similar_chunks(
         query: str,
         document_ids: Optional[list[str]] = None,
-        k: Optional[int] = None
+        k: Optional[int] = None,
+        query_embedding: Optional[list[float]] = None
     ) -> list[dict]:
         """
         유사한 청크 검색
@@ -155,6 +569,7 @@ class RAGService:
             query: 검색 쿼리
             document_ids: 검색할 문서 ID 리스트 (None이면 전체 검색)
             k: 반환할 결과 개수 (None이면 TOP_K_RESULTS 사용)
+            query_embedding: 미리 계산한 쿼리 임베딩 (None이면 새로 계산)
 
         Returns:
             list[dict]: 유사한 청크 리스트
@@ -162,113 +577,302 @@ class RAGService:
         vectorstore = RAGService.get_vectorstore()
         k = k or RAGService.TOP_K_RESULTS
 
-        # 문서 ID 필터링
-        if document_ids:
-            # ChromaDB where 조건 사용
-            results = vectorstore.similarity_search(
-                query,
+        # 같은 질문의 재시도/재생성은 캐시된 검색 결과 사용
+        cached = query_cache.get_results(query, document_ids, k)
+        if cached is not None:
+            return cached
+
+        # 질의 임베딩은 비동기 API 호출, 검색은 백엔드에 위임
+        if query_embedding is None:
+            query_embedding = await RAGService.embed_query(query)
+
+        if not RAGService.USE_RERANKER:
+            results = await vectorstore.similarity_search(
+                query_embedding,
                 k=k,
-                filter={"document_id": {"$in": document_ids}}
+                group_ids=document_ids
             )
         else:
-            results = vectorstore.similarity_search(query, k=k)
+            # 후보를 넉넉히 가져온 뒤 크로스 인코더 점수로 상위 k개만 남김
+            candidates = await vectorstore.similarity_search(
+                query_embedding,
+                k=k * RAGService.RERANK_FETCH_MULTIPLIER,
+                group_ids=document_ids
+            )
+            results = await RAGService._rerank(query, candidates, k)
+
+        query_cache.set_results(query, document_ids, k, results)
+        return results
+
+    @staticmethod
+    async def _rerank(query: str, chunks: list[dict], k: int) -> list[dict]:
+        """
+        크로스 인코더로 청크 재정렬
+
+        Args:
+            query: 검색 쿼리
+            chunks: 후보 청크 리스트
+            k: 반환할 결과 개수
+
+        Returns:
+            list[dict]: 관련도 순 상위 k개 청크
+        """
+        if len(chunks) <= 1:
+            return chunks
+
+        # 모델 추론(CPU 바운드)은 스레드풀에서 실행
+        reranker = RAGService.get_reranker()
+        scores = await run_in_threadpool(
+            reranker.predict,
+            [(query, chunk["content"]) for chunk in chunks]
+        )
+        ranked = sorted(zip(scores, chunks), key=lambda pair: pair[0], reverse=True)
+        return [chunk for _, chunk in ranked[:k]]
+
+    @staticmethod
+    async def index_turns(conversation_id: str, turns: list[dict]) -> None:
+        """
+        대화 턴을 대화 벡터스토어에 저장
 
-        # 결과를 딕셔너리로 변환
-        return [
+        Args:
+            conversation_id: 채팅 ID
+            turns: [{"id": 메시지 ID, "role": ..., "content": ...}, ...] (content는 질문/답변 원문, 참고 문서 제외)
+        """
+        if not turns:
+            return
+
+        # 한 번의 임베딩 API 호출로 모든 턴 임베딩
+        contents = [turn["content"] for turn in turns]
+        embeddings = await RAGService._aembed_documents(contents)
+
+        await RAGService.get_conversation_store().upsert(
+            ids=[turn["id"] for turn in turns],
+            embeddings=embeddings,
+            documents=contents,
+            metadatas=[
+                {
+                    "type": "chat",
+                    "conversation_id": conversation_id,
+                    "message_id": turn["id"],
+                    "role": turn["role"]
+                }
+                for turn in turns
+            ]
+        )
+
+    @staticmethod
+    async def delete_conversations(conversation_ids: list[str]) -> None:
+        """
+        채팅 삭제 시 대화 턴 벡터 삭제
+
+        삭제된 채팅의 질문/답변 원문이 대화 벡터스토어에 남지 않도록 합니다.
+        DB 삭제는 이미 커밋된 뒤이므로 실패해도 예외를 전파하지 않고 로그만 남깁니다.
+
+        Args:
+            conversation_ids: 삭제된 채팅 ID 리스트
+        """
+        store = RAGService.get_conversation_store()
+        for conversation_id in conversation_ids:
+            try:
+                await store.delete(conversation_id)
+            except Exception as e:
+                logger.warning("Failed to delete conversation turns for chat %s: %s", conversation_id, e)
+
+    @staticmethod
+    async def search_conversation(
+        conversation_id: str,
+        query_embedding: list[float],
+        k: Optional[int] = None
+    ) -> list[dict]:
+        """
+        질문과 관련된 이전 대화 턴 검색
+
+        Args:
+            conversation_id: 채팅 ID
+            query_embedding: 쿼리 임베딩
+            k: 반환할 턴 개수 (None이면 CONVERSATION_RETRIEVAL_K 사용)
+
+        Returns:
+            list[dict]: 오래된 순 대화 턴 [{"id", "role", "content"}, ...]
+        """
+        results = await RAGService.get_conversation_store().similarity_search(
+            query_embedding,
+            k=k or RAGService.CONVERSATION_RETRIEVAL_K,
+            group_ids=[conversation_id]
+        )
+        turns = [
             {
-                "content": doc.page_content,
-                "metadata": doc.metadata
+                "id": result["metadata"]["message_id"],
+                "role": result["metadata"]["role"],
+                "content": result["content"]
             }
-            for doc in results
+            for result in results
         ]
+        # 메시지 ID(ULID)는 시간순이므로 ID 순으로 정렬
+        turns.sort(key=lambda turn: turn["id"])
+        return turns
 
     @staticmethod
-    async def generate_response(
+    def _fit_history(conversation_history: list[dict]) -> list[dict]:
+        """
+        대화 히스토리를 HISTORY_TOKEN_BUDGET 토큰 이내로 자르기
+
+        최근 메시지부터 토큰 수를 더해가며 포함하고, 예산을 넘기는 메시지는
+        남은 토큰만큼 앞부분만 남긴 뒤 중단합니다.
+
+        Args:
+            conversation_history: 오래된 순 대화 히스토리
+
+        Returns:
+            list[dict]: 예산 이내의 오래된 순 대화 히스토리
+        """
+        encoder = RAGService.get_encoder()
+        remaining = RAGService.HISTORY_TOKEN_BUDGET
+        fitted = []
+        for msg in reversed(conversation_history):
+            if remaining <= 0:
+                break
+            tokens = encoder.encode(msg["content"])
+            if len(tokens) > remaining:
+                msg = {**msg, "content": encoder.decode(tokens[:remaining]) + "..."}
+            fitted.append(msg)
+            remaining -= len(tokens)
+        fitted.reverse()
+        return fitted
+
+    @staticmethod
+    def _build_messages(
         query: str,
         context_chunks: list[dict],
-        conversation_history: list[dict] = None
-    ) -> str:
+        conversation_history: Optional[list[dict]] = None
+    ) -> list[BaseMessage]:
         """
-        RAG 기반 응답 생성 (대화 히스토리 포함)
+        LLM 입력 메시지 구성
+
+        고정된 시스템 프롬프트와 이전 대화를 앞쪽 메시지로, 참고 문서와 질문을 마지막
+        사용자 메시지로 보내 매 호출의 앞부분(prefix)이 프롬프트 캐시에 적중하도록 합니다.
+
+        참고 문서가 붙은 마지막 사용자 메시지는 이번 호출에만 쓰이고 저장되지 않습니다.
+        대화 히스토리(DB 메시지, 대화 벡터스토어)에는 사용자 질문과 답변만 저장하므로,
+        다음 턴에 다시 전달되는 히스토리에는 문서 청크가 포함되지 않습니다.
 
         Args:
             query: 사용자 질문
             context_chunks: 컨텍스트 청크 리스트
-            conversation_history: 이전 대화 히스토리 (선택적)
+            conversation_history: 이전 대화 히스토리 (선택적, content는 질문/답변 원문만 포함해야 함)
 
         Returns:
-            str: 생성된 응답
+            list[BaseMessage]: LLM 입력 메시지 리스트
         """
-        llm = RAGService.get_llm()
+        # 문서가 있는 경우와 없는 경우 구분
+        system_message = _SYSTEM_MESSAGE_WITH_DOCS if context_chunks else _SYSTEM_MESSAGE_CHAT
+        messages: list[BaseMessage] = [system_message]
 
-        # 대화 히스토리 포맷팅
-        history_text = ""
-        if conversation_history and len(conversation_history) > 0:
-            history_text = "\n\n이전 대화 내용:\n"
-            for msg in conversation_history:
-                role_name = "사용자" if msg["role"] == "user" else "어시스턴트"
-                # 너무 긴 메시지는 요약
-                content = msg["content"]
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                history_text += f"{role_name}: {content}\n"
+        # 대화 히스토리
+        for msg in RAGService._fit_history(conversation_history or []):
+            if msg["role"] == "user":
+                messages.append(HumanMessage(content=msg["content"]))
+            else:
+                messages.append(AIMessage(content=msg["content"]))
 
-        # 문서가 있는 경우와 없는 경우 구분
         if context_chunks:
-            # 컨텍스트 구성
+            # 컨텍스트 구성 (유사도 순이 아닌 문서/청크 순으로 정렬하여,
+            # 같은 문서를 참고하는 요청끼리 프롬프트 앞부분이 최대한 일치하도록 함)
+            ordered_chunks = sorted(
+                context_chunks,
+                key=lambda chunk: (
+                    chunk['metadata'].get('document_id', ''),
+                    chunk['metadata'].get('chunk_index', 0)
+                )
+            )
             context = "\n\n".join([
-                f"[문서: {chunk['metadata'].get('filename', 'Unknown')}]\n{chunk['content']}"
-                for chunk in context_chunks
+                CONTEXT_CHUNK_TEMPLATE.format(
+                    filename=chunk['metadata'].get('filename', 'Unknown'),
+                    content=chunk['content']
+                )
+                for chunk in ordered_chunks
             ])
+            messages.append(HumanMessage(content=DOCUMENT_QUESTION_TEMPLATE.format(context=context, query=query)))
+        else:
+            messages.append(HumanMessage(content=query))
 
-            # 프롬프트 구성 (문서 기반)
-            prompt = f"""당신은 친절한 AI 어시스턴트입니다. 사용자가 업로드한 문서 내용을 참고하여 답변할 수 있습니다.
-{history_text}
+        return messages
 
-참고 문서 내용:
+    @staticmethod
+    def _llm_kwargs(cache_key: Optional[str]) -> dict:
+        """
+        LLM 호출 옵션 (같은 키의 요청은 같은 프롬프트 캐시 서버로 라우팅)
 
-{context}
+        Args:
+            cache_key: 프롬프트 캐시 라우팅 키 (예: 채팅 ID)
 
-사용자 질문: {query}
+        Returns:
+            dict: LLM 호출 키워드 인자
+        """
+        if cache_key:
+            return {"extra_body": {"prompt_cache_key": cache_key}}
+        return {}
 
-답변 시 주의사항:
-1. 위 대화 히스토리를 참고하여 맥락을 이해하세요.
-2. 문서 내용이 질문과 관련이 있다면 우선적으로 참고하여 답변하세요.
-3. 문서 내용을 사용했다면 어떤 문서를 참고했는지 간단히 언급하세요.
-4. 문서 내용이 질문과 관련이 없다면, 일반 지식을 바탕으로 친절하게 답변하세요.
-5. 한국어로 답변하세요.
+    @staticmethod
+    async def generate_response(
+        query: str,
+        context_chunks: list[dict],
+        conversation_history: list[dict] = None,
+        cache_key: Optional[str] = None
+    ) -> str:
+        """
+        RAG 기반 응답 생성 (대화 히스토리 포함)
 
-답변:"""
-        else:
-            # 프롬프트 구성 (일반 대화)
-            prompt = f"""당신은 친절한 AI 어시스턴트입니다.
-{history_text}
+        Args:
+            query: 사용자 질문
+            context_chunks: 컨텍스트 청크 리스트
+            conversation_history: 이전 대화 히스토리 (선택적)
+            cache_key: 프롬프트 캐시 라우팅 키 (예: 채팅 ID)
 
-사용자 질문: {query}
+        Returns:
+            str: 생성된 응답
+        """
+        messages = RAGService._build_messages(query, context_chunks, conversation_history)
+        return await RAGService._ainvoke(messages, **RAGService._llm_kwargs(cache_key))
 
-답변 시 주의사항:
-1. 위 대화 히스토리를 참고하여 맥락을 이해하세요.
-2. 친절하고 정확하게 답변하세요.
-3. 한국어로 답변하세요.
-4. 모르는 내용은 모른다고 솔직히 말하세요.
+    @staticmethod
+    async def stream_response(
+        query: str,
+        context_chunks: list[dict],
+        conversation_history: list[dict] = None,
+        cache_key: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        RAG 기반 응답 스트리밍 (토큰이 생성되는 대로 반환)
 
-답변:"""
+        Args:
+            query: 사용자 질문
+            context_chunks: 컨텍스트 청크 리스트
+            conversation_history: 이전 대화 히스토리 (선택적)
+            cache_key: 프롬프트 캐시 라우팅 키 (예: 채팅 ID)
 
-        # LLM 호출
-        response = await llm.ainvoke(prompt)
-        return response.content
+        Yields:
+            str: 생성된 응답 조각
+        """
+        messages = RAGService._build_messages(query, context_chunks, conversation_history)
+        async for content in RAGService._astream(messages, **RAGService._llm_kwargs(cache_key)):
+            yield content
 
     @staticmethod
-    async def delete_document_from_vectorstore(document_id: str):
+    async def delete_document_from_vectorstore(document_id: str, chunk_count: Optional[int] = None):
         """
         벡터스토어에서 문서 삭제
 
+        청크 ID는 "{document_id}_{i}"로 결정적이므로, 청크 수(Document.chunkCount)를 알면
+        메타데이터 필터 검색 없이 ID로 바로 삭제합니다.
+
         Args:
             document_id: 삭제할 문서 ID
+            chunk_count: 문서의 청크 수 (없으면 document_id 메타데이터 필터로 삭제)
         """
         vectorstore = RAGService.get_vectorstore()
-
-        # document_id로 필터링하여 삭제
-        vectorstore.delete(
-            filter={"document_id": document_id}
-        )
+        if chunk_count:
+            await vectorstore.delete_ids(RAGService.chunk_ids(document_id, chunk_count))
+        else:
+            await vectorstore.delete(document_id)
+        query_cache.invalidate_search()  # 삭제된 청크가 캐시된 검색 결과에 남지 않도록
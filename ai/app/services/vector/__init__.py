@@ -0,0 +1,9 @@
+"""
+Vector Store Package
+
+RAG 벡터스토어 백엔드(Chroma, pgvector)를 포함합니다.
+"""
+
+from app.services.vector.base import VectorBackend
+
+__all__ = ["VectorBackend"]
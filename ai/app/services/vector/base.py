@@ -0,0 +1,71 @@
+"""
+Vector Backend Protocol
+
+RAGService가 사용하는 벡터스토어 백엔드 인터페이스
+"""
+
+from typing import Optional, Protocol
+
+
+class VectorBackend(Protocol):
+    """
+    벡터스토어 백엔드 인터페이스
+
+    임베딩 계산은 RAGService에서 수행하고, 백엔드는 벡터 저장/검색/삭제만 담당합니다.
+    각 벡터는 그룹 ID(문서 청크는 문서 ID, 대화 턴은 채팅 ID)로 묶여 검색/삭제됩니다.
+    """
+
+    async def upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """
+        벡터 저장 (같은 ID가 있으면 덮어쓰기)
+
+        Args:
+            ids: 벡터 ID 리스트
+            embeddings: 임베딩 리스트
+            documents: 원문 텍스트 리스트
+            metadatas: 메타데이터 리스트 (그룹 ID 필드 포함)
+        """
+        ...
+
+    async def similarity_search(
+        self,
+        query_embedding: list[float],
+        k: int,
+        group_ids: Optional[list[str]] = None
+    ) -> list[dict]:
+        """
+        유사한 청크 검색
+
+        Args:
+            query_embedding: 검색 쿼리 임베딩
+            k: 반환할 결과 개수
+            group_ids: 검색할 그룹 ID 리스트 (None이면 전체 검색)
+
+        Returns:
+            list[dict]: {"content", "metadata"} 형태의 결과 리스트 (유사도 순)
+        """
+        ...
+
+    async def delete(self, group_id: str) -> None:
+        """
+        그룹의 모든 벡터 삭제
+
+        Args:
+            group_id: 삭제할 그룹 ID
+        """
+        ...
+
+    async def delete_ids(self, ids: list[str]) -> None:
+        """
+        ID로 벡터 삭제 (메타데이터 필터 없이 기본 키로 삭제)
+
+        Args:
+            ids: 삭제할 벡터 ID 리스트 (없는 ID는 무시)
+        """
+        ...
@@ -0,0 +1,123 @@
+"""
+Chroma Vector Backend
+
+로컬 디스크 기반 ChromaDB 벡터스토어 (개발 환경용)
+"""
+
+import asyncio
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from langchain_community.vectorstores import Chroma
+
+# 컬렉션 upsert 1회당 최대 벡터 수
+WRITE_BATCH_SIZE = 500
+
+
+class ChromaBackend:
+    """
+    ChromaDB 벡터스토어 백엔드
+
+    Chroma 호출은 동기(디스크 I/O)이므로 스레드풀에서 실행합니다.
+
+    쓰기는 단일 writer 태스크가 모아서 처리합니다 (group commit).
+    동시에 들어온 여러 문서의 upsert를 WRITE_BATCH_SIZE 단위로 합쳐 SQLite 커밋/flush 횟수를 줄이고,
+    스레드 간 SQLite 락 경합을 없앱니다. 호출자는 자신의 벡터가 기록될 때까지 대기합니다.
+    """
+
+    def __init__(self, persist_directory: str, collection_name: str, group_key: str):
+        """
+        Args:
+            persist_directory: ChromaDB 저장 경로
+            collection_name: 컬렉션 이름
+            group_key: 그룹 ID가 저장된 메타데이터 필드 (예: document_id)
+        """
+        self._store = Chroma(persist_directory=persist_directory, collection_name=collection_name)
+        self._group_key = group_key
+        self._pending: list[tuple[list[str], list[list[float]], list[str], list[dict], asyncio.Future]] = []
+        self._writer: Optional[asyncio.Task] = None
+
+    async def upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """벡터를 쓰기 대기열에 추가하고 기록될 때까지 대기"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((ids, embeddings, documents, metadatas, future))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+        await future
+
+    async def _drain(self) -> None:
+        """대기열이 빌 때까지 쌓인 쓰기를 합쳐서 기록"""
+        while self._pending:
+            pending, self._pending = self._pending, []
+
+            # 같은 ID가 여러 번 들어온 경우 마지막 값만 기록 (Chroma는 한 호출 내 중복 ID 불허)
+            rows: dict[str, tuple[list[float], str, dict]] = {}
+            for ids, embeddings, documents, metadatas, _ in pending:
+                for row in zip(ids, embeddings, documents, metadatas):
+                    rows[row[0]] = row[1:]
+            items = list(rows.items())
+
+            try:
+                for start in range(0, len(items), WRITE_BATCH_SIZE):
+                    batch = items[start:start + WRITE_BATCH_SIZE]
+                    await run_in_threadpool(
+                        self._store._collection.upsert,
+                        ids=[row_id for row_id, _ in batch],
+                        embeddings=[row[0] for _, row in batch],
+                        documents=[row[1] for _, row in batch],
+                        metadatas=[row[2] for _, row in batch]
+                    )
+            except Exception as e:
+                for *_, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for *_, future in pending:
+                    if not future.done():
+                        future.set_result(None)
+
+    async def similarity_search(
+        self,
+        query_embedding: list[float],
+        k: int,
+        group_ids: Optional[list[str]] = None
+    ) -> list[dict]:
+        """쿼리 임베딩으로 유사한 벡터 검색"""
+        # ChromaDB where 조건 사용
+        where = {self._group_key: {"$in": group_ids}} if group_ids else None
+        result = await run_in_threadpool(
+            self._store._collection.query,
+            query_embeddings=[query_embedding],
+            n_results=k,
+            where=where,
+            include=["documents", "metadatas"]
+        )
+        return [
+            {
+                "content": content,
+                "metadata": metadata or {}
+            }
+            for content, metadata in zip(result["documents"][0], result["metadatas"][0])
+        ]
+
+    async def delete(self, group_id: str) -> None:
+        """그룹 ID로 필터링하여 삭제"""
+        # 대기 중인 쓰기가 삭제 이후에 기록되지 않도록 먼저 비움
+        if self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+        await run_in_threadpool(
+            self._store._collection.delete,
+            where={self._group_key: group_id}
+        )
+
+    async def delete_ids(self, ids: list[str]) -> None:
+        """ID로 삭제 (메타데이터 스캔 없음)"""
+        # 대기 중인 쓰기가 삭제 이후에 기록되지 않도록 먼저 비움
+        if self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+        await run_in_threadpool(self._store._collection.delete, ids=ids)
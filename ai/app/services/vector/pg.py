@@ -0,0 +1,216 @@
+"""
+pgvector Vector Backend
+
+PostgreSQL pgvector 확장 + HNSW 인덱스 기반 벡터스토어 (운영 환경용)
+
+pgvector 0.8.0 이상 권장 (문서 필터 검색에 iterative index scan 사용).
+0.7.x에서는 필터 검색을 인덱스 없이 정확 검색으로 처리합니다. (halfvec은 0.7.0 이상 필요)
+"""
+
+import asyncio
+from typing import Optional
+from sqlalchemy import Column, Index, MetaData, String, Table, Text, delete, select, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from pgvector.sqlalchemy import HALFVEC, Vector
+
+from app.config import settings
+
+# HNSW 인덱스 빌드 파라미터
+HNSW_M = 24
+HNSW_EF_CONSTRUCTION = 128
+
+# hnsw.iterative_scan을 지원하는 최소 pgvector 버전
+ITERATIVE_SCAN_MIN_VERSION = (0, 8, 0)
+
+# 임베딩 저장 타입 (halfvec: float16으로 저장하여 테이블/HNSW 인덱스 크기 절반)
+if settings.PGVECTOR_HALFVEC:
+    EMBEDDING_TYPE = HALFVEC(settings.PGVECTOR_DIMENSIONS)
+    EMBEDDING_OPS = "halfvec_cosine_ops"
+else:
+    EMBEDDING_TYPE = Vector(settings.PGVECTOR_DIMENSIONS)
+    EMBEDDING_OPS = "vector_cosine_ops"
+
+# ORM 모델(Base.metadata)과 분리하여, pgvector를 쓰지 않는 환경에서는 테이블을 만들지 않음
+_metadata = MetaData(schema=settings.DB_SCHEMA)
+
+
+def _vector_table(name: str) -> Table:
+    """
+    벡터 테이블 정의 (group_id: 문서 ID 또는 채팅 ID)
+
+    Args:
+        name: 테이블 이름
+
+    Returns:
+        Table: HNSW 인덱스가 포함된 테이블
+    """
+    return Table(
+        name,
+        _metadata,
+        Column("id", String, primary_key=True),
+        Column("group_id", String, nullable=False, index=True),
+        Column("content", Text, nullable=False),
+        Column("metadata", JSONB, nullable=False),
+        Column("embedding", EMBEDDING_TYPE, nullable=False),
+        Index(
+            f"ix_{name}_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+            postgresql_ops={"embedding": EMBEDDING_OPS}
+        )
+    )
+
+
+def _parse_version(version: Optional[str]) -> tuple[int, ...]:
+    """pgvector 확장 버전 문자열 파싱 (예: "0.8.0" → (0, 8, 0))"""
+    try:
+        return tuple(int(part) for part in (version or "").split("."))
+    except ValueError:
+        return ()
+
+
+# 문서 청크 / 대화 턴 테이블
+document_chunks = _vector_table("document_chunks")
+conversation_turns = _vector_table("conversation_turns")
+
+
+class PgVectorBackend:
+    """
+    pgvector 벡터스토어 백엔드
+
+    애플리케이션 DB 엔진(asyncpg)을 그대로 사용하며,
+    테이블과 HNSW 인덱스는 최초 사용 시 생성합니다.
+    """
+
+    def __init__(self, engine: AsyncEngine, table: Table, group_key: str, ef_search: int):
+        """
+        Args:
+            engine: 비동기 DB 엔진
+            table: 벡터 테이블 (document_chunks 또는 conversation_turns)
+            group_key: 그룹 ID가 저장된 메타데이터 필드 (예: document_id)
+            ef_search: 검색 시 HNSW 후보 리스트 크기 (클수록 recall↑, 속도↓)
+        """
+        self._engine = engine
+        self._table = table
+        self._group_key = group_key
+        self._ef_search = int(ef_search)
+        self._schema_ready = False
+        self._schema_lock = asyncio.Lock()
+        self._iterative_scan = False
+
+    async def _ensure_schema(self) -> None:
+        """vector 확장, 테이블, HNSW 인덱스 생성 (프로세스당 한 번)"""
+        if self._schema_ready:
+            return
+        async with self._schema_lock:
+            if self._schema_ready:
+                return
+            async with self._engine.begin() as conn:
+                # 여러 워커가 동시에 DDL을 실행하지 않도록 advisory lock (트랜잭션 종료 시 해제)
+                await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('nura_vector_init'))"))
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+                await conn.run_sync(_metadata.create_all, tables=[self._table])
+                version = await conn.scalar(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'"))
+            self._iterative_scan = _parse_version(version) >= ITERATIVE_SCAN_MIN_VERSION
+            self._schema_ready = True
+
+    async def upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """벡터를 INSERT ... ON CONFLICT로 저장 (재처리 시 덮어쓰기)"""
+        await self._ensure_schema()
+
+        stmt = insert(self._table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self._table.c.id],
+            set_={
+                "group_id": stmt.excluded["group_id"],
+                "content": stmt.excluded["content"],
+                "metadata": stmt.excluded["metadata"],
+                "embedding": stmt.excluded["embedding"]
+            }
+        )
+        rows = [
+            {
+                "id": row_id,
+                "group_id": metadata[self._group_key],
+                "content": content,
+                "metadata": metadata,
+                "embedding": embedding
+            }
+            for row_id, embedding, content, metadata in zip(ids, embeddings, documents, metadatas)
+        ]
+        async with self._engine.begin() as conn:
+            await conn.execute(stmt, rows)
+
+    async def similarity_search(
+        self,
+        query_embedding: list[float],
+        k: int,
+        group_ids: Optional[list[str]] = None
+    ) -> list[dict]:
+        """
+        코사인 거리 순으로 HNSW 인덱스 검색
+
+        HNSW 인덱스는 ef_search개 후보를 먼저 찾은 뒤 WHERE 조건을 적용하므로,
+        전체 중 일부 문서로 필터링하면 결과가 k개보다 적거나 비어 있을 수 있습니다.
+        group_ids가 있으면 pgvector 0.8+의 iterative scan으로 조건을 만족하는 결과가
+        k개 모일 때까지 인덱스를 계속 탐색하고, 이전 버전에서는 인덱스 없이 정확 검색합니다.
+        """
+        await self._ensure_schema()
+
+        table = self._table
+        distance = table.c.embedding.cosine_distance(query_embedding).label("distance")
+        stmt = (
+            select(table.c.content, table.c.metadata, distance)
+            .order_by(distance)
+            .limit(k)
+        )
+        if group_ids:
+            stmt = stmt.where(table.c.group_id.in_(group_ids))
+
+        async with self._engine.begin() as conn:
+            # SET LOCAL은 현재 트랜잭션에만 적용되므로 풀의 다른 커넥션에 영향 없음
+            await conn.execute(text(f"SET LOCAL hnsw.ef_search = {self._ef_search}"))
+            if group_ids:
+                if self._iterative_scan:
+                    await conn.execute(text("SET LOCAL hnsw.iterative_scan = relaxed_order"))
+                else:
+                    # 인덱스 스캔을 끄면 group_id 비트맵 스캔 후 거리 정렬 (정확 검색)
+                    await conn.execute(text("SET LOCAL enable_indexscan = off"))
+            rows = (await conn.execute(stmt)).all()
+
+        # relaxed_order는 결과 순서가 약간 어긋날 수 있으므로 거리로 다시 정렬
+        rows = sorted(rows, key=lambda row: row.distance)
+
+        return [
+            {
+                "content": content,
+                "metadata": metadata
+            }
+            for content, metadata, _ in rows
+        ]
+
+    async def delete(self, group_id: str) -> None:
+        """그룹 ID로 필터링하여 삭제"""
+        await self._ensure_schema()
+
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                delete(self._table).where(self._table.c.group_id == group_id)
+            )
+
+    async def delete_ids(self, ids: list[str]) -> None:
+        """기본 키로 삭제"""
+        await self._ensure_schema()
+
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                delete(self._table).where(self._table.c.id.in_(ids))
+            )
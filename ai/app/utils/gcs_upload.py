@@ -5,29 +5,96 @@ Google Cloud Storage 파일 업로드 유틸리티
 """
 
 import os
-from typing import BinaryIO
+from datetime import timedelta
+from functools import lru_cache
+from typing import BinaryIO, Optional
+from urllib.parse import quote
+import httpx
+from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import Request as AuthRequest
 from google.cloud import storage
+from google.oauth2 import service_account
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 
 
+@lru_cache
+def _get_client(credentials_path: str) -> storage.Client:
+    """
+    GCS 클라이언트 반환 (자격 증명 파일별로 한 번만 생성하여 공유)
+
+    Args:
+        credentials_path: 서비스 계정 키 파일 경로
+
+    Returns:
+        storage.Client: GCS 클라이언트
+    """
+    return storage.Client.from_service_account_json(credentials_path)
+
+
+@lru_cache
+def _get_bucket(credentials_path: str, bucket_name: str) -> storage.Bucket:
+    """
+    GCS 버킷 핸들 반환 (버킷 이름별로 한 번만 생성하여 공유)
+
+    Args:
+        credentials_path: 서비스 계정 키 파일 경로
+        bucket_name: 버킷 이름
+
+    Returns:
+        storage.Bucket: 버킷 핸들
+    """
+    return _get_client(credentials_path).bucket(bucket_name)
+
+
 class GCSUploader:
     """
     GCS 파일 업로드 헬퍼 클래스
     """
 
+    # 재개 가능한(resumable) 업로드 청크 크기 (256KB의 배수여야 함)
+    UPLOAD_CHUNK_SIZE = 2 * 1024 * 1024  # 2MB
+
+    # 파일 확장자별 Content-Type
+    CONTENT_TYPES = {
+        "pdf": "application/pdf",
+        "md": "text/markdown",
+        "txt": "text/plain"
+    }
+
+    # 업로드 파일의 Cache-Control (문서 ID별 경로라 내용이 바뀌지 않으므로 immutable)
+    CACHE_CONTROL = "public, max-age=3600, immutable"
+
+    # 다운로드 스트리밍 청크 크기 및 읽기 전용 권한 범위
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+    READ_ONLY_SCOPE = "https://www.googleapis.com/auth/devstorage.read_only"
+
     def __init__(self):
         self.project_id = settings.GCP_PROJECT_ID
         self.bucket_name = settings.GCP_BUCKET_NAME
         self.credentials_path = settings.GOOGLE_APPLICATION_CREDENTIALS
 
+        # 공개 URL 접두사 (CDN_HOST가 설정되면 CDN을 거쳐 제공)
+        if settings.CDN_HOST:
+            self.public_base_url = f"https://{settings.CDN_HOST}/"
+        else:
+            self.public_base_url = f"https://storage.googleapis.com/{self.bucket_name}/"
+
         if not all([self.project_id, self.bucket_name, self.credentials_path]):
             raise ValueError("GCP configuration is missing in environment variables")
 
-        # GCS 클라이언트 초기화
-        self.client = storage.Client.from_service_account_json(self.credentials_path)
-        self.bucket = self.client.bucket(self.bucket_name)
+        # GCS 클라이언트 / 버킷 (모듈 수준에서 공유, 인스턴스를 더 만들어도 재인증하지 않음)
+        self.client = _get_client(self.credentials_path)
+        self.bucket = _get_bucket(self.credentials_path, self.bucket_name)
+
+        # 비동기 다운로드용 자격 증명 및 HTTP 클라이언트 (첫 다운로드 시 생성)
+        self.read_credentials = service_account.Credentials.from_service_account_file(
+            self.credentials_path,
+            scopes=[self.READ_ONLY_SCOPE]
+        )
+        self._http_client: Optional[httpx.AsyncClient] = None
 
     async def upload_document(
         self,
@@ -52,30 +119,26 @@ class GCSUploader:
         try:
             # GCS blob 경로: user-documents/{document_id}.{extension}
             blob_name = f"user-documents/{document_id}.{file_extension}"
-            blob = self.bucket.blob(blob_name)
-
-            # 파일 읽기
-            file_content = await file.read()
+            blob = self.bucket.blob(blob_name, chunk_size=self.UPLOAD_CHUNK_SIZE)
+            blob.cache_control = self.CACHE_CONTROL
 
             # Content-Type 설정
-            content_type_map = {
-                "pdf": "application/pdf",
-                "md": "text/markdown",
-                "txt": "text/plain"
-            }
-            content_type = content_type_map.get(file_extension, "application/octet-stream")
-
-            # GCS에 업로드
-            blob.upload_from_string(
-                file_content,
-                content_type=content_type
+            content_type = self.content_type(file_extension)
+
+            # GCS에 청크 단위로 스트리밍 업로드 (파일 전체를 메모리에 올리지 않음)
+            await file.seek(0)
+            await run_in_threadpool(
+                blob.upload_from_file,
+                file.file,
+                content_type=content_type,
+                rewind=True
             )
 
             # 파일을 처음으로 되돌림 (재사용을 위해)
             await file.seek(0)
 
             # Public URL 반환
-            return f"https://storage.googleapis.com/{self.bucket_name}/{blob_name}"
+            return self.public_url(blob_name)
 
         except Exception as e:
             raise HTTPException(
@@ -83,6 +146,142 @@ class GCSUploader:
                 detail=f"Failed to upload file to GCS: {str(e)}"
             )
 
+    def public_url(self, blob_name: str) -> str:
+        """
+        blob의 공개 URL 반환 (CDN_HOST가 설정되면 CDN URL)
+
+        Args:
+            blob_name: blob 이름 (user-documents/uuid.pdf)
+
+        Returns:
+            str: 공개 URL
+        """
+        return f"{self.public_base_url}{blob_name}"
+
+    def blob_name(self, document_path: str) -> str:
+        """
+        문서 URL에서 blob 이름 추출 (GCS URL / CDN URL 모두 지원)
+
+        https://storage.googleapis.com/bucket-name/user-documents/uuid.pdf
+        -> user-documents/uuid.pdf
+
+        Args:
+            document_path: 문서 URL
+
+        Returns:
+            str: blob 이름
+        """
+        if document_path.startswith(self.public_base_url):
+            return document_path[len(self.public_base_url):]
+        return document_path.split(f"{self.bucket_name}/")[-1]
+
+    def content_type(self, file_extension: str) -> str:
+        """
+        파일 확장자에 맞는 Content-Type 반환
+
+        Args:
+            file_extension: 파일 확장자 (pdf, md, txt)
+
+        Returns:
+            str: Content-Type
+        """
+        return self.CONTENT_TYPES.get(file_extension, "application/octet-stream")
+
+    def generate_signed_upload_url(
+        self,
+        document_id: str,
+        file_extension: str,
+        expires_in: int
+    ) -> tuple[str, str]:
+        """
+        클라이언트가 GCS에 직접 업로드할 V4 서명 URL 생성 (PUT)
+
+        서명은 서비스 계정 키로 로컬에서 수행되므로 네트워크 호출이 없습니다.
+        클라이언트는 같은 Content-Type 헤더로 PUT 요청해야 합니다.
+
+        Args:
+            document_id: 문서 ID (ULID)
+            file_extension: 파일 확장자 (pdf, md, txt)
+            expires_in: URL 유효 시간 (초)
+
+        Returns:
+            tuple[str, str]: (서명된 업로드 URL, 업로드 후 파일 GCS URL)
+        """
+        blob_name = f"user-documents/{document_id}.{file_extension}"
+        blob = self.bucket.blob(blob_name)
+        upload_url = blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expires_in),
+            method="PUT",
+            content_type=self.content_type(file_extension)
+        )
+        return upload_url, self.public_url(blob_name)
+
+    async def get_document_size(self, document_path: str) -> Optional[int]:
+        """
+        GCS에 업로드된 문서 크기 조회
+
+        Args:
+            document_path: GCS URL
+
+        Returns:
+            Optional[int]: 파일 크기 (바이트, 파일이 없으면 None)
+        """
+        blob_name = self.blob_name(document_path)
+        blob = await run_in_threadpool(self.bucket.get_blob, blob_name)
+        return blob.size if blob is not None else None
+
+    async def _get_access_token(self) -> str:
+        """
+        다운로드용 OAuth 액세스 토큰 반환 (만료 시에만 갱신)
+
+        Returns:
+            str: 액세스 토큰
+        """
+        if not self.read_credentials.valid:
+            await run_in_threadpool(self.read_credentials.refresh, AuthRequest())
+        return self.read_credentials.token
+
+    async def download_document(self, document_path: str) -> bytes:
+        """
+        GCS에서 문서 내용 다운로드 (JSON API를 비동기 스트리밍으로 호출)
+
+        Args:
+            document_path: GCS URL
+
+        Returns:
+            bytes: 파일 내용
+        """
+        # URL에서 blob 이름 추출
+        blob_name = self.blob_name(document_path)
+        url = (
+            "https://storage.googleapis.com/storage/v1/"
+            f"b/{self.bucket_name}/o/{quote(blob_name, safe='')}"
+        )
+
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=60.0)
+
+        token = await self._get_access_token()
+        content = bytearray()
+        async with self._http_client.stream(
+            "GET",
+            url,
+            params={"alt": "media"},
+            headers={"Authorization": f"Bearer {token}"}
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                content.extend(chunk)
+
+        return bytes(content)
+
+    async def close(self) -> None:
+        """다운로드용 HTTP 클라이언트 종료"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def delete_document(self, document_path: str) -> bool:
         """
         GCS에서 문서 삭제
@@ -95,14 +294,14 @@ class GCSUploader:
         """
         try:
             # URL에서 blob 이름 추출
-            # https://storage.googleapis.com/bucket-name/user-documents/uuid.pdf
-            # -> user-documents/uuid.pdf
-            blob_name = document_path.split(f"{self.bucket_name}/")[-1]
+            blob_name = self.blob_name(document_path)
             blob = self.bucket.blob(blob_name)
 
-            if blob.exists():
-                blob.delete()
-                return True
+            # 존재 확인 없이 바로 삭제 (없으면 NotFound) → API 호출 1회
+            await run_in_threadpool(blob.delete)
+            return True
+
+        except NotFound:
             return False
 
         except Exception as e:
@@ -0,0 +1,49 @@
+"""
+Pagination Utility
+
+키셋(커서) 페이지네이션용 커서 인코딩/디코딩 유틸리티
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """
+    정렬 기준값과 ID로 커서 생성
+
+    Args:
+        sort_value: 정렬 기준 시각 (updatedAt, createdAt 등)
+        row_id: 행 ID (동일 시각일 때 순서 보장)
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    커서를 정렬 기준값과 ID로 복원
+
+    Args:
+        cursor: encode_cursor로 생성한 커서
+
+    Returns:
+        tuple[datetime, str]: (정렬 기준 시각, 행 ID)
+
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우 (400)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
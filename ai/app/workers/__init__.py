@@ -0,0 +1,5 @@
+"""
+Workers Package
+
+백그라운드 작업 큐(arq) 관련 모듈을 포함합니다.
+"""
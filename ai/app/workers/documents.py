@@ -0,0 +1,76 @@
+"""
+Document Worker Module
+
+문서 처리(텍스트 추출, 청킹, 임베딩, ChromaDB 저장)를 API 프로세스 밖에서 실행하는 arq 워커
+
+실행:
+    arq app.workers.documents.WorkerSettings
+"""
+
+import asyncio
+
+from arq import Retry
+from arq.connections import RedisSettings
+
+from app.config import settings
+from app.services.document_service import DocumentService, shutdown_pdf_executor
+from app.utils.gcs_upload import gcs_uploader
+from app.logger import setup_logging, shutdown_logging
+
+
+async def process_document(ctx: dict, document_id: str) -> None:
+    """
+    문서 처리 작업
+
+    실패하면 job_try에 비례해 지연(선형 백오프) 후 재시도하고,
+    마지막 시도에서도 실패하거나 시간 초과(job_timeout)/워커 종료로 취소되면 문서를 FAILED로 표시합니다.
+
+    Args:
+        ctx: arq 작업 컨텍스트
+        document_id: 처리할 문서 ID
+
+    Raises:
+        Retry: 재시도가 남아 있는 상태에서 처리에 실패한 경우
+    """
+    job_try = ctx.get("job_try", 1)
+    try:
+        await DocumentService._process_document_background(
+            document_id=document_id,
+            final_attempt=job_try >= settings.DOCUMENT_JOB_MAX_TRIES
+        )
+    except Exception as e:
+        raise Retry(defer=job_try * settings.DOCUMENT_JOB_RETRY_DELAY) from e
+
+
+async def startup(ctx: dict) -> None:
+    """
+    워커 시작 시 로깅 설정
+
+    Args:
+        ctx: arq 워커 컨텍스트
+    """
+    setup_logging()
+
+
+async def shutdown(ctx: dict) -> None:
+    """
+    워커 종료 시 공유 클라이언트, PDF 추출 프로세스 풀 및 로깅 정리
+
+    Args:
+        ctx: arq 워커 컨텍스트
+    """
+    await gcs_uploader.close()
+    await asyncio.to_thread(shutdown_pdf_executor)
+    shutdown_logging()
+
+
+class WorkerSettings:
+    """
+    arq 워커 설정
+    """
+    functions = [process_document]
+    on_startup = startup
+    on_shutdown = shutdown
+    max_tries = settings.DOCUMENT_JOB_MAX_TRIES
+    job_timeout = settings.DOCUMENT_JOB_TIMEOUT
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL or "redis://localhost:6379")
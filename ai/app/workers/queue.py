@@ -0,0 +1,46 @@
+"""
+Task Queue Module
+
+API 프로세스에서 arq(Redis) 작업 큐로 작업을 등록합니다.
+"""
+
+from typing import Optional
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+
+from app.config import settings
+
+# arq Redis 커넥션 풀 (최초 사용 시 생성)
+_arq_pool: Optional[ArqRedis] = None
+
+
+async def get_arq_pool() -> ArqRedis:
+    """
+    arq Redis 커넥션 풀 가져오기 (싱글톤)
+
+    Returns:
+        ArqRedis: arq Redis 커넥션 풀
+    """
+    global _arq_pool
+    if _arq_pool is None:
+        _arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _arq_pool
+
+
+async def close_arq_pool() -> None:
+    """arq Redis 커넥션 풀 정리"""
+    global _arq_pool
+    if _arq_pool is not None:
+        await _arq_pool.aclose()
+        _arq_pool = None
+
+
+async def enqueue_document_processing(document_id: str) -> None:
+    """
+    문서 처리 작업을 큐에 등록
+
+    Args:
+        document_id: 처리할 문서 ID
+    """
+    pool = await get_arq_pool()
+    await pool.enqueue_job("process_document", document_id)
@@ -0,0 +1,145 @@
+-- 001: ULID 키 VARCHAR(26) → uuid, 타임스탬프 timestamp → timestamptz
+--
+-- 기존(baseline) 스키마로 생성된 DB에 한 번 실행합니다.
+-- DB_AUTO_CREATE의 create_all은 이미 있는 테이블을 변경하지 않으므로 이 마이그레이션이 필요합니다.
+--
+-- 실행:
+--   psql "$DATABASE_URL" -v schema=public -f migrations/001_ulid_uuid_timestamptz.sql
+--   (schema는 DB_SCHEMA 값, DATABASE_URL은 postgresql:// 형식)
+--
+-- 주의:
+--   - 하나의 트랜잭션으로 실행되며 실패 시 전체 롤백됩니다.
+--   - 모든 테이블을 다시 쓰므로 (ACCESS EXCLUSIVE 락) 서버를 내린 상태에서 실행하세요.
+--   - 기존 timestamp 값은 UTC(datetime.utcnow)로 저장된 것으로 간주합니다.
+
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+SET LOCAL search_path TO :"schema";
+
+-- ULID 문자열(Crockford Base32, 26자) → 16바이트 uuid (ULIDType.process_bind_param과 동일한 바이트 순서)
+CREATE FUNCTION pg_temp.ulid_to_uuid(ulid text) RETURNS uuid AS $$
+DECLARE
+    alphabet constant text := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    n numeric := 0;
+    digit int;
+    hex text := '';
+BEGIN
+    IF length(ulid) <> 26 THEN
+        RAISE EXCEPTION 'invalid ULID: %', ulid;
+    END IF;
+    FOR i IN 1..26 LOOP
+        digit := strpos(alphabet, upper(substr(ulid, i, 1))) - 1;
+        IF digit < 0 THEN
+            RAISE EXCEPTION 'invalid ULID: %', ulid;
+        END IF;
+        n := n * 32 + digit;
+    END LOOP;
+    FOR i IN 1..32 LOOP
+        hex := substr('0123456789abcdef', mod(n, 16)::int + 1, 1) || hex;
+        n := div(n, 16);
+    END LOOP;
+    RETURN hex::uuid;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT;
+
+-- 컬럼 타입 변경 전 외래 키 제거 (varchar → uuid는 참조 양쪽 타입이 같아야 함)
+DO $$
+DECLARE
+    r record;
+BEGIN
+    FOR r IN
+        SELECT conrelid::regclass AS tbl, conname
+        FROM pg_constraint
+        WHERE contype = 'f'
+          AND conrelid IN (
+              'chats'::regclass,
+              'messages'::regclass,
+              'chat_documents'::regclass,
+              'message_documents'::regclass
+          )
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', r.tbl, r.conname);
+    END LOOP;
+END;
+$$;
+
+ALTER TABLE categories
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+ALTER TABLE documents
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+ALTER TABLE chats
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "categoryId" TYPE uuid USING pg_temp.ulid_to_uuid("categoryId"),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+ALTER TABLE messages
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "chatId" TYPE uuid USING pg_temp.ulid_to_uuid("chatId"),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+ALTER TABLE chat_documents
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "chatId" TYPE uuid USING pg_temp.ulid_to_uuid("chatId"),
+    ALTER COLUMN "documentId" TYPE uuid USING pg_temp.ulid_to_uuid("documentId"),
+    ALTER COLUMN "addedAt" TYPE timestamptz USING "addedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "addedAt" SET DEFAULT now(),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+ALTER TABLE message_documents
+    ALTER COLUMN id TYPE uuid USING pg_temp.ulid_to_uuid(id),
+    ALTER COLUMN "messageId" TYPE uuid USING pg_temp.ulid_to_uuid("messageId"),
+    ALTER COLUMN "documentId" TYPE uuid USING pg_temp.ulid_to_uuid("documentId"),
+    ALTER COLUMN "createdAt" TYPE timestamptz USING "createdAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "createdAt" SET DEFAULT now(),
+    ALTER COLUMN "updatedAt" TYPE timestamptz USING "updatedAt" AT TIME ZONE 'UTC',
+    ALTER COLUMN "updatedAt" SET DEFAULT now(),
+    ALTER COLUMN "deletedAt" TYPE timestamptz USING "deletedAt" AT TIME ZONE 'UTC';
+
+-- 외래 키 재생성 (모델 정의와 동일한 ON DELETE 동작)
+ALTER TABLE chats
+    ADD CONSTRAINT "chats_categoryId_fkey"
+    FOREIGN KEY ("categoryId") REFERENCES categories (id) ON DELETE SET NULL;
+
+ALTER TABLE messages
+    ADD CONSTRAINT "messages_chatId_fkey"
+    FOREIGN KEY ("chatId") REFERENCES chats (id) ON DELETE CASCADE;
+
+ALTER TABLE chat_documents
+    ADD CONSTRAINT "chat_documents_chatId_fkey"
+    FOREIGN KEY ("chatId") REFERENCES chats (id) ON DELETE CASCADE,
+    ADD CONSTRAINT "chat_documents_documentId_fkey"
+    FOREIGN KEY ("documentId") REFERENCES documents (id) ON DELETE CASCADE;
+
+ALTER TABLE message_documents
+    ADD CONSTRAINT "message_documents_messageId_fkey"
+    FOREIGN KEY ("messageId") REFERENCES messages (id) ON DELETE CASCADE,
+    ADD CONSTRAINT "message_documents_documentId_fkey"
+    FOREIGN KEY ("documentId") REFERENCES documents (id) ON DELETE CASCADE;
+
+COMMIT;
@@ -0,0 +1,100 @@
+-- 002: 조회/중복 방지 인덱스 (모델의 __table_args__ 인덱스와 동일)
+--
+-- DB_AUTO_CREATE의 create_all은 이미 있는 테이블에 인덱스를 추가하지 않으므로,
+-- 기존 DB에는 001 다음에 이 마이그레이션을 실행합니다.
+--
+-- 실행:
+--   psql "$DATABASE_URL" -v schema=public -f migrations/002_indexes.sql
+--
+-- 주의:
+--   - CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 하므로 -1/--single-transaction 옵션 없이 실행하세요.
+--     (서버를 내리지 않고 실행 가능)
+--   - CONCURRENTLY 생성이 중간에 실패하면 INVALID 인덱스가 남습니다.
+--     해당 인덱스를 DROP INDEX CONCURRENTLY로 지운 뒤 다시 실행하세요 (IF NOT EXISTS가 INVALID 인덱스를 건너뜀).
+--   - 유니크 인덱스를 만들기 전에 기존 중복 데이터를 정리합니다.
+
+\set ON_ERROR_STOP on
+
+SET search_path TO :"schema";
+
+-- 1. 중복 정리 ------------------------------------------------------------
+
+BEGIN;
+
+-- 사용자별로 이름이 같은 (삭제되지 않은) 카테고리: 가장 먼저 만든 카테고리만 남기고
+-- 나머지 카테고리의 채팅을 남는 카테고리로 옮긴 뒤 soft delete
+CREATE TEMP TABLE duplicate_categories ON COMMIT DROP AS
+SELECT id, keep_id
+FROM (
+    SELECT
+        id,
+        first_value(id) OVER w AS keep_id,
+        row_number() OVER w AS rn
+    FROM categories
+    WHERE "deletedAt" IS NULL
+    WINDOW w AS (PARTITION BY "userId", name ORDER BY "createdAt", id)
+) ranked
+WHERE rn > 1;
+
+UPDATE chats
+SET "categoryId" = d.keep_id, "updatedAt" = now()
+FROM duplicate_categories d
+WHERE chats."categoryId" = d.id;
+
+UPDATE categories
+SET "deletedAt" = now(), "updatedAt" = now()
+FROM duplicate_categories d
+WHERE categories.id = d.id;
+
+-- 같은 채팅-문서 연결이 여러 번 있는 경우 (삭제되지 않은 행 우선) 하나만 남김
+DELETE FROM chat_documents
+WHERE id IN (
+    SELECT id
+    FROM (
+        SELECT
+            id,
+            row_number() OVER (
+                PARTITION BY "chatId", "documentId"
+                ORDER BY ("deletedAt" IS NOT NULL), "addedAt", id
+            ) AS rn
+        FROM chat_documents
+    ) ranked
+    WHERE rn > 1
+);
+
+COMMIT;
+
+-- 2. 인덱스 생성 (쓰기를 막지 않도록 CONCURRENTLY) --------------------------
+
+-- 카테고리 목록 (userId + 생성순 키셋)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_categories_user_created_live
+    ON categories ("userId", "createdAt", id)
+    WHERE "deletedAt" IS NULL;
+
+-- 사용자별 카테고리 이름 중복 방지 (create_category의 ON CONFLICT 대상)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_categories_user_name_live
+    ON categories ("userId", name)
+    WHERE "deletedAt" IS NULL;
+
+-- 채팅 목록 (userId + 최근 수정순 키셋)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_user_updated_live
+    ON chats ("userId", "updatedAt", id)
+    WHERE "deletedAt" IS NULL;
+
+-- 카테고리별 채팅 조회 / 개수 집계
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_category_live
+    ON chats ("categoryId")
+    WHERE "deletedAt" IS NULL;
+
+-- 채팅당 같은 문서는 한 번만 연결
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_chat_documents_chat_document
+    ON chat_documents ("chatId", "documentId");
+
+-- 메시지 목록 / 대화 히스토리
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_chat_created_live
+    ON messages ("chatId", "createdAt")
+    WHERE "deletedAt" IS NULL;
+
+-- 메시지별 첨부 문서 조회
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_documents_message
+    ON message_documents ("messageId");
@@ -0,0 +1,13 @@
+-- 003: documents."fileSize" NULL 허용
+--
+-- 서명 URL 업로드(POST /documents/upload-url)로 만든 문서는 업로드 완료(POST /documents/{id}/complete)
+-- 전까지 fileSize가 NULL입니다. 완료 처리는 fileSize가 NULL인 문서에만 한 번 적용됩니다.
+--
+-- 실행:
+--   psql "$DATABASE_URL" -v schema=public -f migrations/003_document_pending_upload.sql
+
+\set ON_ERROR_STOP on
+
+SET search_path TO :"schema";
+
+ALTER TABLE documents ALTER COLUMN "fileSize" DROP NOT NULL;